@@ -0,0 +1,147 @@
+"""
+Caché binaria de assets para Jumpy Game.
+
+Los assets ya decodificados (píxeles, audio) se guardan en
+assets/.cache como archivos con una cabecera JSON seguida de los datos
+en crudo. Cada archivo lleva la clave de las fuentes con las que se
+generó (hash de los archivos originales y de los parámetros); si la
+clave no coincide la caché se ignora y se vuelve a generar.
+
+Los datos se leen con mmap, así los bytes se pasan directamente a
+pygame sin copiarlos a memoria de Python.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from game_config import ASSET_CACHE_DIR
+
+# Cabecera de los archivos de caché: magia, versión y largo del JSON
+CACHE_MAGIC = b'JCCH'
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct('<4sBI')
+
+
+def file_digest(path):
+    """
+    Calcula el SHA-1 de un archivo.
+
+    Returns:
+        str: Hash en hexadecimal, o None si el archivo no existe
+    """
+    digest = hashlib.sha1()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+    except IOError:
+        return None
+    return digest.hexdigest()
+
+
+def cache_key(*parts):
+    """
+    Combina hashes y parámetros en una sola clave de caché.
+
+    Args:
+        *parts: Valores serializables a JSON
+
+    Returns:
+        str: Clave en hexadecimal
+    """
+    return hashlib.sha1(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def cache_path(filename):
+    """Ruta de un archivo dentro del directorio de caché."""
+    return os.path.join(ASSET_CACHE_DIR, filename)
+
+
+def write_blob(path, header, chunks):
+    """
+    Escribe un archivo de caché de forma atómica.
+
+    Args:
+        path (str): Ruta destino
+        header (dict): Metadatos serializables a JSON (incluida la clave)
+        chunks (list): Bloques de bytes que forman los datos
+
+    Returns:
+        bool: True si se escribió el archivo
+    """
+    encoded = json.dumps(header, sort_keys=True).encode('utf-8')
+    temp_path = path + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            f.write(CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, len(encoded)))
+            f.write(encoded)
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(temp_path, path)
+        return True
+    except (IOError, OSError) as e:
+        print(f"Error guardando caché {path}: {e}")
+        return False
+
+
+class CacheBlob:
+    """Archivo de caché abierto con mmap."""
+
+    def __init__(self, path):
+        """
+        Abre un archivo de caché.
+
+        Args:
+            path (str): Ruta del archivo
+
+        Raises:
+            IOError: Si el archivo no existe o no puede leerse
+            ValueError: Si el archivo no es una caché válida
+        """
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, header_size = CACHE_HEADER.unpack_from(self._map)
+            if magic != CACHE_MAGIC or version != CACHE_VERSION:
+                raise ValueError(f"formato de caché desconocido en {path}")
+            start = CACHE_HEADER.size
+            self.header = json.loads(self._map[start:start + header_size].decode('utf-8'))
+        except (struct.error, UnicodeDecodeError) as e:
+            self._map.close()
+            raise ValueError(f"caché dañada en {path}: {e}")
+        except ValueError:
+            self._map.close()
+            raise
+        self._view = memoryview(self._map)
+        self.data = self._view[start + header_size:]
+
+    def close(self):
+        """Libera el mapeo (los objetos creados sobre data deben liberarse antes)."""
+        try:
+            self.data.release()
+            self._view.release()
+            self._map.close()
+        except BufferError:
+            # Aún hay superficies sobre los bytes; el mapeo se libera con ellas
+            pass
+
+    @classmethod
+    def open(cls, path, key):
+        """
+        Abre un archivo de caché solo si fue generado con la clave dada.
+
+        Returns:
+            CacheBlob: Caché abierta, o None si no existe, está dañada o
+                es de otras fuentes
+        """
+        try:
+            blob = cls(path)
+        except (IOError, OSError, ValueError):
+            return None
+        if blob.header.get('key') != key:
+            blob.close()
+            return None
+        return blob
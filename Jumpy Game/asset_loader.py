@@ -1,95 +1,581 @@
-"""
-Cargador de assets para Jumpy Game.
-Maneja la carga de imágenes, sonidos y música.
-"""
-
-import pygame
-import os
-from game_config import *
-
-
-class AssetLoader:
-    """Maneja la carga de todos los assets del juego."""
-
-    def __init__(self):
-        self.images = {}
-        self.sounds = {}
-        self.music_loaded = False
-
-    def load_image(self, name, filename, scale=None):
-        """Carga una imagen con manejo de errores."""
-        try:
-            image_path = os.path.join(ASSETS_DIR, filename)
-            image = pygame.image.load(image_path).convert_alpha()
-
-            if scale:
-                image = pygame.transform.scale(image, scale)
-
-            self.images[name] = image
-            return image
-
-        except pygame.error as e:
-            print(f"Error cargando imagen {filename}: {e}")
-            # Crear imagen por defecto
-            default_size = scale if scale else (32, 32)
-            default_image = pygame.Surface(default_size)
-            default_image.fill(YELLOW)
-            self.images[name] = default_image
-            return default_image
-
-    def load_sound(self, name, filename, volume=1.0):
-        """Carga un sonido con manejo de errores."""
-        try:
-            sound_path = os.path.join(ASSETS_DIR, filename)
-            sound = pygame.mixer.Sound(sound_path)
-            sound.set_volume(volume)
-            self.sounds[name] = sound
-            return sound
-
-        except pygame.error as e:
-            print(f"Error cargando sonido {filename}: {e}")
-            # Crear sonido silencioso por defecto
-            default_sound = pygame.mixer.Sound(pygame.sndarray.make_sound(b'\x00' * 100))
-            self.sounds[name] = default_sound
-            return default_sound
-
-    def load_music(self, filename, volume=0.9):
-        """Carga música de fondo."""
-        try:
-            music_path = os.path.join(ASSETS_DIR, filename)
-            pygame.mixer.music.load(music_path)
-            pygame.mixer.music.set_volume(volume)
-            pygame.mixer.music.play(-1, 0.0)
-            self.music_loaded = True
-        except pygame.error as e:
-            print(f"Error cargando música {filename}: {e}")
-            self.music_loaded = False
-
-    def load_all_assets(self):
-        """Carga todos los assets del juego."""
-        # Cargar imágenes
-        self.load_image('background', 'background1.jpg')
-        self.load_image('platform', 'wood.png')
-        self.load_image('player_left', 'bee_rest_l.png', PLAYER_IMAGE_SIZE)
-        self.load_image('player_right', 'bee_rest_r.png', PLAYER_IMAGE_SIZE)
-        self.load_image('booster', 'booster.webp')
-        self.load_image('extra_life', 'extra_life.png')
-        self.load_image('bird_enemy', 'bird.png')
-        self.load_image('icon', 'ghost.png')
-
-        # Cargar sonidos
-        self.load_sound('jump', 'jump.mp3', 1.0)
-        self.load_sound('death', 'death.mp3', 1.0)
-        self.load_sound('boost', 'boost.mp3', 0.8)
-        self.load_sound('extra_life', 'powerup.wav', 0.8)
-
-        # Cargar música
-        self.load_music('music_game-2d.mp3', 0.9)
-
-    def get_image(self, name):
-        """Obtiene una imagen por nombre."""
-        return self.images.get(name)
-
-    def get_sound(self, name):
-        """Obtiene un sonido por nombre."""
-        return self.sounds.get(name)
+"""
+Cargador de assets para Jumpy Game.
+Maneja la carga de imágenes, sonidos y música.
+
+Es el único registro de assets del juego: los nombres y parámetros de
+carga salen del manifiesto de game_config (IMAGE_ASSETS, SOUND_ASSETS) y
+los nombres antiguos se traducen con ASSET_ALIASES. Cada asset se
+identifica por su tipo y nombre (una imagen y un sonido pueden llamarse
+igual) y lleva la cuenta de sus bytes en memoria y de quién lo retiene
+(acquire/release); los que nadie retiene pueden liberarse con
+evict_unreferenced() y se vuelven a cargar si se piden otra vez.
+
+Las imágenes del atlas son subsurfaces de una página compartida: sus
+bytes se cuentan una vez por página y la página solo se libera (con todas
+sus imágenes) cuando ninguna de ellas tiene referencias.
+
+La carga puede hacerse en segundo plano: start_loading() reparte cada
+asset en un pool de hilos con un future propio y vuelve de inmediato.
+get_image() y get_sound() esperan solo al asset pedido, así el juego
+puede mostrar la pantalla de inicio mientras se decodifican los sonidos.
+"""
+
+import pygame
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from game_config import *
+from spritesheet import SpriteSheet
+from enemy import EnemyFrameBank
+from atlas import images_key, bake_images, load_baked_images
+from audio_cache import sound_key, load_cached_sound, store_sound, silent_sound
+
+
+def surface_bytes(surface):
+    """
+    Bytes de píxeles de una superficie.
+
+    En un subsurface es solo el área que ocupa: sus píxeles son los de su
+    página, que AssetLoader cuenta una sola vez (ver AssetLoader.pages).
+    """
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+def sound_bytes(sound):
+    """Bytes de muestras de un sonido en el formato del mixer (0 sin mixer)."""
+    mixer_settings = pygame.mixer.get_init()
+    if mixer_settings is None:
+        return 0
+    frequency, sample_format, channels = mixer_settings
+    return round(sound.get_length() * frequency) * (abs(sample_format) // 8) * channels
+
+
+def build_manifest():
+    """
+    Crea el manifiesto de assets a partir de game_config.
+
+    Returns:
+        dict: (tipo, nombre) -> argumentos de carga
+    """
+    manifest = {}
+    for name, filename, scale, alpha in IMAGE_ASSETS:
+        manifest[('image', name)] = (name, filename, scale, alpha)
+    for name, filename, volume in SOUND_ASSETS:
+        manifest[('sound', name)] = (name, filename, volume)
+    return manifest
+
+
+class AssetLoader:
+    """Maneja la carga de todos los assets del juego."""
+
+    def __init__(self, scaled_cache_size=SCALED_CACHE_SIZE, assets_dir=ASSETS_DIR):
+        self.assets_dir = assets_dir
+        self.images = {}
+        self.sounds = {}
+        self.music_loaded = False
+        self.load_errors = 0
+
+        # Las cachés en disco solo corresponden al directorio de assets del juego
+        self.use_cache = ASSET_CACHE_ENABLED and assets_dir == ASSETS_DIR
+        self.manifest = build_manifest()
+
+        # Contabilidad por (tipo, nombre): bytes, referencias y último uso.
+        # Las imágenes del atlas no están en sizes: cuentan en su página
+        self.sizes = {}
+        self.pages = {}      # Página del atlas -> (tipo, nombre) de sus imágenes
+        self.page_of = {}    # (tipo, nombre) -> página del atlas
+        self.refcounts = {}
+        self.last_used = {}
+        self.use_counter = 0
+        self.evictions = 0
+
+        # Caché LRU de imágenes escaladas: (nombre, tamaño) -> superficie
+        self.scaled_cache = OrderedDict()
+        self.scaled_cache_size = scaled_cache_size
+        self.scaled_hits = 0
+        self.scaled_misses = 0
+        self.scaled_bytes = 0
+
+        # Frames de animación de enemigos, generados al cargar los assets
+        self._enemy_frames = None
+
+        # Carga en segundo plano: (tipo, nombre) del asset o nombre de la
+        # tarea ('enemy_frames', 'music', 'atlas') -> future pendiente.
+        # Los hilos del pool escriben los diccionarios y contadores de
+        # arriba, así que todo acceso a ellos se hace con el lock tomado
+        self.executor = None
+        self.pending = {}
+        self.total_tasks = 0
+        self.lock = threading.RLock()
+
+    def load_image(self, name, filename, scale=None, alpha=True):
+        """
+        Carga una imagen con manejo de errores.
+
+        Args:
+            alpha (bool): True para convert_alpha(), False para convert().
+                None decide según si la imagen trae canal alfa
+        """
+        try:
+            image_path = os.path.join(self.assets_dir, filename)
+            image = pygame.image.load(image_path)
+            if alpha is None:
+                alpha = bool(image.get_flags() & pygame.SRCALPHA)
+            image = image.convert_alpha() if alpha else image.convert()
+
+            if scale:
+                image = pygame.transform.scale(image, scale)
+
+            self.store_image(name, image)
+            return image
+
+        except pygame.error as e:
+            print(f"Error cargando imagen {filename}: {e}")
+            with self.lock:
+                self.load_errors += 1
+            # Crear imagen por defecto
+            default_size = scale if scale else (32, 32)
+            default_image = pygame.Surface(default_size)
+            default_image.fill(YELLOW)
+            self.store_image(name, default_image)
+            return default_image
+
+    def load_sound(self, name, filename, volume=1.0, use_cache=None):
+        """
+        Carga un sonido con manejo de errores.
+
+        Con la caché activa se usa el PCM ya decodificado si corresponde al
+        archivo y al mixer actuales; si no, se decodifica y se guarda.
+
+        Args:
+            use_cache (bool, optional): Usar la caché de audio. Por defecto
+                según ASSET_CACHE_ENABLED y el directorio de assets
+        """
+        if use_cache is None:
+            use_cache = self.use_cache
+        sound_path = os.path.join(self.assets_dir, filename)
+        key = sound_key(sound_path) if use_cache else None
+        try:
+            sound = load_cached_sound(name, key)
+            if sound is None:
+                sound = pygame.mixer.Sound(sound_path)
+                store_sound(name, key, sound)
+
+        except (pygame.error, IOError) as e:
+            print(f"Error cargando sonido {filename}: {e}")
+            with self.lock:
+                self.load_errors += 1
+            # Crear sonido silencioso por defecto (None si no hay mixer)
+            sound = silent_sound()
+            if sound is None:
+                return None
+
+        sound.set_volume(volume)
+        self.store_sound(name, sound)
+        return sound
+
+    def load_music(self, filename, volume=0.9):
+        """Carga música de fondo."""
+        try:
+            music_path = os.path.join(self.assets_dir, filename)
+            pygame.mixer.music.load(music_path)
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(-1, 0.0)
+            self.music_loaded = True
+        except pygame.error as e:
+            print(f"Error cargando música {filename}: {e}")
+            self.music_loaded = False
+
+    def store_image(self, name, image):
+        """Registra una imagen cargada y sus bytes (o los de su página del atlas)."""
+        key = ('image', name)
+        page = image.get_parent()
+        with self.lock:
+            self._forget_page(key)
+            self.images[name] = image
+            if page is None:
+                self.sizes[key] = surface_bytes(image)
+            else:
+                self.sizes.pop(key, None)
+                self.page_of[key] = page
+                self.pages.setdefault(page, set()).add(key)
+
+    def _forget_page(self, key):
+        """Quita una imagen de su página; la página sin imágenes deja de contarse."""
+        page = self.page_of.pop(key, None)
+        if page is not None:
+            members = self.pages[page]
+            members.discard(key)
+            if not members:
+                del self.pages[page]
+
+    def store_sound(self, name, sound):
+        """Registra un sonido cargado y sus bytes."""
+        size = sound_bytes(sound)
+        with self.lock:
+            self.sounds[name] = sound
+            self.sizes[('sound', name)] = size
+
+    def load_images(self):
+        """
+        Decodifica en este hilo todas las imágenes de IMAGE_ASSETS, sin usar la caché.
+
+        Returns:
+            bool: True si todas las imágenes se cargaron sin errores
+        """
+        errors = self.load_errors
+        for name, filename, scale, alpha in IMAGE_ASSETS:
+            self.load_image(name, filename, scale, alpha)
+        return self.load_errors == errors
+
+    def load_all_assets(self, play_music=True):
+        """
+        Carga todos los assets del juego y espera a que terminen.
+
+        Args:
+            play_music (bool): Si es False no se carga la música de fondo
+        """
+        self.start_loading(play_music)
+        self.wait_all()
+
+    def start_loading(self, play_music=True, workers=ASSET_LOADER_WORKERS):
+        """
+        Comienza a cargar todos los assets en segundo plano.
+
+        Si el atlas horneado está al día las imágenes se cargan aquí mismo
+        (es solo copiar memoria); si no, cada imagen es una tarea y al
+        terminar todas se hornea la caché.
+
+        Args:
+            play_music (bool): Si es False no se carga la música de fondo
+            workers (int): Hilos del pool de carga
+        """
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='assets')
+
+        key = images_key() if self.use_cache else None
+        baked = load_baked_images(key) if self.use_cache else None
+        if baked is not None:
+            for name, image in baked.items():
+                self.store_image(name, image)
+        else:
+            errors = self.load_errors
+            image_futures = [self._submit(('image', name), self.load_image, name, filename, scale, alpha)
+                             for name, filename, scale, alpha in IMAGE_ASSETS]
+            if self.use_cache:
+                self._submit('atlas', self._bake_when_loaded, image_futures, errors, key)
+
+        # Las tareas que esperan a otras se envían después de ellas, así
+        # nunca ocupan un hilo que necesiten las tareas de las que dependen
+        self._submit('enemy_frames', self.build_enemy_frames)
+
+        for name, filename, volume in SOUND_ASSETS:
+            self._submit(('sound', name), self.load_sound, name, filename, volume)
+
+        if play_music:
+            self._submit('music', self.load_music, MUSIC_FILE, MUSIC_VOLUME)
+
+    def _submit(self, key, func, *args):
+        """Envía una tarea de carga al pool y registra su future."""
+        future = self.executor.submit(func, *args)
+        with self.lock:
+            self.pending[key] = future
+            self.total_tasks += 1
+        return future
+
+    def _bake_when_loaded(self, image_futures, errors, key):
+        """Hornea el atlas cuando todas las imágenes terminaron sin errores."""
+        for future in image_futures:
+            future.result()
+        # Los errores y las imágenes se leen juntos: un fallo contado por
+        # otro hilo no puede colarse entre la comparación y la copia
+        with self.lock:
+            complete = self.load_errors == errors
+            images = dict(self.images)
+        if complete:
+            bake_images(images, IMAGE_ASSETS, key)
+
+    def wait(self, key):
+        """
+        Espera a que termine de cargarse un asset, si está pendiente.
+
+        Args:
+            key: (tipo, nombre) del asset, o 'enemy_frames', 'music', 'atlas'
+        """
+        future = self.pending.get(key)
+        if future is None:
+            return
+        try:
+            future.result()
+        except Exception as e:
+            print(f"Error cargando asset {key}: {e}")
+        with self.lock:
+            self.pending.pop(key, None)
+
+    def wait_all(self):
+        """Espera a que terminen todas las cargas y libera el pool de hilos."""
+        for name in list(self.pending):
+            self.wait(name)
+        if self.executor:
+            self.executor.shutdown()
+            self.executor = None
+
+    def get_progress(self):
+        """
+        Obtiene el avance de la carga en segundo plano.
+
+        Returns:
+            float: Fracción de tareas terminadas entre 0 y 1
+        """
+        with self.lock:
+            if not self.total_tasks:
+                return 1.0
+            remaining = sum(1 for future in self.pending.values() if not future.done())
+            return 1.0 - remaining / self.total_tasks
+
+    def is_loaded(self):
+        """Indica si ya no quedan cargas en curso."""
+        return self.get_progress() >= 1.0
+
+    def build_enemy_frames(self):
+        """Prepara el banco de frames del enemigo en ambas orientaciones."""
+        # El banco conserva la hoja de sprites: la imagen queda retenida
+        bird_image = self.acquire('bird_enemy')
+        if bird_image:
+            frames = EnemyFrameBank(SpriteSheet(bird_image))
+            frames.prebuild(ENEMY_SCALE)
+            self._enemy_frames = frames
+
+    @property
+    def enemy_frames(self):
+        """Banco de frames del enemigo (espera a que esté construido)."""
+        if self.pending:
+            self.wait('enemy_frames')
+        return self._enemy_frames
+
+    def get_image(self, name):
+        """
+        Obtiene una imagen por nombre (espera solo a esa imagen si se está cargando).
+
+        Si la imagen fue liberada se vuelve a cargar desde el manifiesto.
+        """
+        return self._get('image', ASSET_ALIASES.get(name, name))
+
+    def get_sound(self, name):
+        """
+        Obtiene un sonido por nombre (espera solo a ese sonido si se está cargando).
+
+        Si el sonido fue liberado se vuelve a cargar desde el manifiesto.
+        """
+        return self._get('sound', ASSET_ALIASES.get(name, name))
+
+    def _get(self, kind, name):
+        """Obtiene un asset por tipo y nombre, cargándolo si no está en memoria."""
+        key = (kind, name)
+        if self.pending:
+            self.wait(key)
+        with self.lock:
+            asset = (self.images if kind == 'image' else self.sounds).get(name)
+        if asset is None:
+            args = self.manifest.get(key)
+            if args is None:
+                return None
+            asset = self.load_image(*args) if kind == 'image' else self.load_sound(*args)
+        with self.lock:
+            self.use_counter += 1
+            self.last_used[key] = self.use_counter
+        return asset
+
+    def acquire(self, name, kind='image'):
+        """
+        Obtiene un asset y lo retiene: no se libera mientras tenga referencias.
+
+        Args:
+            name (str): Nombre (o alias) del asset
+            kind (str): 'image' o 'sound'
+
+        Returns:
+            pygame.Surface o pygame.mixer.Sound: El asset, o None si no existe
+        """
+        name = ASSET_ALIASES.get(name, name)
+        asset = self._get(kind, name)
+        if asset is not None:
+            key = (kind, name)
+            with self.lock:
+                self.refcounts[key] = self.refcounts.get(key, 0) + 1
+        return asset
+
+    def release(self, name, kind='image'):
+        """Suelta una referencia tomada con acquire()."""
+        key = (kind, ASSET_ALIASES.get(name, name))
+        with self.lock:
+            count = self.refcounts.get(key, 0) - 1
+            if count > 0:
+                self.refcounts[key] = count
+            else:
+                self.refcounts.pop(key, None)
+
+    def evict_unreferenced(self, budget=None):
+        """
+        Libera imágenes y sonidos sin referencias, los menos usados primero.
+
+        Las imágenes escaladas no se liberan aquí: su caché ya tiene un
+        límite propio. Una página del atlas se libera entera, y solo si
+        ninguna de sus imágenes tiene referencias: mientras un subsurface
+        siga en uso la página queda en memoria.
+
+        Args:
+            budget (int, optional): Bytes totales a los que hay que bajar;
+                None libera todos los assets sin referencias
+
+        Returns:
+            int: Bytes liberados
+        """
+        def unused(key):
+            return not self.refcounts.get(key) and key not in self.pending
+
+        with self.lock:
+            # Candidatos: grupos de assets que se liberan juntos y su último uso
+            candidates = [([key], self.sizes[key]) for key in self.sizes if unused(key)]
+            candidates += [(list(members), surface_bytes(page))
+                           for page, members in self.pages.items()
+                           if all(unused(key) for key in members)]
+            candidates.sort(key=lambda candidate: max(self.last_used.get(key, 0)
+                                                      for key in candidate[0]))
+
+            freed = 0
+            for keys, size in candidates:
+                if budget is not None and self.get_total_bytes() <= budget:
+                    break
+                for key in keys:
+                    kind, name = key
+                    del (self.images if kind == 'image' else self.sounds)[name]
+                    self.last_used.pop(key, None)
+                    self.sizes.pop(key, None)
+                    self._forget_page(key)
+                    self.evictions += 1
+                freed += size
+            return freed
+
+    def get_total_bytes(self):
+        """Bytes de todas las imágenes, páginas del atlas, sonidos e imágenes escaladas en memoria."""
+        with self.lock:
+            return sum(self.sizes.values()) + self.get_page_bytes() + self.scaled_bytes
+
+    def get_page_bytes(self):
+        """Bytes de las páginas del atlas en memoria."""
+        with self.lock:
+            return sum(surface_bytes(page) for page in self.pages)
+
+    def get_asset_count(self):
+        """
+        Obtiene el número de assets cargados y la memoria que ocupan.
+
+        Returns:
+            dict: Conteo por tipo de asset, bytes por tipo y liberaciones
+        """
+        with self.lock:
+            image_bytes = sum(size for (kind, _), size in self.sizes.items() if kind == 'image')
+            page_bytes = self.get_page_bytes()
+            return {
+                'images': len(self.images),
+                'sounds': len(self.sounds),
+                'music_loaded': self.music_loaded,
+                'referenced': len(self.refcounts),
+                'image_bytes': image_bytes + page_bytes,
+                'atlas_pages': len(self.pages),
+                'sound_bytes': sum(self.sizes.values()) - image_bytes,
+                'scaled_bytes': self.scaled_bytes,
+                'total_bytes': self.get_total_bytes(),
+                'evictions': self.evictions
+            }
+
+    def get_memory_report(self):
+        """
+        Obtiene la memoria de cada asset cargado.
+
+        Cada página del atlas aparece una vez (tipo 'atlas') con sus bytes y
+        la suma de las referencias de sus imágenes.
+
+        Returns:
+            list: Diccionarios (nombre, tipo, bytes, referencias), de mayor a menor
+        """
+        with self.lock:
+            report = [{'name': name, 'type': kind, 'bytes': size,
+                       'refs': self.refcounts.get((kind, name), 0)}
+                      for (kind, name), size in self.sizes.items()]
+            for index, (page, members) in enumerate(self.pages.items()):
+                names = ', '.join(sorted(name for _, name in members))
+                report.append({'name': f"atlas {index} ({names})", 'type': 'atlas',
+                               'bytes': surface_bytes(page),
+                               'refs': sum(self.refcounts.get(key, 0) for key in members)})
+        report.sort(key=lambda entry: entry['bytes'], reverse=True)
+        return report
+
+    def cleanup(self):
+        """Espera las cargas pendientes y libera todos los assets y la música."""
+        self.wait_all()
+        if self.music_loaded:
+            pygame.mixer.music.stop()
+            self.music_loaded = False
+        self.images.clear()
+        self.sounds.clear()
+        self.sizes.clear()
+        self.pages.clear()
+        self.page_of.clear()
+        self.refcounts.clear()
+        self.last_used.clear()
+        self.scaled_cache.clear()
+        self.scaled_bytes = 0
+        self._enemy_frames = None
+
+    def get_scaled(self, name, size):
+        """
+        Obtiene una imagen escalada, reutilizando la de la caché si existe.
+
+        La superficie devuelta es compartida entre todos los que pidan el
+        mismo tamaño, así que no debe modificarse.
+
+        Args:
+            name (str): Nombre de la imagen original
+            size (tuple): Tamaño deseado (ancho, alto)
+
+        Returns:
+            pygame.Surface: Imagen escalada o None si la imagen no existe
+        """
+        key = (name, size)
+        cache = self.scaled_cache
+        image = cache.get(key)
+        if image is not None:
+            cache.move_to_end(key)
+            self.scaled_hits += 1
+            return image
+
+        source = self.get_image(name)
+        if source is None:
+            return None
+
+        self.scaled_misses += 1
+        image = pygame.transform.scale(source, size)
+        cache[key] = image
+        self.scaled_bytes += surface_bytes(image)
+        if len(cache) > self.scaled_cache_size:
+            _, dropped = cache.popitem(last=False)
+            self.scaled_bytes -= surface_bytes(dropped)
+        return image
+
+    def get_scaled_cache_stats(self):
+        """
+        Obtiene las estadísticas de la caché de imágenes escaladas.
+
+        Returns:
+            dict: Aciertos, fallos, tamaño actual y tasa de aciertos
+        """
+        total = self.scaled_hits + self.scaled_misses
+        return {
+            'hits': self.scaled_hits,
+            'misses': self.scaled_misses,
+            'size': len(self.scaled_cache),
+            'hit_rate': self.scaled_hits / total if total else 0.0
+        }
@@ -1,10 +1,10 @@
-"""
-Paquete de gestión de assets para Jumpy Game.
-
-Este paquete maneja la carga, almacenamiento y acceso a todos
-los recursos del juego como imágenes, sonidos y música.
-"""
-
-from .asset_manager import AssetManager
-
-__all__ = ['AssetManager']
+"""
+Paquete de gestión de assets para Jumpy Game.
+
+Este paquete maneja la carga, almacenamiento y acceso a todos
+los recursos del juego como imágenes, sonidos y música.
+"""
+
+from .asset_manager import AssetManager
+
+__all__ = ['AssetManager']
@@ -0,0 +1,184 @@
+"""
+Atlas de texturas horneado para Jumpy Game.
+
+El horneado toma las imágenes ya cargadas (y escaladas) del juego, empaca
+los sprites con transparencia en una sola página RGBA y guarda las
+imágenes opacas o grandes (los fondos) en páginas propias. Todo se
+escribe en crudo en assets/.cache junto con la clave de los archivos
+originales.
+
+Al arrancar, si la clave coincide, cada página se crea directamente sobre
+los bytes mapeados en memoria, se convierte una vez al formato de la
+pantalla y cada imagen es un subsurface de su página: no se decodifica
+ningún PNG/JPG/WebP.
+
+Uso:
+    python atlas.py           # Hornea la caché si falta o está desactualizada
+    python atlas.py --force   # Vuelve a hornearla siempre
+"""
+
+import os
+import pygame
+from asset_cache import CacheBlob, cache_key, cache_path, file_digest, write_blob
+from game_config import ASSETS_DIR, IMAGE_ASSETS
+
+# Cambiar si cambia la forma de hornear (invalida las cachés existentes)
+ATLAS_FORMAT = 1
+ATLAS_CACHE_FILE = 'images.bin'
+ATLAS_WIDTH = 1024
+ATLAS_PADDING = 1
+
+
+def images_key(manifest=IMAGE_ASSETS):
+    """
+    Clave de caché de un manifiesto de imágenes.
+
+    Cambia si cambia cualquier archivo de origen o sus parámetros de carga.
+
+    Returns:
+        str: Clave en hexadecimal
+    """
+    entries = []
+    for name, filename, scale, alpha in manifest:
+        digest = file_digest(os.path.join(ASSETS_DIR, filename))
+        entries.append([name, filename, list(scale) if scale else None, alpha, digest])
+    return cache_key(ATLAS_FORMAT, pygame.get_sdl_byteorder(), entries)
+
+
+def pack_shelves(sizes, width=ATLAS_WIDTH, padding=ATLAS_PADDING):
+    """
+    Empaca rectángulos en estantes de arriba hacia abajo.
+
+    Args:
+        sizes (dict): Nombre -> (ancho, alto)
+        width (int): Ancho mínimo de la página
+
+    Returns:
+        tuple: (posiciones {nombre: (x, y)}, (ancho, alto) de la página)
+    """
+    width = max([width] + [w for w, _ in sizes.values()])
+    positions = {}
+    x = y = shelf_height = 0
+    for name in sorted(sizes, key=lambda key: sizes[key][1], reverse=True):
+        w, h = sizes[name]
+        if x + w > width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        positions[name] = (x, y)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+    return positions, (width, y + shelf_height)
+
+
+def bake_images(images, manifest, key, path=None):
+    """
+    Hornea las imágenes cargadas en el archivo de caché.
+
+    Args:
+        images (dict): Nombre -> superficie ya cargada y escalada
+        manifest (list): Entradas (nombre, archivo, tamaño, alfa) de IMAGE_ASSETS;
+            las de alfa True se empacan en el atlas
+        key (str): Clave de las fuentes (images_key)
+        path (str, optional): Archivo destino
+
+    Returns:
+        bool: True si se escribió la caché
+    """
+    path = path or cache_path(ATLAS_CACHE_FILE)
+    packed = {name: images[name].get_size() for name, _, _, alpha in manifest if alpha}
+    pages = []
+    entries = {}
+
+    if packed:
+        positions, size = pack_shelves(packed)
+        atlas = pygame.Surface(size, pygame.SRCALPHA, 32)
+        atlas.fill((0, 0, 0, 0))
+        for name, position in positions.items():
+            # MAX sobre transparente copia los píxeles sin mezclar el alfa
+            atlas.blit(images[name], position, special_flags=pygame.BLEND_RGBA_MAX)
+            entries[name] = [0, position[0], position[1]] + list(packed[name])
+        pages.append(('RGBA', atlas))
+
+    for name, _, _, alpha in manifest:
+        if alpha:
+            continue
+        image = images[name]
+        page_format = 'RGBA' if image.get_flags() & pygame.SRCALPHA else 'RGB'
+        entries[name] = [len(pages), 0, 0] + list(image.get_size())
+        pages.append((page_format, image))
+
+    chunks = []
+    page_headers = []
+    offset = 0
+    for page_format, surface in pages:
+        data = pygame.image.tobytes(surface, page_format)
+        page_headers.append({'format': page_format, 'size': list(surface.get_size()), 'offset': offset})
+        chunks.append(data)
+        offset += len(data)
+
+    header = {'key': key, 'pages': page_headers, 'images': entries}
+    return write_blob(path, header, chunks)
+
+
+def load_baked_images(key, path=None):
+    """
+    Carga las imágenes horneadas si la caché corresponde a la clave.
+
+    Requiere que la pantalla ya esté creada (las páginas se convierten a
+    su formato).
+
+    Returns:
+        dict: Nombre -> subsurface de su página, o None si no hay caché válida
+    """
+    blob = CacheBlob.open(path or cache_path(ATLAS_CACHE_FILE), key)
+    if blob is None:
+        return None
+
+    try:
+        pages = []
+        for page in blob.header['pages']:
+            width, height = page['size']
+            length = width * height * len(page['format'])
+            start = page['offset']
+            view = blob.data[start:start + length]
+            mapped = pygame.image.frombuffer(view, (width, height), page['format'])
+            surface = mapped.convert_alpha() if page['format'] == 'RGBA' else mapped.convert()
+            del mapped
+            view.release()
+            pages.append(surface)
+
+        return {name: pages[page].subsurface((x, y, w, h))
+                for name, (page, x, y, w, h) in blob.header['images'].items()}
+    except (KeyError, ValueError, pygame.error) as e:
+        print(f"Caché de imágenes inválida, se ignora: {e}")
+        return None
+    finally:
+        blob.close()
+
+
+def main():
+    """Hornea la caché de imágenes desde la línea de comandos."""
+    import argparse
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    from asset_loader import AssetLoader
+
+    parser = argparse.ArgumentParser(description='Hornea el atlas de imágenes de Jumpy Game')
+    parser.add_argument('--force', action='store_true', help='Hornear aunque la caché esté al día')
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    key = images_key()
+    if not args.force and load_baked_images(key) is not None:
+        print(f"Caché al día: {cache_path(ATLAS_CACHE_FILE)}")
+        return
+    loader = AssetLoader()
+    if loader.load_images() and bake_images(loader.images, IMAGE_ASSETS, key):
+        print(f"Atlas horneado en {cache_path(ATLAS_CACHE_FILE)}")
+    else:
+        print("No se pudo hornear el atlas")
+
+
+if __name__ == "__main__":
+    main()
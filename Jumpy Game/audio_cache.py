@@ -0,0 +1,96 @@
+"""
+Caché de audio decodificado para Jumpy Game.
+
+pygame.mixer.Sound decodifica los MP3/WAV en cada inicio. La primera vez
+que se carga un sonido se guardan sus muestras PCM, ya en el formato del
+mixer, en assets/.cache; en los inicios siguientes el sonido se crea
+directamente desde esos bytes con Sound(buffer=...).
+
+La clave de cada archivo incluye el hash del archivo original y la
+configuración del mixer (frecuencia, formato y canales), así un cambio en
+cualquiera de los dos invalida la caché.
+"""
+
+import sys
+import pygame
+from asset_cache import CacheBlob, cache_key, cache_path, file_digest, write_blob
+
+# Cambiar si cambia la forma de guardar el audio (invalida las cachés existentes)
+AUDIO_FORMAT = 1
+
+# Duración del sonido silencioso usado cuando falta un archivo
+SILENT_SOUND_MS = 50
+
+
+def sound_cache_path(name):
+    """Ruta del archivo de caché de un sonido."""
+    return cache_path(f'sound-{name}.bin')
+
+
+def sound_key(path):
+    """
+    Clave de caché de un sonido para el mixer actual.
+
+    Returns:
+        str: Clave en hexadecimal, o None si el mixer no está iniciado o
+            el archivo no existe
+    """
+    mixer_settings = pygame.mixer.get_init()
+    digest = file_digest(path)
+    if mixer_settings is None or digest is None:
+        return None
+    return cache_key(AUDIO_FORMAT, list(mixer_settings), digest)
+
+
+def load_cached_sound(name, key):
+    """
+    Crea un sonido desde su PCM guardado si la caché corresponde a la clave.
+
+    Returns:
+        pygame.mixer.Sound: Sonido, o None si no hay caché válida
+    """
+    if key is None:
+        return None
+    blob = CacheBlob.open(sound_cache_path(name), key)
+    if blob is None:
+        return None
+    try:
+        # Sound(buffer=...) copia las muestras, el mapeo puede cerrarse
+        return pygame.mixer.Sound(buffer=blob.data)
+    except pygame.error as e:
+        print(f"Caché de sonido {name} inválida, se ignora: {e}")
+        return None
+    finally:
+        blob.close()
+
+
+def store_sound(name, key, sound):
+    """
+    Guarda el PCM de un sonido recién decodificado.
+
+    Returns:
+        bool: True si se escribió la caché
+    """
+    if key is None:
+        return False
+    header = {'key': key, 'mixer': list(pygame.mixer.get_init())}
+    return write_blob(sound_cache_path(name), header, [sound.get_raw()])
+
+
+def silent_sound(duration_ms=SILENT_SOUND_MS):
+    """
+    Crea un sonido silencioso en el formato del mixer.
+
+    Returns:
+        pygame.mixer.Sound: Sonido silencioso, o None si el mixer no está iniciado
+    """
+    mixer_settings = pygame.mixer.get_init()
+    if mixer_settings is None:
+        return None
+    frequency, sample_format, channels = mixer_settings
+    frame_size = abs(sample_format) // 8 * channels
+    frames = frequency * duration_ms // 1000
+    # Cero es silencio salvo en los formatos sin signo (8 y 16 positivos),
+    # cuyo silencio es la mitad del rango
+    silence = {8: b'\x80', 16: (0x8000).to_bytes(2, sys.byteorder)}.get(sample_format, b'\x00')
+    return pygame.mixer.Sound(buffer=silence * (frames * frame_size // len(silence)))
@@ -0,0 +1,131 @@
+"""
+Fondo con scroll vertical para Jumpy Game.
+
+Cada capa se convierte al formato de la pantalla (convert() si es opaca,
+convert_alpha() si tiene transparencia) y se pre-repite verticalmente en
+una tira de alto "periodo + alto de pantalla". Así cualquier posición de
+scroll se dibuja con un solo blit de una región de la tira, sin costuras
+y sin depender de que la imagen mida 600 px.
+
+Las capas de parallax se desplazan a una fracción del scroll de la
+cámara. Para no multiplicar el costo por capa, las capas consecutivas con
+el mismo factor y periodo se fusionan en una sola tira al construirlas, y
+las capas tapadas por una capa opaca superior no se dibujan.
+"""
+
+import pygame
+from game_config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Color usado si no hay ninguna capa opaca
+DEFAULT_BACKGROUND_COLOR = (0, 100, 200)
+
+
+def _is_opaque(image):
+    """Indica si una imagen no tiene ningún píxel transparente."""
+    if not image.get_flags() & pygame.SRCALPHA:
+        return image.get_colorkey() is None
+    width, height = image.get_size()
+    return pygame.mask.from_surface(image, 254).count() == width * height
+
+
+class BackgroundLayer:
+    """Capa de fondo pre-repetida verticalmente."""
+
+    def __init__(self, image, factor=1.0):
+        """
+        Inicializa la capa.
+
+        Args:
+            image (pygame.Surface): Imagen de la capa
+            factor (float): Fracción del scroll de cámara que recorre la capa
+        """
+        self.factor = factor
+        self.period = image.get_height()
+        self.opaque = _is_opaque(image)
+        self.strip = self._build_strip(image)
+
+    def _build_strip(self, image):
+        """Repite la imagen verticalmente en una superficie del formato de pantalla."""
+        size = (SCREEN_WIDTH, self.period + SCREEN_HEIGHT)
+        if self.opaque:
+            strip = pygame.Surface(size).convert()
+        else:
+            strip = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        for y in range(0, size[1], self.period):
+            strip.blit(image, (0, y))
+        return strip
+
+    def can_merge(self, other):
+        """Indica si otra capa se desplaza igual y puede fusionarse con esta."""
+        return self.factor == other.factor and self.period == other.period
+
+    def merge(self, other):
+        """Pinta otra capa sobre esta tira (la otra queda por encima)."""
+        self.strip.blit(other.strip, (0, 0))
+        self.opaque = self.opaque or other.opaque
+
+    def offset(self, camera_y):
+        """Fila de la tira que corresponde al borde superior de la pantalla."""
+        return int(camera_y * self.factor) % self.period
+
+
+class ScrollingBackground:
+    """Fondo compuesto por una o más capas con parallax."""
+
+    def __init__(self, layers):
+        """
+        Inicializa el fondo.
+
+        Args:
+            layers (list): Tuplas (imagen, factor) ordenadas de la más
+                lejana a la más cercana. Las imágenes None se ignoran
+        """
+        self.layers = []
+        for image, factor in layers:
+            if image is None:
+                continue
+            layer = BackgroundLayer(image, factor)
+            if self.layers and self.layers[-1].can_merge(layer):
+                self.layers[-1].merge(layer)
+            else:
+                self.layers.append(layer)
+
+        # Solo se dibuja desde la capa opaca más cercana hacia adelante
+        self.first_visible = 0
+        for index, layer in enumerate(self.layers):
+            if layer.opaque:
+                self.first_visible = index
+        self.needs_fill = not any(layer.opaque for layer in self.layers)
+
+    @classmethod
+    def from_assets(cls, asset_loader, layer_config):
+        """
+        Crea el fondo a partir de imágenes cargadas (quedan retenidas en el cargador).
+
+        Args:
+            asset_loader (AssetLoader): Cargador con las imágenes
+            layer_config (list): Tuplas (nombre de imagen, factor)
+        """
+        return cls([(asset_loader.acquire(name), factor) for name, factor in layer_config])
+
+    def draw(self, screen, camera_y, rect=None):
+        """
+        Dibuja el fondo para la posición de cámara dada.
+
+        Args:
+            screen (pygame.Surface): Superficie destino
+            camera_y (int): Posición vertical de la cámara
+            rect (pygame.Rect, optional): Región de pantalla a dibujar.
+                Por defecto la pantalla completa
+        """
+        if rect is None:
+            x, y, width, height = 0, 0, SCREEN_WIDTH, SCREEN_HEIGHT
+        else:
+            x, y, width, height = rect
+
+        if self.needs_fill:
+            screen.fill(DEFAULT_BACKGROUND_COLOR, (x, y, width, height))
+
+        for layer in self.layers[self.first_visible:]:
+            top = layer.offset(camera_y) + y
+            screen.blit(layer.strip, (x, y), (x, top, width, height))
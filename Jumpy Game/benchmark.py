@@ -0,0 +1,342 @@
+"""
+Microbenchmarks de los caminos críticos de Jumpy Game.
+
+Mide las funciones que se ejecutan en cada tick (movimiento del jugador,
+actualización de plataformas y enemigos, dibujo de texto y del panel, un
+tick completo de juego, instantáneas del mundo) y las de carga (hoja de
+sprites y assets). Corre sin ventana ni audio con los drivers ficticios
+de SDL.
+
+El resultado es un JSON estable (claves ordenadas, mismos nombres de
+benchmark en cada ejecución) que puede guardarse como línea base y
+compararse en ejecuciones posteriores para detectar regresiones antes de
+publicar una versión.
+
+Uso:
+    python benchmark.py
+    python benchmark.py --output baseline.json
+    python benchmark.py --compare baseline.json --threshold 0.15
+    python benchmark.py --only player_move --repeat 10
+"""
+
+import os
+
+# Los drivers ficticios deben fijarse antes de inicializar pygame
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+import pygame
+from game_config import *
+from jumpy_game import JumpyGame
+from asset_loader import AssetLoader
+from spritesheet import SpriteSheet
+from camera import Camera
+from spatial_index import SpatialGroup
+from platform import Platform
+from enemy import Enemy, ENEMY_FRAME_SIZE
+from player import Player
+from input_source import InputState, RandomInput
+from snapshot import WorldSnapshot
+
+# Versión del formato del JSON de resultados
+BENCHMARK_FORMAT = 1
+
+# Tolerancia por defecto antes de considerar una regresión (15% más lento)
+DEFAULT_THRESHOLD = 0.15
+
+# Semilla fija: los escenarios son los mismos en cada ejecución
+BENCHMARK_SEED = 1234
+
+
+class Benchmark:
+    """Un caso de benchmark: una función sin argumentos que se llama muchas veces."""
+
+    def __init__(self, name, func, number):
+        """
+        Inicializa el caso.
+
+        Args:
+            name (str): Nombre estable del caso (clave del JSON)
+            func (callable): Función a medir
+            number (int): Llamadas por repetición
+        """
+        self.name = name
+        self.func = func
+        self.number = number
+
+    def run(self, repeat):
+        """
+        Ejecuta el caso.
+
+        Args:
+            repeat (int): Repeticiones de "number" llamadas
+
+        Returns:
+            dict: Tiempos por llamada en microsegundos
+        """
+        func = self.func
+        loops = range(self.number)
+        func()  # Calentamiento (cachés, pools)
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in loops:
+                func()
+            timings.append((time.perf_counter() - start) / self.number * 1e6)
+
+        return {
+            'number': self.number,
+            'repeat': repeat,
+            'best_us': round(min(timings), 3),
+            'median_us': round(statistics.median(timings), 3),
+            'mean_us': round(statistics.fmean(timings), 3)
+        }
+
+
+class BenchmarkSuite:
+    """Escenarios de benchmark construidos sobre un juego headless."""
+
+    def __init__(self):
+        self.game = JumpyGame(headless=True, input_source=RandomInput(BENCHMARK_SEED),
+                              seed=BENCHMARK_SEED)
+        self.game.game_state.waiting_for_start = False
+        self.asset_loader = self.game.asset_loader
+        self.rng = random.Random(BENCHMARK_SEED)
+
+    def build(self):
+        """
+        Crea todos los casos de benchmark.
+
+        Returns:
+            list: Casos en orden de ejecución
+        """
+        cases = []
+        for count in (10, 100, 1000):
+            cases.append(Benchmark(f'player_move_{count}', self.player_move(count), 2000))
+        cases += [
+            Benchmark('platform_update_100', self.platform_update(100), 2000),
+            Benchmark('enemy_update', self.enemy_update(), 20000),
+            Benchmark('spritesheet_get_image', self.spritesheet_get_image(), 2000),
+            Benchmark('spritesheet_extract_all_frames', self.spritesheet_extract_all_frames(), 200),
+            Benchmark('ui_draw_text', self.ui_draw_text(), 20000),
+            Benchmark('ui_draw_panel', self.ui_draw_panel(), 5000),
+            Benchmark('load_all_assets', self.load_all_assets(), 3),
+            Benchmark('game_tick', self.game_tick(), 1000),
+            Benchmark('snapshot_capture', self.snapshot_capture(), 5000),
+            Benchmark('snapshot_restore', self.snapshot_restore(), 2000),
+        ]
+        return cases
+
+    def _platforms(self, count, center_y, spread):
+        """Crea un SpatialGroup con plataformas repartidas alrededor de una altura."""
+        group = SpatialGroup()
+        for _ in range(count):
+            width = self.rng.randint(40, 60)
+            x = self.rng.randint(0, SCREEN_WIDTH - width)
+            y = self.rng.randint(center_y - spread, center_y + spread)
+            moving = self.rng.random() < 0.5
+            group.add(Platform(x, y, width, moving, self.asset_loader, self.rng))
+        return group
+
+    def player_move(self, count):
+        """Player.move() con count plataformas alrededor del jugador."""
+        player = Player(PLAYER_START_X, PLAYER_START_Y, self.asset_loader, self.game.sound_manager)
+        platforms = self._platforms(count, PLAYER_START_Y, SCREEN_HEIGHT)
+        boosters = SpatialGroup()
+        extra_lives = SpatialGroup()
+        camera = Camera()
+        controls = InputState(False, True, False)
+        start = player.rect.topleft
+
+        def move():
+            player.rect.topleft = start
+            player.vel_y = 5
+            player.in_air = True
+            player.move(platforms, boosters, extra_lives, controls, camera)
+        return move
+
+    def platform_update(self, count):
+        """Actualización de un grupo de plataformas móviles."""
+        group = SpatialGroup()
+        for _ in range(count):
+            x = self.rng.randint(0, SCREEN_WIDTH - 60)
+            group.add(Platform(x, self.rng.randint(0, SCREEN_HEIGHT), 60, True,
+                               self.asset_loader, self.rng))
+        return group.update
+
+    def enemy_update(self):
+        """Enemy.update() de un enemigo en vuelo."""
+        enemy = Enemy(SCREEN_WIDTH, 100, self.asset_loader.enemy_frames, ENEMY_SCALE, self.rng)
+
+        def update():
+            enemy.rect.x = SCREEN_WIDTH // 2
+            enemy.update(SCREEN_WIDTH)
+        return update
+
+    def spritesheet_get_image(self):
+        """Extracción y escalado de un frame de la hoja del enemigo."""
+        sheet = SpriteSheet(self.asset_loader.get_image('bird_enemy'))
+        return lambda: sheet.get_image(3, ENEMY_FRAME_SIZE, ENEMY_FRAME_SIZE, ENEMY_SCALE)
+
+    def spritesheet_extract_all_frames(self):
+        """Extracción de todos los frames de la hoja del enemigo."""
+        sheet = SpriteSheet(self.asset_loader.get_image('bird_enemy'))
+        return lambda: sheet.extract_all_frames(ENEMY_FRAME_SIZE, ENEMY_FRAME_SIZE, ENEMY_SCALE)
+
+    def ui_draw_text(self):
+        """GameUI.draw_text() de un texto ya cacheado."""
+        ui = self.game.ui
+        return lambda: ui.draw_text('HIGH SCORE', ui.font_small, WHITE, 10, 10)
+
+    def ui_draw_panel(self):
+        """GameUI.draw_panel() con un score que cambia en cada llamada."""
+        ui = self.game.ui
+        score = [0]
+
+        def draw():
+            score[0] += 7
+            ui.draw_panel(score[0], 3)
+        return draw
+
+    def load_all_assets(self):
+        """Carga completa de assets (sin música) en un cargador nuevo."""
+        return lambda: AssetLoader().load_all_assets(play_music=False)
+
+    def game_tick(self):
+        """Un tick completo: update_game() + render_game() + envío a la ventana."""
+        game = self.game
+
+        def tick():
+            if game.game_state.game_over:
+                game.restart_game()
+            game.update_game()
+            game.render_game()
+            game.renderer.present_frame()
+        return tick
+
+    def snapshot_capture(self):
+        """WorldSnapshot.capture() del juego tras unos ticks."""
+        self._advance(300)
+        return lambda: WorldSnapshot.capture(self.game)
+
+    def snapshot_restore(self):
+        """WorldSnapshot.restore() de una instantánea del mismo juego."""
+        self._advance(300)
+        snapshot = WorldSnapshot.capture(self.game)
+        return lambda: snapshot.restore(self.game)
+
+    def _advance(self, ticks):
+        """Avanza el juego sin renderizar para que tenga plataformas y power-ups."""
+        game = self.game
+        for _ in range(ticks):
+            if not game.step():
+                game.restart_game()
+
+
+def environment_info():
+    """Datos del entorno guardados junto a los resultados."""
+    return {
+        'python': '.'.join(str(part) for part in sys.version_info[:3]),
+        'pygame': pygame.version.ver,
+        'sdl': '.'.join(str(part) for part in pygame.get_sdl_version()),
+        'system': sys.platform
+    }
+
+
+def run_benchmarks(repeat=5, only=None):
+    """
+    Ejecuta la suite.
+
+    Args:
+        repeat (int): Repeticiones de cada caso
+        only (str, optional): Solo los casos cuyo nombre contiene este texto
+
+    Returns:
+        dict: Resultados en el formato del JSON
+    """
+    suite = BenchmarkSuite()
+    results = {}
+    for case in suite.build():
+        if only and only not in case.name:
+            continue
+        results[case.name] = case.run(repeat)
+        print(f"{case.name:32s} {results[case.name]['median_us']:12.3f} us", file=sys.stderr)
+    suite.game.close()
+    pygame.quit()
+    return {
+        'format': BENCHMARK_FORMAT,
+        'environment': environment_info(),
+        'results': results
+    }
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compara resultados contra una línea base usando la mediana.
+
+    Args:
+        current (dict): Resultados actuales
+        baseline (dict): Resultados guardados
+        threshold (float): Fracción de tiempo extra tolerada
+
+    Returns:
+        list: Nombres de los casos que empeoraron más que el umbral
+    """
+    regressions = []
+    base_results = baseline.get('results', {})
+    for name, result in current['results'].items():
+        base = base_results.get(name)
+        if base is None:
+            print(f"{name:32s} {'(nuevo)':>12s}")
+            continue
+        ratio = result['median_us'] / base['median_us'] if base['median_us'] else 1.0
+        status = 'REGRESIÓN' if ratio > 1 + threshold else 'ok'
+        print(f"{name:32s} {base['median_us']:12.3f} -> {result['median_us']:12.3f} us  "
+              f"x{ratio:.2f}  {status}")
+        if status != 'ok':
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description='Microbenchmarks de Jumpy Game')
+    parser.add_argument('--repeat', type=int, default=5, help='Repeticiones de cada caso')
+    parser.add_argument('--only', metavar='TEXTO', help='Ejecutar solo los casos que contienen el texto')
+    parser.add_argument('--output', metavar='ARCHIVO', help='Guardar los resultados en JSON')
+    parser.add_argument('--compare', metavar='ARCHIVO', help='Comparar contra una línea base guardada')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Fracción de tiempo extra tolerada antes de marcar regresión')
+    args = parser.parse_args()
+
+    current = run_benchmarks(args.repeat, args.only)
+    output = json.dumps(current, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if args.compare:
+        try:
+            with open(args.compare) as f:
+                baseline = json.load(f)
+        except (IOError, ValueError) as e:
+            print(f"Error leyendo línea base {args.compare}: {e}")
+            return 2
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"Regresiones: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
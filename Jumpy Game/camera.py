@@ -0,0 +1,120 @@
+"""
+Cámara vertical para Jumpy Game.
+
+Las entidades viven en coordenadas de mundo fijas; al subir, solo se
+desplaza la cámara. El desplazamiento se aplica una sola vez al dibujar,
+así el scroll cuesta O(1) sin importar cuántas entidades haya.
+
+Como la simulación avanza a paso fijo y el dibujo no, la cámara recuerda
+su posición al inicio del último tick y al dibujar interpola entre esa
+posición y la actual (junto con la X de las entidades que se mueven).
+"""
+
+from game_config import SCREEN_HEIGHT
+from spatial_index import SpatialGroup
+
+
+class Camera:
+    """Ventana vertical sobre el mundo del juego."""
+
+    def __init__(self):
+        # Coordenada Y de mundo del borde superior de la pantalla.
+        # Disminuye a medida que el jugador sube.
+        self.y = 0
+
+        # Posición al inicio del último tick y la usada para dibujar
+        self.prev_y = 0
+        self.render_y = 0
+        self.render_alpha = 1.0
+
+    def reset(self):
+        """Vuelve la cámara a la posición inicial."""
+        self.y = 0
+        self.prev_y = 0
+        self.render_y = 0
+        self.render_alpha = 1.0
+
+    def begin_step(self):
+        """Guarda la posición actual antes de avanzar un tick."""
+        self.prev_y = self.y
+
+    def interpolate(self, alpha):
+        """
+        Prepara la vista para dibujar entre el tick anterior y el actual.
+
+        Args:
+            alpha (float): Fracción del tick transcurrida (0 = tick
+                anterior, 1 = tick actual)
+        """
+        self.render_alpha = alpha
+        self.render_y = round(self.prev_y + (self.y - self.prev_y) * alpha)
+
+    def scroll(self, amount):
+        """
+        Desplaza la cámara hacia arriba.
+
+        Args:
+            amount (int): Píxeles de scroll (positivo = subir)
+        """
+        self.y -= amount
+
+    @property
+    def top(self):
+        """Coordenada Y de mundo del borde superior visible."""
+        return self.y
+
+    @property
+    def bottom(self):
+        """Coordenada Y de mundo del borde inferior visible."""
+        return self.y + SCREEN_HEIGHT
+
+    def to_screen_y(self, world_y):
+        """Convierte una Y de mundo a Y de pantalla."""
+        return world_y - self.y
+
+    def to_view_y(self, world_y):
+        """Convierte una Y de mundo a Y de pantalla en la vista interpolada."""
+        return world_y - self.render_y
+
+    def to_world_y(self, screen_y):
+        """Convierte una Y de pantalla a Y de mundo."""
+        return screen_y + self.y
+
+    def apply(self, rect):
+        """Devuelve una copia del rect en coordenadas de pantalla."""
+        return rect.move(0, -self.y)
+
+    def is_visible(self, rect):
+        """Indica si el rect se ve en pantalla."""
+        return rect.bottom > self.y and rect.top < self.y + SCREEN_HEIGHT
+
+    def draw_group(self, screen, group):
+        """
+        Dibuja un grupo de sprites aplicando el desplazamiento de cámara.
+
+        Usa la vista interpolada; la X de cada sprite se interpola desde
+        su atributo prev_x (igual a rect.x en los sprites estáticos). En un
+        SpatialGroup solo se recorren las franjas visibles; en un grupo
+        común se recorre todo y se descarta lo que queda fuera.
+
+        Args:
+            screen: Superficie destino, o cualquier objeto con blit()
+                (por ejemplo DirtyRectRenderer)
+            group (pygame.sprite.Group): Sprites a dibujar
+        """
+        top = self.render_y
+        bottom = top + SCREEN_HEIGHT
+        alpha = self.render_alpha
+        blit = screen.blit
+        if isinstance(group, SpatialGroup):
+            for sprite in group.query(top, bottom):
+                rect = sprite.rect
+                prev_x = sprite.prev_x
+                blit(sprite.image, (prev_x + round((rect.x - prev_x) * alpha), rect.y - top))
+            return
+
+        for sprite in group:
+            rect = sprite.rect
+            if rect.bottom > top and rect.top < bottom:
+                prev_x = sprite.prev_x
+                blit(sprite.image, (prev_x + round((rect.x - prev_x) * alpha), rect.y - top))
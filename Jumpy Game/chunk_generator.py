@@ -0,0 +1,116 @@
+"""
+Generación de plataformas por bloques para Jumpy Game.
+
+En vez de tirar varios randint() por cada plataforma, el generador sortea
+de una vez un bloque de PLATFORM_CHUNK_SIZE plataformas (ancho, posición,
+separación, si puede moverse y las tiradas de power-ups). JumpyGame crea
+todas las plataformas del bloque juntas cuando el tramo de mundo que
+ocupan queda a menos de PLATFORM_LOOKAHEAD píxeles sobre la cámara; el
+resto de los ticks la generación no hace nada más que comparar una altura.
+
+Los bytes aleatorios salen del generador de GameState (getrandbits), así
+la partida sigue dependiendo solo de la semilla. Con NumPy el bloque se
+decodifica vectorizado; sin NumPy se decodifica en Python puro con la
+misma aritmética entera, por lo que ambos caminos dan el mismo mundo.
+
+Los requisitos de score y los límites (plataformas móviles, boosters,
+vidas extra) no se deciden al sortear sino al crear cada plataforma, con
+la altura a la que queda.
+"""
+
+import struct
+from game_config import SCREEN_WIDTH, PLATFORM_WIDTH, PLATFORM_CHUNK_SIZE
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Enteros de 32 bits sorteados por plataforma:
+# ancho, x, separación, tipo, tirada de booster, tirada de vida extra
+LAYOUT_FIELDS = 6
+_UINT32_RANGE = 4294967296.0
+
+
+def _pick(value, low, high):
+    """Lleva un entero de 32 bits al rango [low, high]."""
+    return low + ((value * (high - low + 1)) >> 32)
+
+
+class PlatformChunkGenerator:
+    """Sorteo de disposiciones de plataformas por bloques."""
+
+    def __init__(self, platform_gap, chunk_size=PLATFORM_CHUNK_SIZE, use_numpy=True):
+        """
+        Inicializa el generador.
+
+        Args:
+            platform_gap (tuple): Separación vertical (mínima, máxima)
+            chunk_size (int): Plataformas sorteadas por bloque
+            use_numpy (bool): Decodificar con NumPy si está instalado
+        """
+        self.platform_gap = platform_gap
+        self.chunk_size = chunk_size
+        self.use_numpy = use_numpy and numpy is not None
+        self.chunks = 0
+
+    def next_chunk(self, rng):
+        """
+        Sortea el siguiente bloque de disposiciones.
+
+        Args:
+            rng (random.Random): Generador aleatorio de la partida
+
+        Returns:
+            list: Tuplas (x, ancho, separación, móvil, tirada de booster,
+                tirada de vida extra), de abajo hacia arriba; las tiradas son
+                flotantes en [0, 1)
+        """
+        size = self.chunk_size * LAYOUT_FIELDS * 4
+        data = rng.getrandbits(size * 8).to_bytes(size, 'little')
+        self.chunks += 1
+        if self.use_numpy:
+            return self._decode_numpy(data)
+        return self._decode_python(data)
+
+    def _decode_numpy(self, data):
+        """Decodifica un bloque con operaciones vectorizadas."""
+        return list(zip(*(column.tolist() for column in self.decode_arrays(data))))
+
+    def decode_arrays(self, data):
+        """
+        Decodifica bytes aleatorios en columnas de NumPy (requiere NumPy).
+
+        Args:
+            data (bytes): LAYOUT_FIELDS enteros de 32 bits por disposición
+
+        Returns:
+            tuple: Arreglos (x, ancho, separación, móvil, tirada de booster,
+                tirada de vida extra), uno por campo
+        """
+        values = numpy.frombuffer(data, dtype='<u4').astype(numpy.uint64)
+        values = values.reshape(-1, LAYOUT_FIELDS).T
+        min_width, max_width = PLATFORM_WIDTH
+        min_gap, max_gap = self.platform_gap
+
+        widths = min_width + ((values[0] * (max_width - min_width + 1)) >> 32)
+        xs = (values[1] * (SCREEN_WIDTH - widths + 1)) >> 32
+        gaps = min_gap + ((values[2] * (max_gap - min_gap + 1)) >> 32)
+        movable = values[3] < 2147483648
+        booster_rolls = values[4] / _UINT32_RANGE
+        extra_life_rolls = values[5] / _UINT32_RANGE
+        return xs, widths, gaps, movable, booster_rolls, extra_life_rolls
+
+    def _decode_python(self, data):
+        """Decodifica un bloque en Python puro (misma aritmética que con NumPy)."""
+        min_width, max_width = PLATFORM_WIDTH
+        min_gap, max_gap = self.platform_gap
+        values = iter(struct.unpack(f'<{self.chunk_size * LAYOUT_FIELDS}I', data))
+        layouts = []
+        for width_bits, x_bits, gap_bits, type_bits, booster_bits, extra_life_bits in zip(
+                *[values] * LAYOUT_FIELDS):
+            width = _pick(width_bits, min_width, max_width)
+            layouts.append((_pick(x_bits, 0, SCREEN_WIDTH - width), width,
+                            _pick(gap_bits, min_gap, max_gap), type_bits < 2147483648,
+                            booster_bits / _UINT32_RANGE, extra_life_bits / _UINT32_RANGE))
+        return layouts
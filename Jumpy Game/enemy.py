@@ -1,159 +1,223 @@
-"""
-Módulo Enemy - Maneja los enemigos del juego Jumpy Game.
-
-Este módulo contiene la clase Enemy que representa a los enemigos
-voladores (pájaros) que aparecen en el juego.
-"""
-
-import pygame
-import random
-
-
-class Enemy(pygame.sprite.Sprite):
-    """
-    Clase que representa un enemigo volador en el juego.
-
-    Los enemigos se mueven horizontalmente a través de la pantalla
-    con animaciones de sprite y pueden aparecer desde cualquier lado.
-    """
-
-    def __init__(self, screen_width, y_position, sprite_sheet, scale_factor):
-        """
-        Inicializa un nuevo enemigo.
-
-        Args:
-            screen_width (int): Ancho de la pantalla del juego
-            y_position (int): Posición Y donde aparecerá el enemigo
-            sprite_sheet (SpriteSheet): Hoja de sprites para la animación
-            scale_factor (float): Factor de escala para el tamaño del enemigo
-        """
-        super().__init__()
-
-        # Configuración de animación
-        self.animation_frames = []
-        self.current_frame_index = 0
-        self.last_update_time = pygame.time.get_ticks()
-        self.animation_cooldown = 50  # Milisegundos entre frames
-
-        # Configuración de movimiento
-        self.movement_direction = random.choice([-1, 1])  # -1 = izquierda, 1 = derecha
-        self.movement_speed = 2
-        self.is_flipped = self.movement_direction == 1
-
-        # Cargar frames de animación
-        self._load_animation_frames(sprite_sheet, scale_factor)
-
-        # Configurar sprite inicial
-        self.image = self.animation_frames[self.current_frame_index]
-        self.rect = self.image.get_rect()
-
-        # Posicionar enemigo según dirección
-        self._set_initial_position(screen_width, y_position)
-
-    def _load_animation_frames(self, sprite_sheet, scale_factor):
-        """
-        Carga todos los frames de animación del enemigo.
-
-        Args:
-            sprite_sheet (SpriteSheet): Hoja de sprites para extraer frames
-            scale_factor (float): Factor de escala para redimensionar
-        """
-        total_animation_frames = 8
-        frame_width = 32
-        frame_height = 32
-        transparent_color = (0, 0, 0)  # Negro como color transparente
-
-        for frame_index in range(total_animation_frames):
-            # Extraer frame de la sprite sheet
-            frame_image = sprite_sheet.get_image(
-                frame_index, frame_width, frame_height,
-                scale_factor, transparent_color
-            )
-
-            # Voltear imagen si es necesario
-            if self.is_flipped:
-                frame_image = pygame.transform.flip(frame_image, True, False)
-
-            # Configurar transparencia
-            frame_image.set_colorkey(transparent_color)
-
-            # Agregar frame a la lista
-            self.animation_frames.append(frame_image)
-
-    def _set_initial_position(self, screen_width, y_position):
-        """
-        Establece la posición inicial del enemigo según su dirección.
-
-        Args:
-            screen_width (int): Ancho de la pantalla
-            y_position (int): Posición Y del enemigo
-        """
-        if self.movement_direction == 1:  # Moviéndose hacia la derecha
-            self.rect.x = 0  # Empezar desde el lado izquierdo
-        else:  # Moviéndose hacia la izquierda
-            self.rect.x = screen_width  # Empezar desde el lado derecho
-
-        self.rect.y = y_position
-
-    def _update_animation(self):
-        """Actualiza la animación del enemigo."""
-        current_time = pygame.time.get_ticks()
-
-        # Verificar si es tiempo de cambiar frame
-        if current_time - self.last_update_time > self.animation_cooldown:
-            self.last_update_time = current_time
-            self.current_frame_index += 1
-
-            # Reiniciar animación si llegó al final
-            if self.current_frame_index >= len(self.animation_frames):
-                self.current_frame_index = 0
-
-        # Actualizar imagen actual
-        self.image = self.animation_frames[self.current_frame_index]
-
-    def _update_movement(self, scroll_amount):
-        """
-        Actualiza el movimiento del enemigo.
-
-        Args:
-            scroll_amount (int): Cantidad de scroll vertical a aplicar
-        """
-        # Movimiento horizontal
-        self.rect.x += self.movement_direction * self.movement_speed
-
-        # Movimiento vertical (scroll del juego)
-        self.rect.y += scroll_amount
-
-    def _check_if_off_screen(self, screen_width):
-        """
-        Verifica si el enemigo salió de la pantalla y lo elimina si es necesario.
-
-        Args:
-            screen_width (int): Ancho de la pantalla
-        """
-        if self.rect.right < 0 or self.rect.left > screen_width:
-            self.kill()  # Eliminar sprite del grupo
-
-    def update(self, scroll_amount, screen_width):
-        """
-        Actualiza el estado completo del enemigo.
-
-        Este método se llama en cada frame del juego para actualizar
-        la animación, posición y verificar si debe ser eliminado.
-
-        Args:
-            scroll_amount (int): Cantidad de scroll vertical del juego
-            screen_width (int): Ancho de la pantalla del juego
-        """
-        self._update_animation()
-        self._update_movement(scroll_amount)
-        self._check_if_off_screen(screen_width)
-
-    def get_collision_mask(self):
-        """
-        Obtiene la máscara de colisión del enemigo.
-
-        Returns:
-            pygame.Mask: Máscara para detección de colisiones precisas
-        """
-        return pygame.mask.from_surface(self.image)
+"""
+Módulo Enemy - Maneja los enemigos del juego Jumpy Game.
+
+Este módulo contiene la clase Enemy que representa a los enemigos
+voladores (pájaros) que aparecen en el juego.
+"""
+
+import pygame
+import random
+from game_config import FIXED_TIMESTEP_MS
+from spritesheet import SpriteSheet
+from pool import PooledSprite
+
+
+# Formato de la hoja de sprites del pájaro
+ENEMY_FRAME_COUNT = 8
+ENEMY_FRAME_SIZE = 32
+ENEMY_TRANSPARENT_COLOR = (0, 0, 0)  # Negro como color transparente
+
+
+class EnemyFrameBank:
+    """
+    Banco de frames de animación de enemigos.
+
+    Extrae, escala, voltea y aplica color transparente a los frames de la
+    hoja de sprites una sola vez por factor de escala, junto con sus
+    máscaras de colisión. Los enemigos solo guardan referencias a estas
+    listas, así crear un enemigo no procesa imágenes.
+    """
+
+    def __init__(self, sprite_sheet):
+        """
+        Inicializa el banco.
+
+        Args:
+            sprite_sheet (SpriteSheet): Hoja de sprites del enemigo
+        """
+        self.sprite_sheet = sprite_sheet
+        self._frames = {}  # (escala, volteado) -> (frames, máscaras)
+
+    def prebuild(self, scale_factor):
+        """Genera por adelantado ambas orientaciones para una escala."""
+        self.get_frames(scale_factor, False)
+        self.get_frames(scale_factor, True)
+
+    def get_frames(self, scale_factor, flipped):
+        """
+        Obtiene los frames y máscaras para una escala y orientación.
+
+        Args:
+            scale_factor (float): Factor de escala de los frames
+            flipped (bool): True para los frames mirando a la derecha
+
+        Returns:
+            tuple: (lista de pygame.Surface, lista de pygame.Mask).
+                   Las listas son compartidas y no deben modificarse
+        """
+        key = (scale_factor, flipped)
+        entry = self._frames.get(key)
+        if entry is None:
+            entry = self._build(scale_factor, flipped)
+            self._frames[key] = entry
+        return entry
+
+    def _build(self, scale_factor, flipped):
+        """Extrae y procesa los frames de una escala y orientación."""
+        frames = []
+        masks = []
+        for frame_index in range(ENEMY_FRAME_COUNT):
+            # Extraer frame de la sprite sheet
+            frame_image = self.sprite_sheet.get_image(
+                frame_index, ENEMY_FRAME_SIZE, ENEMY_FRAME_SIZE,
+                scale_factor, ENEMY_TRANSPARENT_COLOR
+            )
+
+            # Voltear imagen si es necesario
+            if flipped:
+                frame_image = pygame.transform.flip(frame_image, True, False)
+
+            # Configurar transparencia
+            frame_image.set_colorkey(ENEMY_TRANSPARENT_COLOR)
+
+            frames.append(frame_image)
+            masks.append(pygame.mask.from_surface(frame_image))
+        return frames, masks
+
+
+class Enemy(PooledSprite):
+    """
+    Clase que representa un enemigo volador en el juego.
+
+    Los enemigos se mueven horizontalmente a través de la pantalla
+    con animaciones de sprite y pueden aparecer desde cualquier lado.
+    """
+
+    def __init__(self, screen_width, y_position, frame_bank, scale_factor, rng=random):
+        """
+        Inicializa un nuevo enemigo.
+
+        Args:
+            screen_width (int): Ancho de la pantalla del juego
+            y_position (int): Posición Y de mundo donde aparecerá el enemigo
+            frame_bank (EnemyFrameBank): Banco con los frames de animación.
+                También se acepta una SpriteSheet, en cuyo caso se crea
+                un banco solo para este enemigo
+            scale_factor (float): Factor de escala para el tamaño del enemigo
+            rng (random.Random, optional): Generador aleatorio de la partida
+        """
+        super().__init__()
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(screen_width, y_position, frame_bank, scale_factor, rng)
+
+    def reset(self, screen_width, y_position, frame_bank, scale_factor, rng=random):
+        """
+        Reinicializa el enemigo (también al reutilizarlo desde el pool).
+
+        Recibe los mismos argumentos que el constructor.
+        """
+        if isinstance(frame_bank, SpriteSheet):
+            frame_bank = EnemyFrameBank(frame_bank)
+
+        # Configuración de animación
+        self.current_frame_index = 0
+        self.animation_timer = 0  # Tiempo simulado desde el último frame
+        self.animation_cooldown = 50  # Milisegundos entre frames
+
+        # Configuración de movimiento
+        self.movement_direction = rng.choice([-1, 1])  # -1 = izquierda, 1 = derecha
+        self.movement_speed = 2
+        self.is_flipped = self.movement_direction == 1
+
+        # Frames de animación compartidos desde el banco
+        self.animation_frames, self.animation_masks = frame_bank.get_frames(
+            scale_factor, self.is_flipped)
+
+        # Configurar sprite inicial
+        self.image = self.animation_frames[self.current_frame_index]
+        self.mask = self.animation_masks[self.current_frame_index]
+        self.rect.size = self.image.get_size()
+
+        # Posicionar enemigo según dirección
+        self._set_initial_position(screen_width, y_position)
+
+    def _set_initial_position(self, screen_width, y_position):
+        """
+        Establece la posición inicial del enemigo según su dirección.
+
+        Args:
+            screen_width (int): Ancho de la pantalla
+            y_position (int): Posición Y del enemigo
+        """
+        if self.movement_direction == 1:  # Moviéndose hacia la derecha
+            self.rect.x = 0  # Empezar desde el lado izquierdo
+        else:  # Moviéndose hacia la izquierda
+            self.rect.x = screen_width  # Empezar desde el lado derecho
+
+        self.rect.y = y_position
+        self.prev_x = self.rect.x
+
+    def _update_animation(self):
+        """
+        Actualiza la animación del enemigo.
+
+        El tiempo avanza por ticks de juego y no por reloj real, así la
+        animación (y la máscara de colisión) es reproducible.
+        """
+        self.animation_timer += FIXED_TIMESTEP_MS
+
+        # Verificar si es tiempo de cambiar frame
+        if self.animation_timer > self.animation_cooldown:
+            self.animation_timer = 0
+            self.current_frame_index += 1
+
+            # Reiniciar animación si llegó al final
+            if self.current_frame_index >= len(self.animation_frames):
+                self.current_frame_index = 0
+
+        # Actualizar imagen y máscara actuales
+        self.image = self.animation_frames[self.current_frame_index]
+        self.mask = self.animation_masks[self.current_frame_index]
+
+    def _update_movement(self):
+        """
+        Actualiza el movimiento del enemigo.
+
+        Solo hay movimiento horizontal: la posición vertical está en
+        coordenadas de mundo y el scroll lo aplica la cámara al dibujar.
+        """
+        self.prev_x = self.rect.x
+        self.rect.x += self.movement_direction * self.movement_speed
+
+    def _check_if_off_screen(self, screen_width):
+        """
+        Verifica si el enemigo salió de la pantalla y lo elimina si es necesario.
+
+        Args:
+            screen_width (int): Ancho de la pantalla
+        """
+        if self.rect.right < 0 or self.rect.left > screen_width:
+            self.kill()  # Eliminar sprite del grupo
+
+    def update(self, screen_width):
+        """
+        Actualiza el estado completo del enemigo.
+
+        Este método se llama en cada frame del juego para actualizar
+        la animación, posición y verificar si debe ser eliminado.
+
+        Args:
+            screen_width (int): Ancho de la pantalla del juego
+        """
+        self._update_animation()
+        self._update_movement()
+        self._check_if_off_screen(screen_width)
+
+    def get_collision_mask(self):
+        """
+        Obtiene la máscara de colisión del enemigo.
+
+        Returns:
+            pygame.Mask: Máscara para detección de colisiones precisas
+        """
+        return self.mask
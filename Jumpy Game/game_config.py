@@ -1,52 +1,137 @@
-"""
-Configuración del juego Jumpy Game.
-Centraliza todas las constantes y configuraciones.
-"""
-
-import os
-
-# === CONFIGURACIÓN DE PANTALLA ===
-SCREEN_WIDTH = 400
-SCREEN_HEIGHT = 600
-FPS = 60
-
-# === CONFIGURACIÓN DE FÍSICA ===
-SCROLL_THRESH = 200
-GRAVITY = 1
-MAX_PLATFORMS = 10
-
-# === SISTEMA DE VIDAS ===
-LIVES = 3
-MAX_LIVES = 5
-
-# === VELOCIDADES DE SALTO ===
-INITIAL_JUMP_VEL = -20
-BOOST_JUMP_VEL = -60
-
-# === PROBABILIDADES DE SPAWN ===
-BOOSTER_SPAWN_CHANCE = 0.08  # 8%
-EXTRA_LIFE_SPAWN_CHANCE = 0.05  # 5%
-
-# === REQUISITOS DE SCORE ===
-MOVING_PLATFORMS_SCORE = 1000
-BOOSTER_SCORE = 1000
-ENEMY_SCORE = 2000
-
-# === COLORES ===
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-GREEN = (0, 255, 0)
-RED = (255, 0, 0)
-YELLOW = (255, 255, 0)
-
-# === RUTAS DE ARCHIVOS ===
-CURRENT_DIR = os.path.dirname(__file__)
-ASSETS_DIR = os.path.join(CURRENT_DIR, 'assets')
-SCORE_FILE = os.path.join(CURRENT_DIR, 'score.txt')
-
-# === CONFIGURACIÓN DE JUGADOR ===
-PLAYER_IMAGE_SIZE = (48, 48)
-PLAYER_COLLISION_SCALE = 0.7
-PLAYER_SPEED = 10
-PLAYER_START_X = SCREEN_WIDTH // 2
-PLAYER_START_Y = SCREEN_HEIGHT - 150
+"""
+Configuración del juego Jumpy Game.
+Centraliza todas las constantes y configuraciones.
+"""
+
+import os
+
+# === CONFIGURACIÓN DE PANTALLA ===
+SCREEN_WIDTH = 400
+SCREEN_HEIGHT = 600
+FPS = 60                     # Ticks de simulación por segundo
+FIXED_TIMESTEP_MS = 1000 / FPS  # Duración fija de un tick de simulación
+MAX_SEED = 2 ** 63 - 1       # Semilla más grande (entero de 64 bits con signo en repeticiones e instantáneas)
+RENDER_FPS = FPS             # Límite de frames dibujados por segundo (0 = sin límite)
+MAX_FRAME_TIME_MS = 250      # Tiempo máximo a recuperar tras un frame lento
+DIRTY_RECT_RENDERING = True  # Actualizar solo las regiones que cambian
+IDLE_MODE = True             # Bloquear en pantallas estáticas en vez de repintar
+IDLE_WAIT_TIMEOUT_MS = 1000  # Espera máxima por eventos en modo de bajo consumo
+
+# === CONFIGURACIÓN DE FÍSICA ===
+SCROLL_THRESH = 200
+GRAVITY = 1
+PLATFORM_GAP = (80, 120)  # Distancia vertical mínima y máxima entre plataformas
+PLATFORM_WIDTH = (40, 60)  # Ancho mínimo y máximo de las plataformas
+PLATFORM_HEIGHT = 10
+PLATFORM_MAX_SPEED = 2     # Velocidad horizontal máxima de las plataformas móviles
+PLATFORM_CHUNK_SIZE = 64   # Plataformas sorteadas y creadas de una vez por el generador
+PLATFORM_LOOKAHEAD = SCREEN_HEIGHT  # Distancia sobre la cámara a la que se crea el bloque siguiente
+REACHABILITY_CHECK = True        # Acercar las plataformas que no se alcanzan de un salto
+REACHABILITY_DOUBLE_JUMP = False  # Si el generador puede contar con el doble salto
+
+# === SISTEMA DE VIDAS ===
+LIVES = 3
+MAX_LIVES = 5
+
+# === VELOCIDADES DE SALTO ===
+INITIAL_JUMP_VEL = -20
+BOOST_JUMP_VEL = -60
+
+# === PROBABILIDADES DE SPAWN ===
+BOOSTER_SPAWN_CHANCE = 0.08  # 8%
+EXTRA_LIFE_SPAWN_CHANCE = 0.05  # 5%
+
+# === REQUISITOS DE SCORE ===
+MOVING_PLATFORMS_SCORE = 1000
+BOOSTER_SCORE = 1000
+ENEMY_SCORE = 2000
+
+# === CONFIGURACIÓN DE ENEMIGOS ===
+ENEMY_SCALE = 1.5
+MAX_ENEMIES = 1       # Enemigos simultáneos
+MAX_EXTRA_LIVES = 1   # Vidas extra a menos de una pantalla entre sí
+
+# === COLORES ===
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GREEN = (0, 255, 0)
+RED = (255, 0, 0)
+YELLOW = (255, 255, 0)
+
+# === RUTAS DE ARCHIVOS ===
+CURRENT_DIR = os.path.dirname(__file__)
+ASSETS_DIR = os.path.join(CURRENT_DIR, 'assets')
+SCORE_FILE = os.path.join(CURRENT_DIR, 'score.txt')
+
+# === CONFIGURACIÓN DE JUGADOR ===
+PLAYER_IMAGE_SIZE = (48, 48)
+PLAYER_COLLISION_SCALE = 0.7
+PLAYER_SPEED = 10
+PLAYER_START_X = SCREEN_WIDTH // 2
+PLAYER_START_Y = SCREEN_HEIGHT - 150
+
+# === FONDO ===
+# Imágenes de fondo disponibles (nombre -> archivo)
+BACKGROUND_IMAGES = {
+    'background': 'background1.jpg',
+    'background_far': 'background2.png',
+}
+# Capas dibujadas (nombre, factor de parallax), de la más lejana a la más cercana.
+# Una capa opaca tapa a las anteriores, que entonces no se dibujan; para
+# parallax las capas cercanas necesitan transparencia.
+BACKGROUND_LAYERS = [('background', 1.0)]
+
+# === ASSETS ===
+# Imágenes cargadas al inicio: (nombre, archivo, tamaño o None, alfa).
+# Alfa True usa convert_alpha() y empaca la imagen en el atlas; None decide
+# según el archivo y la guarda en una página propia del atlas.
+IMAGE_ASSETS = [(name, BACKGROUND_IMAGES[name], None, None) for name, _ in BACKGROUND_LAYERS] + [
+    ('platform', 'wood.png', None, True),
+    ('player_left', 'bee_rest_l.png', PLAYER_IMAGE_SIZE, True),
+    ('player_right', 'bee_rest_r.png', PLAYER_IMAGE_SIZE, True),
+    ('booster', 'booster.webp', None, True),
+    ('extra_life', 'extra_life.png', None, True),
+    ('bird_enemy', 'bird.png', None, True),
+    ('icon', 'ghost.png', None, True),
+]
+# Sonidos: (nombre, archivo, volumen)
+SOUND_ASSETS = [
+    ('jump', 'jump.mp3', 1.0),
+    ('death', 'death.mp3', 1.0),
+    ('boost', 'boost.mp3', 0.8),
+    ('extra_life', 'powerup.wav', 0.8),
+]
+MUSIC_FILE = 'music_game-2d.mp3'
+MUSIC_VOLUME = 0.9
+# Canales del mixer reservados para cada categoría de sonido
+SOUND_CATEGORY_CHANNELS = {'player': 2, 'powerup': 2, 'event': 1}
+# Categoría de cada sonido
+SOUND_CATEGORIES = {'jump': 'player', 'boost': 'powerup', 'extra_life': 'powerup', 'death': 'event'}
+SOUND_RETRIGGER_MS = 80     # Tiempo mínimo entre dos disparos del mismo sonido
+ASSET_LOADER_WORKERS = 4    # Hilos para cargar assets en segundo plano
+ASSET_CACHE_ENABLED = True  # Usar la caché horneada de assets/.cache
+ASSET_CACHE_DIR = os.path.join(ASSETS_DIR, '.cache')
+# Nombres antiguos (assets.AssetManager) -> nombre en el manifiesto
+ASSET_ALIASES = {'enemy_bird': 'bird_enemy', 'enemy': 'bird_enemy'}
+# Bytes de imágenes y sonidos en memoria a partir de los cuales se liberan
+# los assets sin referencias
+ASSET_MEMORY_BUDGET = 32 * 1024 * 1024
+
+# === REBOBINADO ===
+REWIND_ENABLED = False           # Mantener R presionada retrocede los últimos segundos
+REWIND_SECONDS = 5               # Segundos de juego que se pueden rebobinar
+REWIND_KEYFRAME_INTERVAL = 30    # Ticks entre estados completos del buffer
+REWIND_MAX_BYTES = 2 * 1024 * 1024  # Memoria máxima del buffer de rebobinado
+REWIND_SPEED = 2                 # Ticks rebobinados por tick mientras se mantiene R
+
+# === CACHÉS ===
+SCALED_CACHE_SIZE = 64  # Superficies escaladas que guarda AssetLoader
+TEXT_CACHE_SIZE = 64    # Textos renderizados que guarda GameUI
+
+# === ÍNDICE ESPACIAL ===
+SPATIAL_BUCKET_HEIGHT = 64  # Alto en píxeles de cada franja del índice
+
+# === PERFILADO ===
+PROFILER_CAPACITY = 600          # Frames guardados por el perfilador (10 s a 60 FPS)
+PROFILER_OVERLAY_INTERVAL = 30   # Frames entre recálculos de los percentiles del overlay
+PROFILER_CSV_FILE = os.path.join(CURRENT_DIR, 'frame_profile.csv')
@@ -1,71 +1,138 @@
-"""
-Estado del juego Jumpy Game.
-Maneja puntuación, vidas y persistencia.
-"""
-
-import os
-from game_config import *
-
-
-class GameState:
-    """Maneja el estado del juego."""
-
-    def __init__(self):
-        # Estados de pantalla
-        self.waiting_for_start = True
-        self.paused = False
-        self.game_over = False
-
-        # Puntuación y vidas
-        self.score = 0
-        self.lives = LIVES
-        self.high_score = self.load_high_score()
-
-        # Variables de scroll
-        self.scroll = 0
-        self.bg_scroll = 0
-        self.fade_counter = 0
-
-    def load_high_score(self):
-        """Carga el high score desde archivo."""
-        try:
-            if os.path.exists(SCORE_FILE):
-                with open(SCORE_FILE, 'r') as file:
-                    return int(file.read().strip())
-        except (ValueError, IOError):
-            pass
-        return 0
-
-    def save_high_score(self):
-        """Guarda el high score actual."""
-        if self.score > self.high_score:
-            self.high_score = self.score
-            try:
-                with open(SCORE_FILE, 'w') as file:
-                    file.write(str(self.high_score))
-            except IOError:
-                pass
-
-    def reset_game(self):
-        """Reinicia el estado para una nueva partida."""
-        self.game_over = False
-        self.score = 0
-        self.lives = LIVES
-        self.scroll = 0
-        self.bg_scroll = 0
-        self.fade_counter = 0
-
-    def lose_life(self):
-        """Hace perder una vida al jugador."""
-        self.lives -= 1
-        if self.lives <= 0:
-            self.game_over = True
-            return True
-        return False
-
-    def gain_life(self):
-        """Otorga una vida extra."""
-        if self.lives < MAX_LIVES:
-            self.lives += 1
-            return True
-        return False
+"""
+Estado del juego Jumpy Game.
+Maneja puntuación, vidas y persistencia.
+"""
+
+import argparse
+import os
+import random
+from game_config import *
+
+
+def check_seed(seed):
+    """
+    Verifica que una semilla entre en las repeticiones y en las instantáneas.
+
+    Raises:
+        ValueError: Si la semilla no está entre 0 y MAX_SEED
+    """
+    if not 0 <= seed <= MAX_SEED:
+        raise ValueError(f"Semilla fuera de rango (0 a {MAX_SEED}): {seed}")
+    return seed
+
+
+def seed_argument(text):
+    """Convierte el argumento --seed de la línea de comandos (para argparse)."""
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Semilla inválida: {text}")
+    try:
+        return check_seed(seed)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+class GameState:
+    """Maneja el estado del juego."""
+
+    def __init__(self, persist_high_score=True, seed=None):
+        # Persistencia (desactivada en simulaciones headless)
+        self.persist_high_score = persist_high_score
+
+        # Generador aleatorio propio de la partida (reproducible por semilla)
+        self.rng = random.Random()
+        self.seed = None
+        self.new_run_seed(seed)
+
+        # Estados de pantalla
+        self.waiting_for_start = True
+        self.paused = False
+        self.game_over = False
+
+        # Puntuación y vidas
+        self.score = 0
+        self.lives = LIVES
+        self.high_score = self.load_high_score()
+
+        # Variables de scroll
+        self.scroll = 0
+        self.fade_counter = 0
+
+        # Ticks simulados en la partida (reloj de la simulación)
+        self.tick = 0
+
+    def load_high_score(self):
+        """Carga el high score desde archivo."""
+        if not self.persist_high_score:
+            return 0
+        try:
+            if os.path.exists(SCORE_FILE):
+                with open(SCORE_FILE, 'r') as file:
+                    return int(file.read().strip())
+        except (ValueError, IOError):
+            pass
+        return 0
+
+    def save_high_score(self):
+        """Guarda el high score actual."""
+        if self.score > self.high_score:
+            self.high_score = self.score
+            if not self.persist_high_score:
+                return
+            try:
+                with open(SCORE_FILE, 'w') as file:
+                    file.write(str(self.high_score))
+            except IOError:
+                pass
+
+    def new_run_seed(self, seed=None):
+        """
+        Reinicia el generador aleatorio para una nueva partida.
+
+        Si no se indica semilla se deriva del generador actual, de modo
+        que una semilla inicial determina todas las partidas siguientes.
+
+        Args:
+            seed (int, optional): Semilla de la partida
+
+        Raises:
+            ValueError: Si la semilla no está entre 0 y MAX_SEED
+        """
+        if seed is None:
+            if self.seed is None:
+                seed = random.getrandbits(32)
+            else:
+                seed = self.rng.getrandbits(32)
+        self.seed = check_seed(seed)
+        self.rng.seed(seed)
+
+    def reset_game(self, seed=None):
+        """
+        Reinicia el estado para una nueva partida.
+
+        Args:
+            seed (int, optional): Semilla para la nueva partida
+        """
+        self.new_run_seed(seed)
+        self.game_over = False
+        self.score = 0
+        self.lives = LIVES
+        self.scroll = 0
+        self.fade_counter = 0
+        self.tick = 0
+
+    def lose_life(self):
+        """Hace perder una vida al jugador."""
+        self.lives -= 1
+        if self.lives <= 0:
+            self.game_over = True
+            return True
+        return False
+
+    def gain_life(self):
+        """Otorga una vida extra."""
+        if self.lives < MAX_LIVES:
+            self.lives += 1
+            return True
+        return False
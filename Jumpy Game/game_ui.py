@@ -1,77 +1,204 @@
-"""
-Interfaz de usuario para Jumpy Game.
-Maneja todo el renderizado de texto y pantallas.
-"""
-
-import pygame
-from game_config import *
-
-
-class GameUI:
-    """Maneja la interfaz de usuario del juego."""
-
-    def __init__(self, screen):
-        self.screen = screen
-        self.font_small = pygame.font.SysFont('Lucida Sans', 20)
-        self.font_big = pygame.font.SysFont('Lucida Sans', 24)
-
-    def draw_text(self, text, font, color, x, y, center=False):
-        """Dibuja texto en la pantalla."""
-        img = font.render(text, True, color)
-        if center:
-            text_rect = img.get_rect()
-            text_rect.center = (SCREEN_WIDTH // 2, y)
-            self.screen.blit(img, text_rect)
-        else:
-            self.screen.blit(img, (x, y))
-
-    def draw_panel(self, score, lives):
-        """Dibuja el panel de información del juego."""
-        self.draw_text('SCORE: ' + str(score), self.font_small, WHITE, 0, 0)
-        self.draw_text('LIVES: ' + str(lives), self.font_small, GREEN, SCREEN_WIDTH - 90, 0)
-
-    def draw_background(self, bg_image, bg_scroll):
-        """Dibuja el fondo con scroll."""
-        if bg_image:
-            self.screen.blit(bg_image, (0, 0 + bg_scroll))
-            self.screen.blit(bg_image, (0, -600 + bg_scroll))
-        else:
-            self.screen.fill((0, 100, 200))  # Azul por defecto
-
-    def draw_start_screen(self):
-        """Dibuja la pantalla de inicio."""
-        self.screen.fill(BLACK)
-        self.draw_text('JUMPY GAME', self.font_big, WHITE, 0, SCREEN_HEIGHT // 2 - 80, center=True)
-        self.draw_text('PRESIONA "N" PARA COMENZAR', self.font_big, WHITE, 0, SCREEN_HEIGHT // 2 - 20, center=True)
-        self.draw_text('CONTROLES:', self.font_small, WHITE, 0, SCREEN_HEIGHT // 2 + 40, center=True)
-        self.draw_text('A/D - MOVER', self.font_small, WHITE, 0, SCREEN_HEIGHT // 2 + 70, center=True)
-        self.draw_text('ESPACIO - DOBLE SALTO', self.font_small, WHITE, 0, SCREEN_HEIGHT // 2 + 100, center=True)
-        self.draw_text('P - PAUSAR', self.font_small, WHITE, 0, SCREEN_HEIGHT // 2 + 130, center=True)
-
-    def draw_pause_screen(self):
-        """Dibuja la pantalla de pausa."""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-
-        self.draw_text('JUEGO EN PAUSA', self.font_big, WHITE, 0, SCREEN_HEIGHT // 2 - 20, center=True)
-        self.draw_text('PRESIONA "P" PARA CONTINUAR', self.font_small, WHITE, 0, SCREEN_HEIGHT // 2 + 20, center=True)
-
-    def draw_game_over(self, score, fade_counter):
-        """Dibuja la pantalla de game over."""
-        if fade_counter < SCREEN_WIDTH:
-            for y in range(0, 6, 2):
-                pygame.draw.rect(self.screen, BLACK, (0, y * 100, fade_counter, 100))
-                pygame.draw.rect(self.screen, BLACK, (SCREEN_WIDTH - fade_counter, (y + 1) * 100, SCREEN_WIDTH, 100))
-        else:
-            self.draw_text('GAME OVER!', self.font_big, WHITE, 130, 200)
-            self.draw_text('SCORE: ' + str(score), self.font_big, WHITE, 130, 250)
-            self.draw_text('PRESS SPACE TO PLAY AGAIN', self.font_big, WHITE, 40, 300)
-
-    def draw_high_score_line(self, score, high_score):
-        """Dibuja la línea del high score."""
-        line_y = score - high_score + SCROLL_THRESH
-        if 0 <= line_y <= SCREEN_HEIGHT:
-            pygame.draw.line(self.screen, WHITE, (0, line_y), (SCREEN_WIDTH, line_y), 3)
-            self.draw_text('HIGH SCORE', self.font_small, WHITE, SCREEN_WIDTH - 130, line_y)
+"""
+Interfaz de usuario para Jumpy Game.
+Maneja todo el renderizado de texto y pantallas.
+"""
+
+import pygame
+from collections import OrderedDict
+from game_config import *
+
+
+class GameUI:
+    """Maneja la interfaz de usuario del juego."""
+
+    def __init__(self, screen, text_cache_size=TEXT_CACHE_SIZE):
+        self.screen = screen
+        self.font_small = pygame.font.SysFont('Lucida Sans', 20)
+        self.font_big = pygame.font.SysFont('Lucida Sans', 24)
+        self.font_debug = None  # Se crea al mostrar el overlay de depuración
+
+        # Caché LRU de textos renderizados: (fuente, texto, color) -> superficie
+        self.text_cache = OrderedDict()
+        self.text_cache_size = text_cache_size
+        self.text_hits = 0
+        self.text_misses = 0
+
+        # Capa semitransparente de la pausa, creada una sola vez
+        self.pause_overlay = None
+
+    def render_text(self, text, font, color):
+        """
+        Renderiza un texto reutilizando la superficie de la caché si existe.
+
+        La superficie devuelta es compartida y no debe modificarse.
+
+        Returns:
+            pygame.Surface: Texto renderizado
+        """
+        key = (font, text, color)
+        cache = self.text_cache
+        img = cache.get(key)
+        if img is not None:
+            cache.move_to_end(key)
+            self.text_hits += 1
+            return img
+
+        self.text_misses += 1
+        img = font.render(text, True, color)
+        cache[key] = img
+        if len(cache) > self.text_cache_size:
+            cache.popitem(last=False)
+        return img
+
+    def draw_number(self, label, value, font, color, x, y):
+        """
+        Dibuja una etiqueta seguida de un número componiendo glifos cacheados.
+
+        Cada dígito se renderiza una sola vez por fuente y color, así un
+        número que cambia en cada frame no crea superficies nuevas.
+
+        Returns:
+            pygame.Rect: Región de pantalla ocupada por el texto
+        """
+        blit = self.screen.blit
+        rect = blit(self.render_text(label, font, color), (x, y))
+        cursor = rect.right
+        for digit in str(value):
+            glyph = self.render_text(digit, font, color)
+            blit(glyph, (cursor, y))
+            cursor += glyph.get_width()
+        rect.width = cursor - x
+        return rect
+
+    def get_text_cache_stats(self):
+        """
+        Obtiene las estadísticas de la caché de texto.
+
+        Returns:
+            dict: Aciertos, fallos, tamaño actual y tasa de aciertos
+        """
+        total = self.text_hits + self.text_misses
+        return {
+            'hits': self.text_hits,
+            'misses': self.text_misses,
+            'size': len(self.text_cache),
+            'hit_rate': self.text_hits / total if total else 0.0
+        }
+
+    def draw_text(self, text, font, color, x, y, center=False):
+        """
+        Dibuja texto en la pantalla.
+
+        Returns:
+            pygame.Rect: Región de pantalla ocupada por el texto
+        """
+        img = self.render_text(text, font, color)
+        if center:
+            text_rect = img.get_rect()
+            text_rect.center = (SCREEN_WIDTH // 2, y)
+            return self.screen.blit(img, text_rect)
+        return self.screen.blit(img, (x, y))
+
+    def draw_panel(self, score, lives):
+        """
+        Dibuja el panel de información del juego.
+
+        Returns:
+            list: Regiones de pantalla ocupadas por el panel
+        """
+        return [
+            self.draw_number('SCORE: ', score, self.font_small, WHITE, 0, 0),
+            self.draw_number('LIVES: ', lives, self.font_small, GREEN, SCREEN_WIDTH - 90, 0)
+        ]
+
+    def draw_start_screen(self):
+        """Dibuja la pantalla de inicio."""
+        self.screen.fill(BLACK)
+        self.draw_text('JUMPY GAME', self.font_big, WHITE, 0, SCREEN_HEIGHT // 2 - 80, center=True)
+        self.draw_text('PRESIONA "N" PARA COMENZAR', self.font_big, WHITE, 0, SCREEN_HEIGHT // 2 - 20, center=True)
+        self.draw_text('CONTROLES:', self.font_small, WHITE, 0, SCREEN_HEIGHT // 2 + 40, center=True)
+        self.draw_text('A/D - MOVER', self.font_small, WHITE, 0, SCREEN_HEIGHT // 2 + 70, center=True)
+        self.draw_text('ESPACIO - DOBLE SALTO', self.font_small, WHITE, 0, SCREEN_HEIGHT // 2 + 100, center=True)
+        self.draw_text('P - PAUSAR', self.font_small, WHITE, 0, SCREEN_HEIGHT // 2 + 130, center=True)
+
+    def draw_loading_bar(self, progress):
+        """
+        Dibuja la barra de carga de assets bajo los controles de la pantalla de inicio.
+
+        Args:
+            progress (float): Fracción cargada entre 0 y 1
+
+        Returns:
+            pygame.Rect: Región ocupada por la barra
+        """
+        bar = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 180, 200, 12)
+        pygame.draw.rect(self.screen, WHITE, bar, 1)
+        fill = bar.inflate(-4, -4)
+        fill.width = int(fill.width * min(max(progress, 0.0), 1.0))
+        if fill.width:
+            pygame.draw.rect(self.screen, GREEN, fill)
+        return bar
+
+    def draw_pause_screen(self):
+        """Dibuja la pantalla de pausa."""
+        if self.pause_overlay is None:
+            self.pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.pause_overlay.set_alpha(128)
+            self.pause_overlay.fill(BLACK)
+        self.screen.blit(self.pause_overlay, (0, 0))
+
+        self.draw_text('JUEGO EN PAUSA', self.font_big, WHITE, 0, SCREEN_HEIGHT // 2 - 20, center=True)
+        self.draw_text('PRESIONA "P" PARA CONTINUAR', self.font_small, WHITE, 0, SCREEN_HEIGHT // 2 + 20, center=True)
+
+    def draw_game_over(self, score, fade_counter):
+        """
+        Dibuja la pantalla de game over.
+
+        Returns:
+            list: Regiones de pantalla modificadas
+        """
+        rects = []
+        if fade_counter < SCREEN_WIDTH:
+            for y in range(0, 6, 2):
+                rects.append(pygame.draw.rect(self.screen, BLACK, (0, y * 100, fade_counter, 100)))
+                rects.append(pygame.draw.rect(self.screen, BLACK, (SCREEN_WIDTH - fade_counter, (y + 1) * 100, SCREEN_WIDTH, 100)))
+        else:
+            rects.append(self.draw_text('GAME OVER!', self.font_big, WHITE, 130, 200))
+            rects.append(self.draw_text('SCORE: ' + str(score), self.font_big, WHITE, 130, 250))
+            rects.append(self.draw_text('PRESS SPACE TO PLAY AGAIN', self.font_big, WHITE, 40, 300))
+        return rects
+
+    def draw_debug_overlay(self, lines):
+        """
+        Dibuja líneas de texto de depuración en la esquina inferior izquierda.
+
+        Returns:
+            list: Regiones de pantalla ocupadas por las líneas
+        """
+        if self.font_debug is None:
+            self.font_debug = pygame.font.SysFont('Lucida Sans', 14)
+        line_height = self.font_debug.get_linesize()
+        y = SCREEN_HEIGHT - line_height * len(lines) - 4
+        rects = []
+        for line in lines:
+            rects.append(self.draw_text(line, self.font_debug, YELLOW, 4, y))
+            y += line_height
+        return rects
+
+    def draw_high_score_line(self, high_score, camera):
+        """
+        Dibuja la línea del high score.
+
+        La línea está fija en el mundo a la altura alcanzada por el
+        high score; la vista interpolada de la cámara la lleva a
+        coordenadas de pantalla.
+
+        Returns:
+            pygame.Rect: Región ocupada por la línea, o None si no se ve
+        """
+        line_y = camera.to_view_y(SCROLL_THRESH - high_score)
+        if 0 <= line_y <= SCREEN_HEIGHT:
+            line_rect = pygame.draw.line(self.screen, WHITE, (0, line_y), (SCREEN_WIDTH, line_y), 3)
+            text_rect = self.draw_text('HIGH SCORE', self.font_small, WHITE, SCREEN_WIDTH - 130, line_y)
+            return line_rect.union(text_rect)
+        return None
@@ -0,0 +1,75 @@
+"""
+Modo de bajo consumo para las pantallas estáticas de Jumpy Game.
+
+Las pantallas de inicio, pausa y game over no cambian mientras el
+jugador no haga nada. IdleScheduler guarda una copia ya compuesta de
+cada una y, en lugar de repintar a 60 FPS, bloquea el bucle en
+pygame.event.wait() hasta que llega un evento o vence el tiempo de
+espera. Solo se repinta al entrar en la pantalla o cuando la ventana
+lo necesita (por ejemplo, al volver a mostrarse).
+"""
+
+import pygame
+from game_config import IDLE_MODE, IDLE_WAIT_TIMEOUT_MS
+
+# Eventos tras los cuales la ventana puede necesitar repintarse
+REPAINT_EVENTS = frozenset(
+    getattr(pygame, name) for name in (
+        'VIDEOEXPOSE', 'VIDEORESIZE', 'WINDOWEXPOSED', 'WINDOWSHOWN',
+        'WINDOWRESTORED', 'WINDOWSIZECHANGED', 'WINDOWFOCUSGAINED')
+    if hasattr(pygame, name)
+)
+
+
+class IdleScheduler:
+    """Espera eventos sin consumir CPU y guarda las pantallas ya compuestas."""
+
+    def __init__(self, enabled=IDLE_MODE, timeout_ms=IDLE_WAIT_TIMEOUT_MS):
+        """
+        Inicializa el planificador.
+
+        Args:
+            enabled (bool): Si es False las pantallas estáticas se siguen
+                atendiendo a los FPS normales (pero sin recomponerlas)
+            timeout_ms (int): Máximo tiempo de bloqueo esperando eventos
+        """
+        self.enabled = enabled
+        self.timeout_ms = timeout_ms
+        self.composites = {}
+        self.wakeups = 0
+        self.repaints = 0
+
+    def wait(self):
+        """
+        Bloquea hasta que haya eventos o venza el tiempo de espera.
+
+        Returns:
+            list: Eventos pendientes (vacía si solo venció la espera)
+        """
+        event = pygame.event.wait(self.timeout_ms)
+        self.wakeups += 1
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def store(self, key, surface):
+        """Guarda una copia de la pantalla ya compuesta."""
+        self.composites[key] = surface.copy()
+
+    def needs_repaint(self, events):
+        """Indica si alguno de los eventos obliga a repintar la ventana."""
+        return any(event.type in REPAINT_EVENTS for event in events)
+
+    def repaint(self, key, screen):
+        """
+        Copia la pantalla compuesta a la ventana.
+
+        Returns:
+            bool: False si no hay composición guardada para esa pantalla
+        """
+        composite = self.composites.get(key)
+        if composite is None:
+            return False
+        screen.blit(composite, (0, 0))
+        self.repaints += 1
+        return True
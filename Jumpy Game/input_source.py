@@ -0,0 +1,84 @@
+"""
+Fuentes de entrada para Jumpy Game.
+
+Separa la lectura del teclado de la lógica del jugador para que el
+motor pueda avanzar sin ventana (modo headless) con entradas
+programadas o aleatorias.
+"""
+
+import random
+import pygame
+
+
+class InputState:
+    """Estado de los controles del jugador en un tick."""
+
+    __slots__ = ('left', 'right', 'jump')
+
+    def __init__(self, left=False, right=False, jump=False):
+        self.left = left
+        self.right = right
+        self.jump = jump
+
+
+# Estado sin teclas presionadas (compartido, no debe modificarse)
+NO_INPUT = InputState()
+
+
+class KeyboardInput:
+    """Lee los controles desde el teclado real."""
+
+    def poll(self):
+        """Devuelve el estado actual del teclado."""
+        key = pygame.key.get_pressed()
+        return InputState(key[pygame.K_a], key[pygame.K_d], key[pygame.K_SPACE])
+
+
+class ScriptedInput:
+    """
+    Reproduce una secuencia fija de estados de entrada.
+
+    Cuando la secuencia se agota devuelve NO_INPUT, o vuelve a empezar
+    si loop es True.
+    """
+
+    def __init__(self, states, loop=False):
+        self.states = list(states)
+        self.loop = loop
+        self.index = 0
+
+    def poll(self):
+        """Devuelve el siguiente estado de la secuencia."""
+        if self.index >= len(self.states):
+            if not self.loop or not self.states:
+                return NO_INPUT
+            self.index = 0
+        state = self.states[self.index]
+        self.index += 1
+        return state
+
+
+class RandomInput:
+    """
+    Genera entradas aleatorias sostenidas, útil para pruebas de carga.
+
+    Cada dirección se mantiene durante varios ticks para imitar
+    a un jugador en lugar de cambiar en cada frame.
+    """
+
+    def __init__(self, seed=None, min_hold=5, max_hold=30, jump_chance=0.02):
+        self.rng = random.Random(seed)
+        self.min_hold = min_hold
+        self.max_hold = max_hold
+        self.jump_chance = jump_chance
+        self.hold_ticks = 0
+        self.direction = 0
+
+    def poll(self):
+        """Devuelve un estado aleatorio."""
+        if self.hold_ticks <= 0:
+            self.direction = self.rng.choice([-1, 0, 1])
+            self.hold_ticks = self.rng.randint(self.min_hold, self.max_hold)
+        self.hold_ticks -= 1
+        jump = self.rng.random() < self.jump_chance
+        return InputState(self.direction < 0, self.direction > 0, jump)
@@ -10,25 +10,71 @@ Versión: 2.0
 Fecha: 2024
 """
 
+import argparse
 import pygame
-import random
 import os
 from pygame import mixer
-from spritesheet import SpriteSheet
 from enemy import Enemy
 from game_config import *
+from config import DebugConfig
 from asset_loader import AssetLoader
+from sound_manager import SoundManager
 from game_ui import GameUI
-from game_state import GameState
+from game_state import GameState, seed_argument
 from player import Player
 from platform import Platform
 from powerups import Booster, ExtraLife
+from input_source import KeyboardInput
+from camera import Camera
+from spatial_index import SpatialGroup
+from pool import SpritePool
+from renderer import DirtyRectRenderer
+from idle import IdleScheduler
+from profiler import FrameProfiler
+from spawn_settings import SpawnSettings
+from chunk_generator import PlatformChunkGenerator
+from reachability import JumpEnvelope
+from background import ScrollingBackground
+from replay import ReplayRecorder, ReplayPlayer
+from rewind import RewindBuffer
 
 class JumpyGame:
     """Clase principal del juego."""
 
-    def __init__(self):
-        """Inicializa el juego."""
+    def __init__(self, headless=False, input_source=None, seed=None, record_path=None,
+                 profile=False, spawn=None, rewind=None):
+        """
+        Inicializa el juego.
+
+        Args:
+            headless (bool): Si es True no se abre ventana ni se usa audio
+                real; el mundo se avanza con step() sin límite de FPS
+            input_source: Objeto con método poll() que devuelve un InputState.
+                Por defecto se usa el teclado
+            seed (int, optional): Semilla de la primera partida
+            record_path (str, optional): Archivo donde grabar la repetición
+                de la partida
+            profile (bool): Medir el tiempo de cada fase del frame aunque
+                DebugConfig no lo active
+            spawn (SpawnSettings, optional): Límites y tasas de generación.
+                Por defecto los de game_config
+            rewind (bool, optional): Guardar los últimos segundos para
+                rebobinarlos con R. Por defecto REWIND_ENABLED
+        """
+        self.headless = headless
+        self.spawn = spawn if spawn else SpawnSettings()
+        self.platform_generator = PlatformChunkGenerator(self.spawn.platform_gap,
+                                                         self.spawn.platform_chunk)
+        self.jump_envelope = JumpEnvelope() if REACHABILITY_CHECK else None
+        self.god_mode = DebugConfig.ENABLE_GOD_MODE
+        self.input_source = input_source if input_source else KeyboardInput()
+
+        # En modo headless SDL usa drivers ficticios de video y audio, aunque
+        # el entorno ya pida otros (x11, wayland...)
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
         # Inicializar pygame
         mixer.init()
         pygame.init()
@@ -37,82 +83,189 @@ class JumpyGame:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption('Jumpy Game')
         self.clock = pygame.time.Clock()
+        self.accumulator = 0.0  # Tiempo real aún no simulado (ms)
+
+        # Perfilador de fases y overlay de depuración
+        self.profiler = FrameProfiler(profile or DebugConfig.SHOW_FPS or DebugConfig.ENABLE_PROFILER)
+        self.overlay_lines = []
+        self.overlay_frame = 0
 
         # Inicializar componentes
         self.asset_loader = AssetLoader()
         self.ui = GameUI(self.screen)
-        self.game_state = GameState()
+        self.renderer = DirtyRectRenderer(self.screen)
+        self.idle = IdleScheduler()
+        self.game_state = GameState(persist_high_score=not headless, seed=seed)
+        self.camera = Camera()
 
-        # Cargar assets
-        self.asset_loader.load_all_assets()
+        # Cargar assets en segundo plano; lo que se necesita ya se espera al pedirlo
+        self.asset_loader.start_loading(play_music=not headless)
+        # Los sonidos se limitan con el reloj de la simulación, así una
+        # repetición descarta siempre los mismos sin importar los FPS
+        self.sound_manager = SoundManager(
+            self.asset_loader, clock=lambda: self.game_state.tick * FIXED_TIMESTEP_MS)
+
+        # Fondo pre-repetido en formato de pantalla
+        self.background = ScrollingBackground.from_assets(self.asset_loader, BACKGROUND_LAYERS)
 
         # Configurar icono
         icon = self.asset_loader.get_image('icon')
         if icon:
             pygame.display.set_icon(icon)
 
-        # Crear grupos de sprites
-        self.platform_group = pygame.sprite.Group()
-        self.enemy_group = pygame.sprite.Group()
-        self.booster_group = pygame.sprite.Group()
-        self.extra_life_group = pygame.sprite.Group()
+        # Crear grupos de sprites (indexados por franjas verticales)
+        self.platform_group = SpatialGroup()
+        self.enemy_group = SpatialGroup()
+        self.booster_group = SpatialGroup()
+        self.extra_life_group = SpatialGroup()
+
+        # Las plataformas móviles también van en un grupo propio: con un
+        # bloque entero por delante de la cámara solo se actualizan las
+        # móviles cercanas, no todas las plataformas del mundo
+        self.moving_platform_group = SpatialGroup()
+
+        # Pools de entidades reutilizables
+        self.platform_pool = SpritePool(Platform)
+        self.booster_pool = SpritePool(Booster)
+        self.extra_life_pool = SpritePool(ExtraLife)
+        self.enemy_pool = SpritePool(Enemy)
 
         # Crear jugador
-        self.player = Player(PLAYER_START_X, PLAYER_START_Y, self.asset_loader)
+        self.player = Player(PLAYER_START_X, PLAYER_START_Y, self.asset_loader, self.sound_manager)
 
         # Crear plataforma inicial
         self.create_initial_platform()
 
+        # Buffer de rebobinado (se llena después de cada tick)
+        if rewind is None:
+            rewind = REWIND_ENABLED
+        self.rewind = RewindBuffer() if rewind else None
+        self.rewinding = False
+
+        # Grabación de la partida
+        self.record_path = record_path
+        self.recorder = None
+        if record_path:
+            self.recorder = ReplayRecorder(self.input_source)
+            self.recorder.start(self.game_state.seed)
+            self.input_source = self.recorder
+
+    def save_replay(self):
+        """Guarda la repetición de la partida actual si se está grabando."""
+        if self.recorder:
+            try:
+                self.recorder.save(self.record_path)
+            except IOError as e:
+                print(f"Error guardando repetición {self.record_path}: {e}")
+
     def create_initial_platform(self):
         """Crea la plataforma inicial."""
-        platform = Platform(SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT - 50, 100, False, self.asset_loader)
+        platform = self.platform_pool.acquire(SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT - 50, 100, False,
+                                              self.asset_loader, self.game_state.rng)
         self.platform_group.add(platform)
         self.last_platform = platform
 
     def generate_platforms(self):
-        """Genera nuevas plataformas."""
-        if len(self.platform_group) < MAX_PLATFORMS:
-            p_w = random.randint(40, 60)
-            p_x = random.randint(0, SCREEN_WIDTH - p_w)
-            p_y = self.last_platform.rect.y - random.randint(80, 120)
-            p_type = random.randint(1, 2)
-            p_moving = p_type == 1 and self.game_state.score > MOVING_PLATFORMS_SCORE
-
-            platform = Platform(p_x, p_y, p_w, p_moving, self.asset_loader)
-            self.platform_group.add(platform)
-            self.last_platform = platform
+        """
+        Genera el siguiente bloque de plataformas cuando se acerca a la cámara.
+
+        Mientras la última plataforma siga a más de PLATFORM_LOOKAHEAD
+        píxeles sobre el borde superior de la cámara no se hace nada; si
+        no, se crean juntas todas las plataformas de un bloque.
+        """
+        if self.last_platform.rect.y > self.camera.top - PLATFORM_LOOKAHEAD:
+            self.generate_chunk()
+
+    def generate_chunk(self):
+        """
+        Crea las plataformas (y sus power-ups) de un bloque sorteado.
+
+        Las disposiciones salen ya sorteadas del generador por bloques; aquí
+        solo se aplican los requisitos de score y, si una plataforma no se
+        alcanza desde la anterior, se acerca lo justo. Los requisitos se
+        comparan con la altura de cada plataforma (-y, el score con el que
+        el jugador la ve aparecer arriba), no con el score actual, así no
+        cambian por crear el bloque antes de tiempo.
+        """
+        spawn = self.spawn
+        rng = self.game_state.rng
+        envelope = self.jump_envelope
+        if envelope:
+            max_gap = envelope.double_height if REACHABILITY_DOUBLE_JUMP else envelope.single_height
+        last = self.last_platform
+        for p_x, p_w, p_gap, p_movable, booster_roll, extra_life_roll in \
+                self.platform_generator.next_chunk(rng):
+            if envelope:
+                p_gap = min(p_gap, max_gap)
+            p_y = last.rect.y - p_gap
+            p_moving = p_movable and -p_y > spawn.moving_platforms_score
+            if envelope:
+                p_x = envelope.fit_x(last.rect.x, last.rect.width, p_x, p_w, p_gap,
+                                     p_moving or last.moving, REACHABILITY_DOUBLE_JUMP)
+
+            last = self.platform_pool.acquire(p_x, p_y, p_w, p_moving, self.asset_loader, rng)
+            self.platform_group.add(last)
+            if p_moving:
+                self.moving_platform_group.add(last)
 
             # Generar power-ups
-            self.generate_powerups(p_x, p_y, p_w)
+            self.generate_powerups(p_x, p_y, p_w, booster_roll, extra_life_roll)
+        self.last_platform = last
 
-    def generate_powerups(self, p_x, p_y, p_w):
-        """Genera power-ups en las plataformas."""
+    def generate_powerups(self, p_x, p_y, p_w, booster_roll, extra_life_roll):
+        """
+        Genera power-ups en una plataforma según las tiradas de su disposición.
+
+        Como las plataformas se crean por bloques, el límite de vidas extra
+        cuenta las que quedan a menos de una pantalla de la nueva (las que
+        se verían a la vez), no todas las del mundo.
+        """
         center_x = p_x + p_w // 2
+        spawn = self.spawn
 
         # Generar booster
-        if random.random() < BOOSTER_SPAWN_CHANCE and self.game_state.score > BOOSTER_SCORE:
-            booster = Booster(center_x, p_y - 30, self.asset_loader)
+        if booster_roll < spawn.booster_chance and -p_y > spawn.booster_score:
+            booster = self.booster_pool.acquire(center_x, p_y - 30, self.asset_loader)
             self.booster_group.add(booster)
 
         # Generar vida extra
-        if random.random() < EXTRA_LIFE_SPAWN_CHANCE and len(self.extra_life_group) < 1:
-            extra_life = ExtraLife(center_x, p_y - 60, self.asset_loader)
+        life_y = p_y - 60
+        if extra_life_roll < spawn.extra_life_chance and len(self.extra_life_group.query(
+                life_y - SCREEN_HEIGHT, life_y + SCREEN_HEIGHT)) < spawn.max_extra_lives:
+            extra_life = self.extra_life_pool.acquire(center_x, life_y, self.asset_loader)
             self.extra_life_group.add(extra_life)
 
     def generate_enemies(self):
         """Genera enemigos."""
-        if len(self.enemy_group) == 0 and self.game_state.score > ENEMY_SCORE:
-            bird_image = self.asset_loader.get_image('bird_enemy')
-            if bird_image:
-                bird_sheet = SpriteSheet(bird_image)
-                enemy = Enemy(SCREEN_WIDTH, 100, bird_sheet, 1.5)
-                self.enemy_group.add(enemy)
-
-    def handle_events(self):
-        """Maneja los eventos del juego."""
-        for event in pygame.event.get():
+        spawn = self.spawn
+        frame_bank = self.asset_loader.enemy_frames
+        if not frame_bank or self.game_state.score <= spawn.enemy_score:
+            return
+        rng = self.game_state.rng
+        for _ in range(spawn.enemies_per_tick):
+            if len(self.enemy_group) >= spawn.max_enemies:
+                break
+            screen_y = 100
+            if spawn.enemy_band:
+                screen_y += rng.randint(0, spawn.enemy_band)
+            enemy = self.enemy_pool.acquire(SCREEN_WIDTH, self.camera.to_world_y(screen_y), frame_bank,
+                                            ENEMY_SCALE, rng)
+            self.enemy_group.add(enemy)
+
+    def handle_events(self, events=None):
+        """
+        Maneja los eventos del juego.
+
+        Args:
+            events (list, optional): Eventos a procesar. Por defecto se
+                leen los pendientes de la cola de pygame
+        """
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.game_state.save_high_score()
+                self.save_replay()
                 return False
 
             if event.type == pygame.KEYDOWN:
@@ -122,145 +275,449 @@ class JumpyGame:
                     self.game_state.paused = not self.game_state.paused
                 elif self.game_state.game_over and event.key == pygame.K_SPACE and self.game_state.fade_counter >= SCREEN_WIDTH:
                     self.restart_game()
+                elif event.key == pygame.K_r and self.rewind is not None and not self.game_state.waiting_for_start and not self.game_state.paused:
+                    self.rewinding = True
+
+            if event.type == pygame.KEYUP and event.key == pygame.K_r:
+                self.rewinding = False
 
         return True
 
     def restart_game(self):
         """Reinicia el juego."""
         self.game_state.reset_game()
+        self.camera.reset()
         self.player.reset_position()
 
-        # Limpiar grupos
-        self.enemy_group.empty()
-        self.platform_group.empty()
-        self.booster_group.empty()
-        self.extra_life_group.empty()
+        # Limpiar grupos devolviendo las entidades a sus pools
+        for group in (self.enemy_group, self.platform_group, self.booster_group, self.extra_life_group):
+            for sprite in group.sprites():
+                sprite.kill()
 
         # Crear plataforma inicial
         self.create_initial_platform()
 
+        if self.rewind is not None:
+            self.rewind.clear()
+
+        # Entre partidas se liberan los assets sin uso si se pasó del presupuesto
+        self.asset_loader.evict_unreferenced(ASSET_MEMORY_BUDGET)
+
+        if self.recorder:
+            self.recorder.start(self.game_state.seed)
+
+    def get_pool_stats(self):
+        """
+        Obtiene las estadísticas de los pools de entidades.
+
+        Returns:
+            dict: Estadísticas de cada pool por tipo de entidad
+        """
+        return {
+            'platform': self.platform_pool.get_stats(),
+            'booster': self.booster_pool.get_stats(),
+            'extra_life': self.extra_life_pool.get_stats(),
+            'enemy': self.enemy_pool.get_stats()
+        }
+
     def update_game(self):
-        """Actualiza la lógica del juego."""
+        """Avanza la lógica del juego un tick de duración fija."""
+        profiler = self.profiler
+        self.game_state.tick += 1
+        self.camera.begin_step()
+
         # Actualizar jugador
-        scroll, life_collected = self.player.move(self.platform_group, self.booster_group, self.extra_life_group)
+        controls = self.input_source.poll()
+        scroll, life_collected = self.player.move(self.platform_group, self.booster_group,
+                                                  self.extra_life_group, controls, self.camera)
 
         # Manejar vida extra recolectada
         if life_collected:
             self.game_state.gain_life()
-
-        # Actualizar scroll de fondo
-        self.game_state.bg_scroll += scroll
-        if self.game_state.bg_scroll >= 600:
-            self.game_state.bg_scroll = 0
+        profiler.lap('player')
 
         # Generar contenido
         self.generate_platforms()
         self.generate_enemies()
 
-        # Actualizar sprites
-        self.platform_group.update(scroll)
-        self.booster_group.update(scroll)
-        self.extra_life_group.update(scroll)
-        self.enemy_group.update(scroll, SCREEN_WIDTH)
+        # Desplazar cámara (el contenido nuevo se generó en la vista anterior)
+        self.camera.scroll(scroll)
+        profiler.lap('generation')
+
+        # Actualizar sprites (los power-ups y las plataformas fijas son
+        # estáticos en el mundo). Las plataformas móviles empiezan a moverse
+        # al quedar a PLATFORM_LOOKAHEAD píxeles de la cámara
+        for platform in self.moving_platform_group.query(self.camera.top - PLATFORM_LOOKAHEAD,
+                                                         self.camera.bottom):
+            platform.update()
+        self.enemy_group.update(SCREEN_WIDTH)
+        self.cull_offscreen()
 
         # Actualizar score
         if scroll > 0:
             self.game_state.score += scroll
+        profiler.lap('groups')
 
         # Verificar muerte del jugador
         self.check_player_death()
+        profiler.lap('death')
+
+        # Guardar el tick para poder rebobinarlo
+        if self.rewind is not None:
+            self.rewind.record(self)
+        profiler.lap('rewind')
+
+    def rewind_step(self):
+        """
+        Retrocede REWIND_SPEED ticks con el buffer de rebobinado.
+
+        La fuente de entrada retrocede los mismos ticks si sabe hacerlo:
+        la grabación descarta su entrada y la repetición vuelve a leerla,
+        así ambas siguen coincidiendo con la partida.
+
+        Returns:
+            bool: False si ya no quedan ticks guardados
+        """
+        rewind_input = getattr(self.input_source, 'rewind', None)
+        for _ in range(REWIND_SPEED):
+            if not self.rewind.step_back(self):
+                return False
+            if rewind_input:
+                rewind_input(1)
+        return True
+
+    def cull_offscreen(self):
+        """Elimina las entidades que quedaron bajo el borde inferior de la cámara."""
+        bottom = self.camera.bottom
+        for group in (self.platform_group, self.booster_group, self.extra_life_group):
+            group.cull_below(bottom)
+
+    def play_death_sound(self):
+        """Reproduce el sonido de muerte si está disponible."""
+        self.sound_manager.play('death')
 
     def check_player_death(self):
-        """Verifica si el jugador murió."""
-        death_sound = self.asset_loader.get_sound('death')
+        """
+        Verifica si el jugador murió.
 
+        En modo dios las colisiones se calculan igual, pero no se pierden
+        vidas: al caer el jugador vuelve a la posición inicial y los
+        enemigos lo atraviesan.
+        """
         # Caída de pantalla
-        if self.player.rect.top > SCREEN_HEIGHT:
+        if self.player.rect.top > self.camera.bottom:
+            if self.god_mode:
+                self.player.reset_position(self.camera)
+            elif self.game_state.lose_life():
+                self.play_death_sound()
+            else:
+                self.player.reset_position(self.camera)
+                self.play_death_sound()
+
+        # Colisión con enemigos: primero rect y solo si se cruzan, máscara.
+        # Se consultan solo los de la banda vertical del jugador.
+        player_rect = self.player.rect
+        collided = [enemy for enemy in self.enemy_group.query_rect(player_rect)
+                    if player_rect.colliderect(enemy.rect)
+                    and pygame.sprite.collide_mask(self.player, enemy)]
+        if collided and not self.god_mode:
+            for enemy in collided:
+                enemy.kill()
             if self.game_state.lose_life():
-                if death_sound:
-                    death_sound.play()
+                self.play_death_sound()
             else:
-                self.player.reset_position()
-                if death_sound:
-                    death_sound.play()
-
-        # Colisión con enemigos
-        if pygame.sprite.spritecollide(self.player, self.enemy_group, False):
-            collided = pygame.sprite.spritecollide(self.player, self.enemy_group, True, pygame.sprite.collide_mask)
-            if collided:
-                if self.game_state.lose_life():
-                    if death_sound:
-                        death_sound.play()
-                else:
-                    self.player.rect.center = (SCREEN_WIDTH // 2, self.player.rect.y - 50)
-                    self.player.vel_y = -10
-                    self.player.in_air = True
-                    self.player.has_double_jump = True
-                    if death_sound:
-                        death_sound.play()
-
-    def render_game(self):
-        """Renderiza el juego."""
-        # Dibujar fondo
-        bg_image = self.asset_loader.get_image('background')
-        self.ui.draw_background(bg_image, self.game_state.bg_scroll)
+                self.player.teleport((SCREEN_WIDTH // 2, self.player.rect.y - 50))
+                self.player.vel_y = -10
+                self.player.in_air = True
+                self.player.has_double_jump = True
+                self.play_death_sound()
+
+    def step(self):
+        """
+        Avanza la simulación un tick sin renderizar.
+
+        Returns:
+            bool: False si la partida terminó (game over)
+        """
+        if self.game_state.game_over:
+            return False
+        self.update_game()
+        return not self.game_state.game_over
+
+    def render_game(self, alpha=1.0):
+        """
+        Renderiza el juego.
+
+        Si la cámara no se movió desde el frame anterior solo se restaura
+        el fondo donde había sprites, en lugar de redibujarlo completo.
+
+        Args:
+            alpha (float): Fracción del tick transcurrida desde el último
+                update_game(); las posiciones se interpolan con ella
+        """
+        renderer = self.renderer
+        self.camera.interpolate(alpha)
+        camera_y = self.camera.render_y
+
+        # Dibujar fondo (se desplaza con la cámara)
+        if renderer.begin_frame(camera_y):
+            self.background.draw(self.screen, camera_y)
+        else:
+            for rect in renderer.previous_rects():
+                self.background.draw(self.screen, camera_y, rect)
 
         # Dibujar línea de high score
-        self.ui.draw_high_score_line(self.game_state.score, self.game_state.high_score)
+        line_rect = self.ui.draw_high_score_line(self.game_state.high_score, self.camera)
+        renderer.mark(line_rect, 'high_score')
+
+        # Dibujar sprites con el desplazamiento de cámara
+        self.camera.draw_group(renderer, self.platform_group)
+        self.camera.draw_group(renderer, self.enemy_group)
+        self.camera.draw_group(renderer, self.booster_group)
+        self.camera.draw_group(renderer, self.extra_life_group)
+        self.player.draw(renderer, self.camera)
 
-        # Dibujar sprites
-        self.platform_group.draw(self.screen)
-        self.enemy_group.draw(self.screen)
-        self.booster_group.draw(self.screen)
-        self.extra_life_group.draw(self.screen)
-        self.player.draw(self.screen)
+        if DebugConfig.SHOW_COLLISION_BOXES:
+            self.draw_collision_boxes()
 
         # Dibujar UI
-        self.ui.draw_panel(self.game_state.score, self.game_state.lives)
+        panel = (self.game_state.score, self.game_state.lives)
+        for rect in self.ui.draw_panel(*panel):
+            renderer.mark(rect, panel)
+
+        if DebugConfig.SHOW_FPS:
+            self.draw_profiler_overlay()
+
+    def draw_collision_boxes(self):
+        """Dibuja los rectángulos de colisión de las entidades visibles."""
+        camera = self.camera
+        top = camera.render_y
+        boxes = [(self.player.rect, DebugConfig.DEBUG_COLLISION_COLOR)]
+        for group, color in ((self.platform_group, DebugConfig.DEBUG_PLATFORM_COLOR),
+                             (self.enemy_group, DebugConfig.DEBUG_COLLISION_COLOR),
+                             (self.booster_group, DebugConfig.DEBUG_POWERUP_COLOR),
+                             (self.extra_life_group, DebugConfig.DEBUG_POWERUP_COLOR)):
+            boxes.extend((sprite.rect, color) for sprite in group.query(camera.top, camera.bottom))
+        for rect, color in boxes:
+            drawn = pygame.draw.rect(self.screen, color, rect.move(0, -top), 1)
+            self.renderer.mark(drawn, color)
+
+    def draw_profiler_overlay(self):
+        """Dibuja los FPS y los percentiles por fase del perfilador."""
+        profiler = self.profiler
+        if not self.overlay_lines or profiler.frames - self.overlay_frame >= PROFILER_OVERLAY_INTERVAL:
+            self.overlay_lines = profiler.overlay_lines(self.clock.get_fps())
+            stats = self.sound_manager.get_stats()
+            self.overlay_lines.append(f"sonidos {stats['played']} / descartados {stats['dropped']}"
+                                      f" / reemplazados {stats['stolen']}")
+            self.overlay_frame = profiler.frames
+        lines = tuple(self.overlay_lines)
+        for rect in self.ui.draw_debug_overlay(lines):
+            self.renderer.mark(rect, lines)
+
+    def is_idle_screen(self):
+        """Indica si se muestra una pantalla estática (inicio, pausa o game over)."""
+        state = self.game_state
+        if self.rewinding:
+            return False
+        if state.waiting_for_start and self.asset_loader.pending:
+            # La barra de carga se sigue actualizando
+            return False
+        if state.waiting_for_start or state.paused:
+            return True
+        return state.game_over and state.fade_counter >= SCREEN_WIDTH
+
+    def present_idle_screen(self, key, draw, events):
+        """
+        Muestra una pantalla estática.
+
+        Al entrar se dibuja una vez y se guarda la composición; después
+        solo se vuelve a copiar si la ventana necesita repintarse.
+
+        Args:
+            key (str): Nombre de la pantalla
+            draw (callable): Función que dibuja la pantalla completa
+            events (list): Eventos recibidos en esta iteración
+        """
+        if self.renderer.set_mode(key):
+            draw()
+            self.idle.store(key, self.screen)
+            self.renderer.present()
+        elif self.idle.needs_repaint(events) and self.idle.repaint(key, self.screen):
+            self.renderer.present()
+
+    def present_loading_screen(self):
+        """
+        Muestra la pantalla de inicio con el avance de la carga de assets.
+
+        Cuando la carga termina se libera el pool de hilos y la pantalla
+        pasa a dibujarse sin la barra.
+        """
+        if self.asset_loader.is_loaded():
+            self.asset_loader.wait_all()
+            self.asset_loader.evict_unreferenced(ASSET_MEMORY_BUDGET)
+            return
+        if self.renderer.set_mode('loading'):
+            self.ui.draw_start_screen()
+            self.renderer.present()
+        rect = self.ui.draw_loading_bar(self.asset_loader.get_progress())
+        self.renderer.present([rect])
+
+    def draw_pause(self):
+        """Dibuja el juego congelado con la capa de pausa."""
+        self.render_game(self.camera.render_alpha)
+        self.ui.draw_pause_screen()
+
+    def advance_clock(self, frame_ms):
+        """
+        Acumula el tiempo real de un frame y calcula cuántos ticks simular.
+
+        Args:
+            frame_ms (int): Milisegundos transcurridos desde el frame anterior
+
+        Returns:
+            int: Ticks de FIXED_TIMESTEP_MS que hay que simular
+        """
+        self.accumulator += min(frame_ms, MAX_FRAME_TIME_MS)
+        steps = int(self.accumulator // FIXED_TIMESTEP_MS)
+        self.accumulator -= steps * FIXED_TIMESTEP_MS
+        return steps
 
     def run(self):
-        """Ejecuta el bucle principal del juego."""
+        """
+        Ejecuta el bucle principal del juego.
+
+        La simulación avanza en ticks fijos de FIXED_TIMESTEP_MS sin
+        importar a cuántos FPS se dibuje: un frame lento ejecuta varios
+        ticks y uno rápido ninguno, y el dibujo interpola con el tiempo
+        sobrante para que el movimiento se vea continuo.
+        """
         running = True
+        renderer = self.renderer
+        profiler = self.profiler
 
         while running:
-            self.clock.tick(FPS)
+            # En pantallas estáticas se bloquea esperando eventos
+            if self.idle.enabled and self.is_idle_screen():
+                events = self.idle.wait()
+                frame_ms = self.clock.tick()
+                profiler.begin_frame()
+            else:
+                frame_ms = self.clock.tick(RENDER_FPS)
+                profiler.begin_frame()
+                events = pygame.event.get()
 
             # Manejar eventos
-            running = self.handle_events()
+            running = self.handle_events(events)
             if not running:
                 break
+            profiler.lap('events')
 
-            # Pantalla de inicio
+            # Pantalla de inicio (con la barra de carga mientras haya assets pendientes)
             if self.game_state.waiting_for_start:
-                self.ui.draw_start_screen()
-                pygame.display.update()
+                if self.asset_loader.pending:
+                    self.present_loading_screen()
+                if not self.asset_loader.pending:
+                    self.present_idle_screen('start', self.ui.draw_start_screen, events)
                 continue
 
             # Pausa
             if self.game_state.paused:
-                self.render_game()
-                self.ui.draw_pause_screen()
-                pygame.display.update()
+                self.present_idle_screen('pause', self.draw_pause, events)
                 continue
 
-            # Juego activo
-            if not self.game_state.game_over:
-                self.update_game()
-                self.render_game()
-            else:
-                # Game over
-                self.ui.draw_game_over(self.game_state.score, self.game_state.fade_counter)
-                self.game_state.fade_counter += 5
+            # Juego activo (o rebobinado, que también sale del game over)
+            rewinding = self.rewinding and len(self.rewind) > 0
+            if not self.game_state.game_over or rewinding:
+                if renderer.set_mode('game'):
+                    # Al empezar o volver de la pausa no se recupera el
+                    # tiempo de espera: se simula un solo tick
+                    self.accumulator = 0.0
+                    steps = 1
+                else:
+                    steps = self.advance_clock(frame_ms)
+                for _ in range(steps):
+                    if rewinding:
+                        # Con R presionada no se simula: al llegar al tick
+                        # más viejo el juego queda detenido en él
+                        self.rewind_step()
+                        profiler.lap('rewind')
+                        continue
+                    self.update_game()
+                    if self.game_state.game_over:
+                        self.save_replay()
+                        break
+                self.render_game(self.accumulator / FIXED_TIMESTEP_MS)
+                profiler.lap('render')
+                renderer.present_frame()
+                profiler.lap('display')
+                profiler.end_frame()
+            elif self.game_state.fade_counter < SCREEN_WIDTH:
+                # Transición de game over (avanza por ticks, como el juego)
+                renderer.set_mode('game_over')
+                rects = self.ui.draw_game_over(self.game_state.score, self.game_state.fade_counter)
+                renderer.present(rects)
+                self.game_state.fade_counter += 5 * self.advance_clock(frame_ms)
                 self.game_state.save_high_score()
-
-            pygame.display.update()
-
+            else:
+                # Pantalla final de game over
+                score = self.game_state.score
+                self.present_idle_screen(
+                    'game_over_idle',
+                    lambda: self.ui.draw_game_over(score, self.game_state.fade_counter),
+                    events)
+
+        if DebugConfig.ENABLE_DEBUG_PRINT:
+            self.print_debug_stats()
+        if profiler.enabled and profiler.dump_csv(PROFILER_CSV_FILE):
+            print(f"Perfil de frames guardado en {PROFILER_CSV_FILE}")
+        self.close()
         pygame.quit()
 
+    def close(self):
+        """
+        Termina las cargas de assets pendientes y libera el pool de hilos.
+
+        run() lo llama al salir; las simulaciones headless, que no usan
+        run(), deben llamarlo al terminar.
+        """
+        self.asset_loader.wait_all()
+
+    def print_debug_stats(self):
+        """Muestra en consola las estadísticas de cachés, pools y renderizado."""
+        text = self.ui.get_text_cache_stats()
+        scaled = self.asset_loader.get_scaled_cache_stats()
+        assets = self.asset_loader.get_asset_count()
+        print(f"Caché de texto: {text['hit_rate']:.1%} aciertos "
+              f"({text['hits']} aciertos, {text['misses']} fallos, {text['size']} entradas)")
+        print(f"Caché de imágenes escaladas: {scaled['hit_rate']:.1%} aciertos "
+              f"({scaled['hits']} aciertos, {scaled['misses']} fallos, {scaled['size']} entradas)")
+        print(f"Assets: {assets['images']} imágenes, {assets['sounds']} sonidos, "
+              f"{assets['total_bytes'] / 1024:.0f} KB ({assets['referenced']} retenidos, "
+              f"{assets['evictions']} liberados)")
+        print(f"Pools: {self.get_pool_stats()}")
+        print(f"Frames: {self.renderer.get_stats()}")
+
 def main():
     """Función principal."""
+    parser = argparse.ArgumentParser(description='Jumpy Game')
+    parser.add_argument('--seed', type=seed_argument, default=None, help='Semilla de la partida')
+    parser.add_argument('--record', metavar='ARCHIVO', help='Grabar la partida en una repetición')
+    parser.add_argument('--replay', metavar='ARCHIVO', help='Reproducir una repetición grabada')
+    parser.add_argument('--profile', action='store_true',
+                        help='Medir el tiempo de cada fase y exportarlo a CSV al salir')
+    parser.add_argument('--rewind', action='store_true',
+                        help='Permitir rebobinar los últimos segundos manteniendo R')
+    args = parser.parse_args()
+
     try:
-        game = JumpyGame()
+        if args.replay:
+            replay = ReplayPlayer.load(args.replay)
+            game = JumpyGame(input_source=replay, seed=replay.seed, profile=args.profile)
+            game.game_state.waiting_for_start = False
+        else:
+            game = JumpyGame(seed=args.seed, record_path=args.record, profile=args.profile,
+                             rewind=args.rewind or None)
         game.run()
     except Exception as e:
         print(f"Error ejecutando el juego: {e}")
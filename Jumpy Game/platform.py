@@ -1,45 +1,52 @@
-"""
-Clase Platform para Jumpy Game.
-Maneja las plataformas del juego.
-"""
-
-import pygame
-import random
-from game_config import *
-
-
-class Platform(pygame.sprite.Sprite):
-    """Clase que representa una plataforma."""
-
-    def __init__(self, x, y, width, moving, asset_loader):
-        pygame.sprite.Sprite.__init__(self)
-
-        platform_image = asset_loader.get_image('platform')
-        if platform_image:
-            self.image = pygame.transform.scale(platform_image, (width, 10))
-        else:
-            self.image = pygame.Surface((width, 10))
-            self.image.fill((139, 69, 19))  # Marrón
-
-        self.moving = moving
-        self.move_counter = random.randint(0, 50)
-        self.direction = random.choice([-1, 1])
-        self.speed = random.randint(1, 2)
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
-
-    def update(self, scroll):
-        """Actualiza la plataforma."""
-        if self.moving:
-            self.move_counter += 1
-            self.rect.x += self.direction * self.speed
-
-        if self.move_counter >= 100 or self.rect.left < 0 or self.rect.right > SCREEN_WIDTH:
-            self.direction *= -1
-            self.move_counter = 0
-
-        self.rect.y += scroll
-
-        if self.rect.top > SCREEN_HEIGHT:
-            self.kill()
+"""
+Clase Platform para Jumpy Game.
+Maneja las plataformas del juego.
+"""
+
+import pygame
+import random
+from game_config import *
+from pool import PooledSprite
+
+
+class Platform(PooledSprite):
+    """Clase que representa una plataforma."""
+
+    def __init__(self, x, y, width, moving, asset_loader, rng=random):
+        pygame.sprite.Sprite.__init__(self)
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, width, moving, asset_loader, rng)
+
+    def reset(self, x, y, width, moving, asset_loader, rng=random):
+        """Reinicializa la plataforma (también al reutilizarla desde el pool)."""
+        platform_image = asset_loader.get_scaled('platform', (width, PLATFORM_HEIGHT))
+        if platform_image:
+            self.image = platform_image
+        else:
+            self.image = pygame.Surface((width, PLATFORM_HEIGHT))
+            self.image.fill((139, 69, 19))  # Marrón
+
+        self.moving = moving
+        self.move_counter = rng.randint(0, 50)
+        self.direction = rng.choice([-1, 1])
+        self.speed = rng.randint(1, PLATFORM_MAX_SPEED)
+        self.rect.size = self.image.get_size()
+        self.rect.x = x
+        self.rect.y = y
+        self.prev_x = x
+
+    def update(self):
+        """
+        Actualiza la plataforma.
+
+        La posición vertical está en coordenadas de mundo y no cambia con
+        el scroll; las plataformas fuera de cámara se eliminan desde el juego.
+        """
+        self.prev_x = self.rect.x
+        if self.moving:
+            self.move_counter += 1
+            self.rect.x += self.direction * self.speed
+
+        if self.move_counter >= 100 or self.rect.left < 0 or self.rect.right > SCREEN_WIDTH:
+            self.direction *= -1
+            self.move_counter = 0
@@ -1,144 +1,189 @@
-"""
-Clase Player para Jumpy Game.
-Maneja toda la lógica del jugador.
-"""
-
-import pygame
-from game_config import *
-
-
-class Player:
-    """Clase que representa al jugador (abeja)."""
-
-    def __init__(self, x, y, asset_loader):
-        # Configuración de imagen
-        self.image_width = PLAYER_IMAGE_SIZE[0]
-        self.image_height = PLAYER_IMAGE_SIZE[1]
-
-        # Cargar imágenes del jugador
-        self.bee_images = {
-            'left': asset_loader.get_image('player_left'),
-            'right': asset_loader.get_image('player_right')
-        }
-
-        # Estado visual
-        self.current_direction = 'right'
-        self.image = self.bee_images[self.current_direction]
-
-        # Configuración de colisión
-        self.collision_width = int(self.image_width * PLAYER_COLLISION_SCALE)
-        self.collision_height = int(self.image_height * PLAYER_COLLISION_SCALE)
-        self.rect = pygame.Rect(0, 0, self.collision_width, self.collision_height)
-        self.rect.center = (x, y)
-
-        # Estado de movimiento
-        self.vel_y = 0
-        self.in_air = True
-        self.has_double_jump = False
-        self.can_auto_jump = True
-        self.current_jump_vel = INITIAL_JUMP_VEL
-
-        # Referencias a sonidos
-        self.jump_sound = asset_loader.get_sound('jump')
-        self.boost_sound = asset_loader.get_sound('boost')
-        self.extra_life_sound = asset_loader.get_sound('extra_life')
-
-    def move(self, platform_group, booster_group, extra_life_group):
-        """Actualiza el movimiento del jugador."""
-        scroll = 0
-        dx = 0
-        dy = 0
-
-        key = pygame.key.get_pressed()
-
-        # Movimiento horizontal
-        if key[pygame.K_a]:
-            dx = -PLAYER_SPEED
-            self.current_direction = 'left'
-        if key[pygame.K_d]:
-            dx = PLAYER_SPEED
-            self.current_direction = 'right'
-
-        # Salto automático
-        if not self.in_air and self.can_auto_jump:
-            self.vel_y = self.current_jump_vel
-            if self.jump_sound:
-                self.jump_sound.play()
-            self.in_air = True
-            self.can_auto_jump = False
-
-        # Doble salto
-        if key[pygame.K_SPACE] and self.in_air and self.has_double_jump:
-            self.vel_y = self.current_jump_vel
-            if self.jump_sound:
-                self.jump_sound.play()
-            self.has_double_jump = False
-
-        # Aplicar gravedad
-        self.vel_y += GRAVITY
-        dy += self.vel_y
-
-        # Límites de pantalla
-        if self.rect.left + dx < 0:
-            dx = -self.rect.left
-        if self.rect.right + dx > SCREEN_WIDTH:
-            dx = SCREEN_WIDTH - self.rect.right
-
-        # Colisión con plataformas
-        self.in_air = True
-        for platform in platform_group:
-            if platform.rect.colliderect(self.rect.x, self.rect.y + dy, self.collision_width, self.collision_height):
-                if self.vel_y > 0:
-                    self.rect.bottom = platform.rect.top
-                    dy = 0
-                    self.in_air = False
-                    self.can_auto_jump = True
-                    self.current_jump_vel = INITIAL_JUMP_VEL
-                    self.has_double_jump = True
-
-        # Scroll de pantalla
-        if self.rect.top <= SCROLL_THRESH:
-            if self.vel_y < 0:
-                scroll = -dy
-
-        # Recolectar boosters
-        for booster in booster_group:
-            if self.rect.colliderect(booster.rect):
-                self.vel_y = BOOST_JUMP_VEL
-                self.current_jump_vel = BOOST_JUMP_VEL
-                self.in_air = True
-                if self.boost_sound:
-                    self.boost_sound.play()
-                booster.kill()
-
-        # Recolectar vidas extra
-        for extra_life in extra_life_group:
-            if self.rect.colliderect(extra_life.rect):
-                if self.extra_life_sound:
-                    self.extra_life_sound.play()
-                extra_life.kill()
-                return scroll, True  # Indica que se recolectó una vida
-
-        # Actualizar posición
-        self.image = self.bee_images[self.current_direction]
-        self.rect.x += dx
-        self.rect.y += dy + scroll
-
-        return scroll, False
-
-    def draw(self, screen):
-        """Dibuja el jugador en la pantalla."""
-        if self.image:
-            draw_x = self.rect.x - (self.image_width - self.collision_width) // 2
-            draw_y = self.rect.y - (self.image_height - self.collision_height) // 2
-            screen.blit(self.image, (draw_x, draw_y))
-            self.mask = pygame.mask.from_surface(self.image)
-
-    def reset_position(self):
-        """Reinicia la posición del jugador."""
-        self.rect.center = (PLAYER_START_X, PLAYER_START_Y)
-        self.vel_y = 0
-        self.in_air = False
-        self.can_auto_jump = True
-        self.has_double_jump = True
-        self.current_jump_vel = INITIAL_JUMP_VEL
+"""
+Clase Player para Jumpy Game.
+Maneja toda la lógica del jugador.
+"""
+
+import pygame
+from game_config import *
+
+
+class Player:
+    """Clase que representa al jugador (abeja)."""
+
+    def __init__(self, x, y, asset_loader, sound_manager=None):
+        # Configuración de imagen
+        self.image_width = PLAYER_IMAGE_SIZE[0]
+        self.image_height = PLAYER_IMAGE_SIZE[1]
+
+        # Cargar imágenes del jugador (retenidas mientras exista el jugador)
+        self.bee_images = {
+            'left': asset_loader.acquire('player_left'),
+            'right': asset_loader.acquire('player_right')
+        }
+
+        # Máscaras de colisión precalculadas para cada imagen
+        self.bee_masks = {
+            direction: pygame.mask.from_surface(image)
+            for direction, image in self.bee_images.items() if image
+        }
+
+        # Estado visual
+        self.current_direction = 'right'
+        self.image = self.bee_images[self.current_direction]
+        self.mask = self.bee_masks.get(self.current_direction)
+
+        # Configuración de colisión
+        self.collision_width = int(self.image_width * PLAYER_COLLISION_SCALE)
+        self.collision_height = int(self.image_height * PLAYER_COLLISION_SCALE)
+        self.rect = pygame.Rect(0, 0, self.collision_width, self.collision_height)
+        self.rect.center = (x, y)
+
+        # Posición al inicio del último tick, para interpolar al dibujar
+        self.prev_x = self.rect.x
+        self.prev_y = self.rect.y
+
+        # Estado de movimiento
+        self.vel_y = 0
+        self.in_air = True
+        self.has_double_jump = False
+        self.can_auto_jump = True
+        self.current_jump_vel = INITIAL_JUMP_VEL
+
+        # Sonidos (se piden al reproducirlos: pueden seguir cargándose)
+        self.sound_manager = sound_manager
+
+    def move(self, platform_group, booster_group, extra_life_group, controls, camera):
+        """
+        Actualiza el movimiento del jugador.
+
+        La posición del jugador está en coordenadas de mundo; el scroll
+        devuelto es lo que debe desplazarse la cámara. Los grupos deben ser
+        SpatialGroup: solo se prueban las entidades de la banda vertical
+        del jugador.
+
+        Args:
+            controls (InputState): Estado de los controles en este tick
+            camera (Camera): Cámara actual, para decidir el scroll
+        """
+        self.prev_x = self.rect.x
+        self.prev_y = self.rect.y
+        scroll = 0
+        dx = 0
+        dy = 0
+
+        # Movimiento horizontal
+        if controls.left:
+            dx = -PLAYER_SPEED
+            self.current_direction = 'left'
+        if controls.right:
+            dx = PLAYER_SPEED
+            self.current_direction = 'right'
+
+        # Salto automático
+        if not self.in_air and self.can_auto_jump:
+            self.vel_y = self.current_jump_vel
+            self.play_sound('jump')
+            self.in_air = True
+            self.can_auto_jump = False
+
+        # Doble salto
+        if controls.jump and self.in_air and self.has_double_jump:
+            self.vel_y = self.current_jump_vel
+            self.play_sound('jump')
+            self.has_double_jump = False
+
+        # Aplicar gravedad
+        self.vel_y += GRAVITY
+        dy += self.vel_y
+
+        # Límites de pantalla
+        if self.rect.left + dx < 0:
+            dx = -self.rect.left
+        if self.rect.right + dx > SCREEN_WIDTH:
+            dx = SCREEN_WIDTH - self.rect.right
+
+        # Colisión con plataformas
+        self.in_air = True
+        next_top = self.rect.y + dy
+        for platform in platform_group.query(next_top, next_top + self.collision_height):
+            if platform.rect.colliderect(self.rect.x, next_top, self.collision_width, self.collision_height):
+                if self.vel_y > 0:
+                    self.rect.bottom = platform.rect.top
+                    dy = 0
+                    self.in_air = False
+                    self.can_auto_jump = True
+                    self.current_jump_vel = INITIAL_JUMP_VEL
+                    self.has_double_jump = True
+
+        # Scroll de pantalla
+        if self.rect.top - camera.y <= SCROLL_THRESH:
+            if self.vel_y < 0:
+                scroll = -dy
+
+        # Recolectar boosters
+        for booster in booster_group.query_rect(self.rect):
+            if self.rect.colliderect(booster.rect):
+                self.vel_y = BOOST_JUMP_VEL
+                self.current_jump_vel = BOOST_JUMP_VEL
+                self.in_air = True
+                self.play_sound('boost')
+                booster.kill()
+
+        # Recolectar vidas extra
+        life_collected = False
+        for extra_life in extra_life_group.query_rect(self.rect):
+            if self.rect.colliderect(extra_life.rect):
+                self.play_sound('extra_life')
+                extra_life.kill()
+                life_collected = True
+                break
+
+        # Actualizar posición
+        self.image = self.bee_images[self.current_direction]
+        self.mask = self.bee_masks.get(self.current_direction)
+        self.rect.x += dx
+        self.rect.y += dy
+
+        return scroll, life_collected
+
+    def play_sound(self, name):
+        """Reproduce un sonido del jugador si hay administrador de sonido."""
+        if self.sound_manager:
+            self.sound_manager.play(name)
+
+    def draw(self, screen, camera):
+        """Dibuja el jugador en la pantalla, interpolado entre el tick anterior y el actual."""
+        if self.image:
+            alpha = camera.render_alpha
+            x = self.prev_x + round((self.rect.x - self.prev_x) * alpha)
+            y = self.prev_y + round((self.rect.y - self.prev_y) * alpha)
+            draw_x = x - (self.image_width - self.collision_width) // 2
+            draw_y = y - camera.render_y - (self.image_height - self.collision_height) // 2
+            screen.blit(self.image, (draw_x, draw_y))
+
+    def teleport(self, center):
+        """
+        Mueve al jugador sin interpolar el dibujo desde la posición anterior.
+
+        Args:
+            center (tuple): Nuevo centro del rectángulo de colisión
+        """
+        self.rect.center = center
+        self.prev_x = self.rect.x
+        self.prev_y = self.rect.y
+
+    def reset_position(self, camera=None):
+        """
+        Reinicia la posición del jugador.
+
+        Args:
+            camera (Camera, optional): Si se indica, la posición inicial
+                se toma relativa a la vista actual
+        """
+        camera_y = camera.y if camera else 0
+        self.teleport((PLAYER_START_X, PLAYER_START_Y + camera_y))
+        self.vel_y = 0
+        self.in_air = False
+        self.can_auto_jump = True
+        self.has_double_jump = True
+        self.current_jump_vel = INITIAL_JUMP_VEL
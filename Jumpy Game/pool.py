@@ -0,0 +1,93 @@
+"""
+Pools de sprites para Jumpy Game.
+
+Las plataformas, power-ups y enemigos se crean y destruyen sin parar en
+una partida larga. En lugar de construir un sprite nuevo en cada spawn,
+SpritePool reutiliza los que fueron eliminados con kill(): al volver a
+pedirlos se reinicializan con reset(), conservando su rect y
+compartiendo las imágenes de las cachés.
+"""
+
+from abc import ABCMeta, abstractmethod
+import pygame
+
+
+class PooledSprite(pygame.sprite.Sprite, metaclass=ABCMeta):
+    """
+    Sprite que vuelve a su pool al ser eliminado con kill().
+
+    Las subclases deben implementar reset() con los mismos argumentos
+    que su constructor; una subclase sin reset() no se puede instanciar.
+    """
+
+    pool = None
+
+    def kill(self):
+        """Quita el sprite de sus grupos y lo devuelve a su pool."""
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+    @abstractmethod
+    def reset(self, *args):
+        """Reinicializa el sprite para reutilizarlo."""
+
+
+class SpritePool:
+    """Pool de sprites reutilizables de una clase."""
+
+    def __init__(self, sprite_class):
+        """
+        Inicializa el pool.
+
+        Args:
+            sprite_class (type): Subclase de PooledSprite que se reutiliza
+        """
+        self.sprite_class = sprite_class
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+
+    def acquire(self, *args):
+        """
+        Obtiene un sprite inicializado con los argumentos dados.
+
+        Reutiliza uno libre si hay; si no, construye uno nuevo.
+
+        Returns:
+            PooledSprite: Sprite listo para agregarse a un grupo
+        """
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            self.reused += 1
+        else:
+            sprite = self.sprite_class(*args)
+            sprite.pool = self
+            self.created += 1
+        sprite.in_pool = False
+        return sprite
+
+    def release(self, sprite):
+        """Devuelve un sprite al pool (ignora devoluciones repetidas)."""
+        if getattr(sprite, 'in_pool', False):
+            return
+        sprite.in_pool = True
+        self.free.append(sprite)
+        self.released += 1
+
+    def get_stats(self):
+        """
+        Obtiene las estadísticas del pool.
+
+        Returns:
+            dict: Sprites creados, reutilizados, devueltos, libres y en uso
+        """
+        return {
+            'created': self.created,
+            'reused': self.reused,
+            'released': self.released,
+            'free': len(self.free),
+            'in_use': self.created - len(self.free)
+        }
@@ -0,0 +1,173 @@
+"""
+Perfilador de tiempos por fase para Jumpy Game.
+
+Mide cuánto tarda cada fase de un frame (eventos, movimiento del jugador,
+generación, actualización de grupos, muertes, grabación del rebobinado,
+dibujo y envío a la ventana) y guarda los últimos frames en un buffer
+circular. Con esos datos se calculan los percentiles p50/p95/p99 del
+overlay y, al salir, se exporta el buffer completo a CSV.
+
+Las fases se miden por vueltas: lap(fase) suma a esa fase el tiempo
+transcurrido desde la vuelta anterior, así el código del juego solo
+necesita una llamada al final de cada tramo. Desactivado, lap() vuelve
+de inmediato.
+"""
+
+import csv
+import time
+from array import array
+from game_config import PROFILER_CAPACITY
+
+# Fases medidas, en el orden en que ocurren dentro de un frame
+PROFILE_PHASES = ('events', 'player', 'generation', 'groups', 'death', 'rewind', 'render',
+                  'display')
+
+# Columna con la duración total del frame
+FRAME_TOTAL = 'total'
+
+
+def percentile(sorted_values, fraction):
+    """
+    Percentil por rango más cercano de una lista ya ordenada.
+
+    Args:
+        sorted_values (list): Valores ordenados de menor a mayor
+        fraction (float): Percentil entre 0 y 1
+
+    Returns:
+        float: Valor del percentil (0.0 si no hay valores)
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """Tiempos por fase de los últimos frames en un buffer circular."""
+
+    def __init__(self, enabled=False, capacity=PROFILER_CAPACITY):
+        """
+        Inicializa el perfilador.
+
+        Args:
+            enabled (bool): Si es False no se mide nada
+            capacity (int): Cantidad de frames que guarda el buffer
+        """
+        self.enabled = enabled
+        self.capacity = capacity
+        self.columns = PROFILE_PHASES + (FRAME_TOTAL,)
+
+        # Un buffer circular de milisegundos por columna
+        self.samples = {name: array('d', bytes(8 * capacity)) for name in self.columns}
+        self.index = 0
+        self.count = 0
+        self.frames = 0
+
+        # Frame en curso
+        self.row = dict.fromkeys(PROFILE_PHASES, 0.0)
+        self.frame_start = 0.0
+        self.last = 0.0
+
+    def begin_frame(self):
+        """Comienza a medir un frame nuevo (descarta el que no se cerró)."""
+        if not self.enabled:
+            return
+        row = self.row
+        for phase in row:
+            row[phase] = 0.0
+        self.frame_start = self.last = time.perf_counter()
+
+    def lap(self, phase):
+        """Suma a la fase el tiempo transcurrido desde la vuelta anterior."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.row[phase] += (now - self.last) * 1000.0
+        self.last = now
+
+    def end_frame(self):
+        """Guarda el frame en curso en el buffer circular."""
+        if not self.enabled:
+            return
+        index = self.index
+        samples = self.samples
+        for phase, value in self.row.items():
+            samples[phase][index] = value
+        samples[FRAME_TOTAL][index] = (time.perf_counter() - self.frame_start) * 1000.0
+
+        self.index = (index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.frames += 1
+
+    def values(self, name):
+        """
+        Obtiene los valores guardados de una columna, del más viejo al más nuevo.
+
+        Args:
+            name (str): Fase o FRAME_TOTAL
+
+        Returns:
+            list: Milisegundos por frame
+        """
+        column = self.samples[name]
+        if self.count < self.capacity:
+            return column[:self.count].tolist()
+        return column[self.index:].tolist() + column[:self.index].tolist()
+
+    def get_percentiles(self):
+        """
+        Calcula p50, p95 y p99 de cada columna.
+
+        Returns:
+            dict: Columna -> (p50, p95, p99) en milisegundos
+        """
+        result = {}
+        for name in self.columns:
+            ordered = sorted(self.values(name))
+            result[name] = (percentile(ordered, 0.50), percentile(ordered, 0.95),
+                            percentile(ordered, 0.99))
+        return result
+
+    def overlay_lines(self, fps=None):
+        """
+        Genera las líneas de texto del overlay.
+
+        Args:
+            fps (float, optional): FPS medidos por el reloj del juego
+
+        Returns:
+            list: Líneas "fase p50/p95/p99" en milisegundos
+        """
+        lines = []
+        if fps is not None:
+            lines.append(f'FPS {fps:.0f}')
+        lines.append('ms   p50 / p95 / p99')
+        for name, (p50, p95, p99) in self.get_percentiles().items():
+            lines.append(f'{name}: {p50:.2f} / {p95:.2f} / {p99:.2f}')
+        return lines
+
+    def dump_csv(self, path):
+        """
+        Exporta el buffer a CSV (una fila por frame, del más viejo al más nuevo).
+
+        Args:
+            path (str): Ruta del archivo de salida
+
+        Returns:
+            bool: True si se escribió el archivo
+        """
+        if not self.count:
+            return False
+        columns = [self.values(name) for name in self.columns]
+        first = self.frames - self.count
+        try:
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(('frame',) + tuple(f'{name}_ms' for name in self.columns))
+                for offset, row in enumerate(zip(*columns)):
+                    writer.writerow([first + offset] + [f'{value:.4f}' for value in row])
+        except IOError as e:
+            print(f"Error guardando perfil {path}: {e}")
+            return False
+        return True
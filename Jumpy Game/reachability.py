@@ -0,0 +1,278 @@
+"""
+Alcance de salto y validación de plataformas para Jumpy Game.
+
+La física del jugador es discreta (gravedad y velocidad enteras por tick),
+así que el alcance se calcula una sola vez simulando los saltos posibles:
+para cada altura dy (cuánto más arriba está la plataforma destino) la
+tabla guarda cuántos ticks puede moverse en horizontal el jugador antes de
+aterrizar en ella, con un salto o usando además el doble salto en el mejor
+momento. El alcance horizontal es esa cantidad de ticks por PLAYER_SPEED;
+si alguna de las plataformas se mueve se descuenta lo que puede alejarse
+la destino mientras el jugador está en el aire.
+
+El generador de JumpyGame consulta la tabla al crear cada plataforma y, si
+no se puede alcanzar desde la anterior, la acerca lo justo. El modo masivo
+valida millones de disposiciones con NumPy para ajustar la dificultad.
+
+Uso:
+    python reachability.py --layouts 5000000
+    python reachability.py --gap 100,180 --double-jump
+"""
+
+from game_config import (SCREEN_WIDTH, GRAVITY, INITIAL_JUMP_VEL, PLAYER_SPEED,
+                         PLAYER_IMAGE_SIZE, PLAYER_COLLISION_SCALE, PLATFORM_HEIGHT,
+                         PLATFORM_MAX_SPEED, PLATFORM_GAP)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Valor de la tabla para alturas que no se alcanzan
+UNREACHABLE = -1
+
+
+def _landing_ticks(jump_vel, gravity, player_height, max_height, double_jump_tick=None):
+    """
+    Simula un salto y devuelve, por altura, el último tick en que se puede aterrizar.
+
+    Reproduce Player.move(): en cada tick la velocidad suma la gravedad y
+    se aterriza si, cayendo, el rectángulo del jugador toca el de la
+    plataforma en su posición siguiente. Mientras el jugador cruza esa
+    franja vertical aún puede llegar en horizontal, así que cuenta el
+    último tick de la franja.
+
+    Args:
+        double_jump_tick (int, optional): Tick en que se usa el doble salto
+
+    Returns:
+        list: Último tick de aterrizaje por altura dy (0..max_height), o None si
+            la trayectoria no aterriza a esa altura
+    """
+    landing = [None] * (max_height + 1)
+    height = 0  # Altura de los pies sobre la plataforma de origen
+    vel = jump_vel
+    tick = 1
+    while True:
+        if tick == double_jump_tick:
+            vel = jump_vel
+        vel += gravity
+        next_height = height - vel
+        if vel > 0:
+            # Alturas de plataforma que se tocan cayendo en este tick
+            low = max(0, next_height + 1)
+            high = min(max_height, next_height + PLATFORM_HEIGHT + player_height - 1)
+            for dy in range(low, high + 1):
+                landing[dy] = tick
+            if high < 0:
+                # Ya cayó por debajo de la plataforma de origen
+                return landing
+        height = next_height
+        tick += 1
+
+
+class JumpEnvelope:
+    """Tabla de alcance del salto: ticks de vuelo horizontal por altura."""
+
+    def __init__(self, jump_vel=INITIAL_JUMP_VEL, gravity=GRAVITY, speed=PLAYER_SPEED,
+                 player_size=None, platform_speed=PLATFORM_MAX_SPEED):
+        """
+        Calcula la tabla.
+
+        Args:
+            jump_vel (int): Velocidad vertical del salto (negativa hacia arriba)
+            gravity (int): Aceleración por tick
+            speed (int): Velocidad horizontal del jugador
+            player_size (tuple, optional): Tamaño de colisión del jugador.
+                Por defecto el de Player
+            platform_speed (int): Velocidad máxima de una plataforma móvil
+        """
+        if player_size is None:
+            player_size = (int(PLAYER_IMAGE_SIZE[0] * PLAYER_COLLISION_SCALE),
+                           int(PLAYER_IMAGE_SIZE[1] * PLAYER_COLLISION_SCALE))
+        self.player_width, self.player_height = player_size
+        self.speed = speed
+        self.platform_speed = platform_speed
+
+        # Subida de un salto (suma de las velocidades hacia arriba); con doble
+        # salto se sube dos veces y se puede aterrizar hasta un cuerpo más arriba
+        rise = sum(range(1, -jump_vel - gravity + 1, gravity))
+        table_height = 2 * rise + PLATFORM_HEIGHT + self.player_height
+
+        # Un salto: cuántos ticks se mueve el jugador antes del tick de aterrizaje
+        single = _landing_ticks(jump_vel, gravity, self.player_height, table_height)
+        self.single = [tick - 1 if tick else UNREACHABLE for tick in single]
+
+        # Doble salto: el mejor tick para usarlo en cada altura (se prueban
+        # todos los ticks de vuelo del primer salto)
+        self.double = list(self.single)
+        for double_jump_tick in range(2, max(tick for tick in single if tick) + 1):
+            landing = _landing_ticks(jump_vel, gravity, self.player_height, table_height,
+                                     double_jump_tick)
+            for dy, landing_tick in enumerate(landing):
+                if landing_tick and landing_tick - 1 > self.double[dy]:
+                    self.double[dy] = landing_tick - 1
+
+        # Altura máxima alcanzable con un salto y con doble salto
+        self.single_height = max(dy for dy, ticks in enumerate(self.single) if ticks != UNREACHABLE)
+        self.double_height = max(dy for dy, ticks in enumerate(self.double) if ticks != UNREACHABLE)
+
+        self._arrays = None
+
+    def air_ticks(self, dy, double_jump=False):
+        """Ticks de movimiento horizontal para subir dy píxeles (UNREACHABLE si no se puede)."""
+        table = self.double if double_jump else self.single
+        if dy < 0:
+            dy = 0
+        if dy >= len(table):
+            return UNREACHABLE
+        return table[dy]
+
+    def max_dx(self, dy, moving=False, double_jump=False):
+        """
+        Distancia horizontal máxima que se puede cubrir subiendo dy píxeles.
+
+        Args:
+            moving (bool): Si la plataforma destino u origen se mueve
+            double_jump (bool): Contar con el doble salto
+
+        Returns:
+            int: Píxeles, o UNREACHABLE si la altura no se alcanza
+        """
+        ticks = self.air_ticks(dy, double_jump)
+        if ticks == UNREACHABLE:
+            return UNREACHABLE
+        speed = self.speed - self.platform_speed if moving else self.speed
+        return ticks * speed
+
+    def required_dx(self, source_x, source_width, target_x, target_width):
+        """
+        Distancia horizontal que el jugador debe recorrer entre dos plataformas.
+
+        El jugador está sobre una plataforma mientras su rectángulo se
+        solape con ella al menos un píxel.
+        """
+        width = self.player_width
+        return max(0, target_x - source_x - source_width - width + 2,
+                   source_x - target_x - target_width - width + 2)
+
+    def is_reachable(self, source_x, source_width, target_x, target_width, dy,
+                     moving=False, double_jump=False):
+        """Indica si se puede saltar de una plataforma a otra dy píxeles más arriba."""
+        reach = self.max_dx(dy, moving, double_jump)
+        return reach != UNREACHABLE and self.required_dx(source_x, source_width,
+                                                         target_x, target_width) <= reach
+
+    def fit_x(self, source_x, source_width, target_x, target_width, dy,
+              moving=False, double_jump=False):
+        """
+        Acerca la plataforma destino lo justo para que sea alcanzable.
+
+        Returns:
+            int: Nueva x de la plataforma destino (la misma si ya era alcanzable
+                o si la altura no se alcanza de ningún modo)
+        """
+        reach = self.max_dx(dy, moving, double_jump)
+        if reach == UNREACHABLE:
+            return target_x
+        excess = self.required_dx(source_x, source_width, target_x, target_width) - reach
+        if excess <= 0:
+            return target_x
+        if target_x > source_x:
+            return target_x - excess
+        return min(target_x + excess, SCREEN_WIDTH - target_width)
+
+    def validate_bulk(self, xs, widths, gaps, moving, double_jump=False):
+        """
+        Valida una secuencia de disposiciones consecutivas.
+
+        Cada disposición se compara con la anterior (la primera no se
+        valida y siempre es alcanzable).
+
+        Args:
+            xs, widths, gaps, moving: Columnas (arreglos de NumPy o listas)
+                de la posición, el ancho, la separación con la anterior y si
+                la plataforma se mueve
+            double_jump (bool): Contar con el doble salto
+
+        Returns:
+            Arreglo (o lista) de booleanos: True si se alcanza desde la anterior
+        """
+        if numpy is None or not isinstance(xs, numpy.ndarray):
+            result = [True]
+            for i in range(1, len(xs)):
+                result.append(self.is_reachable(xs[i - 1], widths[i - 1], xs[i], widths[i], gaps[i],
+                                                moving[i] or moving[i - 1], double_jump))
+            return result
+
+        xs = xs.astype(numpy.int64)
+        widths = widths.astype(numpy.int64)
+        table = self._table_array(double_jump)
+        dys = numpy.clip(gaps[1:].astype(numpy.int64), 0, len(table) - 1)
+        ticks = numpy.where(gaps[1:] < len(table), table[dys], UNREACHABLE)
+        any_moving = moving[1:] | moving[:-1]
+        reach = ticks * numpy.where(any_moving, self.speed - self.platform_speed, self.speed)
+
+        width = self.player_width
+        required = numpy.maximum(0, numpy.maximum(xs[1:] - xs[:-1] - widths[:-1] - width + 2,
+                                                  xs[:-1] - xs[1:] - widths[1:] - width + 2))
+        valid = (ticks != UNREACHABLE) & (required <= reach)
+        return numpy.concatenate(([True], valid))
+
+    def _table_array(self, double_jump):
+        """Tabla como arreglo de NumPy (se crea una vez)."""
+        if self._arrays is None:
+            self._arrays = (numpy.array(self.single), numpy.array(self.double))
+        return self._arrays[1 if double_jump else 0]
+
+
+def main():
+    """Valida disposiciones generadas en masa desde la línea de comandos."""
+    import argparse
+    import random
+    import time
+    from chunk_generator import PlatformChunkGenerator, LAYOUT_FIELDS
+
+    parser = argparse.ArgumentParser(description='Validación masiva de alcance de plataformas')
+    parser.add_argument('--layouts', type=int, default=1000000, help='Disposiciones a validar')
+    parser.add_argument('--gap', default=f'{PLATFORM_GAP[0]},{PLATFORM_GAP[1]}',
+                        help='Separación vertical mínima,máxima')
+    parser.add_argument('--seed', type=int, default=0, help='Semilla del generador')
+    parser.add_argument('--batch', type=int, default=65536, help='Disposiciones por lote')
+    parser.add_argument('--double-jump', action='store_true', help='Contar con el doble salto')
+    args = parser.parse_args()
+
+    if numpy is None:
+        parser.error('el modo masivo necesita NumPy')
+
+    gap = tuple(int(value) for value in args.gap.split(','))
+    envelope = JumpEnvelope()
+    generator = PlatformChunkGenerator(gap)
+    rng = random.Random(args.seed)
+
+    checked = 0
+    failures = {'estáticas': 0, 'móviles': 0}
+    start = time.perf_counter()
+    while checked < args.layouts:
+        count = min(args.batch, args.layouts - checked)
+        size = count * LAYOUT_FIELDS * 4
+        xs, widths, gaps, movable, _, _ = generator.decode_arrays(
+            rng.getrandbits(size * 8).to_bytes(size, 'little'))
+        static = numpy.zeros(count, dtype=bool)
+        failures['estáticas'] += int(count - envelope.validate_bulk(
+            xs, widths, gaps, static, args.double_jump).sum())
+        failures['móviles'] += int(count - envelope.validate_bulk(
+            xs, widths, gaps, movable, args.double_jump).sum())
+        checked += count
+    elapsed = time.perf_counter() - start
+
+    print(f"Altura máxima: {envelope.single_height} px con un salto, "
+          f"{envelope.double_height} px con doble salto")
+    print(f"{checked} disposiciones en {elapsed:.2f} s "
+          f"({checked * 2 / elapsed * 60 / 1e6:.0f} millones de validaciones por minuto)")
+    for name, count in failures.items():
+        print(f"Inalcanzables ({name}): {count} ({count / checked:.3%})")
+
+
+if __name__ == "__main__":
+    main()
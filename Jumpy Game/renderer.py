@@ -0,0 +1,149 @@
+"""
+Renderizado por rectángulos sucios para Jumpy Game.
+
+En lugar de enviar la pantalla completa a pygame.display.update() en
+cada frame, DirtyRectRenderer registra lo que se dibujó y solo envía
+las regiones que cambiaron respecto al frame anterior. Cuando la cámara
+se mueve el fondo entero se desplaza, así que ese frame se redibuja y
+se envía completo.
+
+El renderer imita Surface.blit(), por lo que puede pasarse como destino
+de dibujo a Camera.draw_group() y Player.draw().
+"""
+
+import pygame
+from game_config import DIRTY_RECT_RENDERING
+
+
+class DirtyRectRenderer:
+    """Lleva la cuenta de las regiones dibujadas y actualiza solo las que cambian."""
+
+    def __init__(self, screen, enabled=DIRTY_RECT_RENDERING):
+        """
+        Inicializa el renderer.
+
+        Args:
+            screen (pygame.Surface): Superficie de la ventana
+            enabled (bool): Si es False siempre se redibuja y envía todo
+        """
+        self.screen = screen
+        self.enabled = enabled
+        self.mode = None
+        self.camera_y = None
+        self.full_redraw = True
+
+        # Entradas (x, y, ancho, alto, contenido) del frame anterior y actual
+        self._previous = set()
+        self._current = []
+
+        # Estadísticas
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.skipped_frames = 0
+
+    def set_mode(self, mode):
+        """
+        Cambia la pantalla activa (inicio, juego, pausa, game over).
+
+        Returns:
+            bool: True si la pantalla cambió y hay que dibujarla completa
+        """
+        if mode == self.mode:
+            return False
+        self.mode = mode
+        self.invalidate()
+        return True
+
+    def invalidate(self):
+        """Fuerza que el siguiente frame se redibuje y envíe completo."""
+        self.full_redraw = True
+        self._previous = set()
+
+    def begin_frame(self, camera_y):
+        """
+        Comienza un frame de juego.
+
+        Args:
+            camera_y (int): Posición actual de la cámara
+
+        Returns:
+            bool: True si el frame debe dibujarse completo
+        """
+        if camera_y != self.camera_y:
+            self.camera_y = camera_y
+            self.full_redraw = True
+        return self.full_redraw or not self.enabled
+
+    def previous_rects(self):
+        """Regiones dibujadas en el frame anterior, a restaurar con el fondo."""
+        return [pygame.Rect(entry[:4]) for entry in self._previous]
+
+    def blit(self, source, dest, area=None):
+        """Dibuja en pantalla como Surface.blit() y registra la región."""
+        rect = self.screen.blit(source, dest, area)
+        self._current.append((rect.x, rect.y, rect.w, rect.h, id(source)))
+        return rect
+
+    def mark(self, rect, content):
+        """
+        Registra una región dibujada directamente en pantalla.
+
+        Args:
+            rect (pygame.Rect): Región dibujada
+            content: Valor que identifica lo dibujado; si cambia entre
+                frames la región se considera sucia
+        """
+        if rect:
+            self._current.append((rect.x, rect.y, rect.w, rect.h, content))
+
+    def present_frame(self):
+        """Envía a la ventana lo dibujado desde begin_frame()."""
+        current = set(self._current)
+        self._current = []
+
+        if self.full_redraw or not self.enabled:
+            pygame.display.update()
+            self.full_frames += 1
+        else:
+            # Lo que desapareció o apareció respecto al frame anterior
+            changed = current.symmetric_difference(self._previous)
+            if changed:
+                pygame.display.update([pygame.Rect(entry[:4]) for entry in changed])
+                self.partial_frames += 1
+            else:
+                self.skipped_frames += 1
+
+        self._previous = current
+        self.full_redraw = False
+
+    def present(self, rects=None):
+        """
+        Envía a la ventana regiones explícitas (pantallas fuera del juego).
+
+        Args:
+            rects (list, optional): Regiones a actualizar. Si es None se
+                envía la pantalla completa; si está vacía no se envía nada
+        """
+        if rects is None or not self.enabled:
+            pygame.display.update()
+            self.full_frames += 1
+        elif rects:
+            pygame.display.update(rects)
+            self.partial_frames += 1
+        else:
+            self.skipped_frames += 1
+        self._current = []
+        self.full_redraw = False
+
+    def get_stats(self):
+        """
+        Obtiene las estadísticas de frames enviados.
+
+        Returns:
+            dict: Frames completos, parciales y sin cambios
+        """
+        return {
+            'full': self.full_frames,
+            'partial': self.partial_frames,
+            'skipped': self.skipped_frames
+        }
@@ -0,0 +1,184 @@
+"""
+Grabación y reproducción de partidas de Jumpy Game.
+
+Una repetición guarda la semilla de la partida y la entrada de cada
+tick. Como toda la generación usa el generador aleatorio de GameState,
+reproducir la misma entrada con la misma semilla recrea la partida
+tick a tick, lo que permite comparar tiempos de frame sobre contenido
+idéntico.
+
+Formato binario (little-endian):
+    cabecera: magic b'JRPL', versión (u8), semilla (u64), ticks (u32)
+    cuerpo:   pares (repeticiones u16, máscara u8) codificados por longitud
+"""
+
+import struct
+from input_source import InputState
+from game_config import MAX_SEED
+
+REPLAY_MAGIC = b'JRPL'
+REPLAY_VERSION = 3  # 2: plataformas sorteadas por bloques; 3: creadas por bloques
+
+_HEADER = struct.Struct('<4sBQI')
+_RUN = struct.Struct('<HB')
+_MAX_RUN = 0xFFFF
+
+# Bits de la máscara de entrada
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_JUMP = 4
+
+# Estados precalculados para cada máscara posible
+_STATES = [InputState(bool(m & INPUT_LEFT), bool(m & INPUT_RIGHT), bool(m & INPUT_JUMP))
+           for m in range(8)]
+
+
+def encode_input(state):
+    """Convierte un InputState en su máscara de bits."""
+    mask = 0
+    if state.left:
+        mask |= INPUT_LEFT
+    if state.right:
+        mask |= INPUT_RIGHT
+    if state.jump:
+        mask |= INPUT_JUMP
+    return mask
+
+
+def decode_input(mask):
+    """Convierte una máscara de bits en un InputState (compartido)."""
+    return _STATES[mask & 7]
+
+
+def encode_replay(seed, masks):
+    """
+    Serializa una repetición.
+
+    Args:
+        seed (int): Semilla de la partida
+        masks (bytes): Máscara de entrada de cada tick
+
+    Returns:
+        bytes: Repetición codificada
+    """
+    data = bytearray(_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed, len(masks)))
+    index = 0
+    total = len(masks)
+    while index < total:
+        mask = masks[index]
+        run = 1
+        while index + run < total and masks[index + run] == mask and run < _MAX_RUN:
+            run += 1
+        data += _RUN.pack(run, mask)
+        index += run
+    return bytes(data)
+
+
+def decode_replay(data):
+    """
+    Deserializa una repetición.
+
+    Args:
+        data (bytes): Repetición codificada
+
+    Returns:
+        tuple: (semilla, bytearray con la máscara de cada tick)
+
+    Raises:
+        ValueError: Si los datos no son una repetición válida
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Repetición truncada")
+
+    magic, version, seed, ticks = _HEADER.unpack_from(data, 0)
+    if magic != REPLAY_MAGIC:
+        raise ValueError("El archivo no es una repetición de Jumpy Game")
+    if version != REPLAY_VERSION:
+        raise ValueError(f"Versión de repetición no soportada: {version}")
+    if seed > MAX_SEED:
+        raise ValueError(f"Semilla de repetición fuera de rango: {seed}")
+
+    masks = bytearray()
+    for run, mask in _RUN.iter_unpack(data[_HEADER.size:]):
+        masks += bytes((mask,)) * run
+
+    if len(masks) != ticks:
+        raise ValueError("Repetición corrupta: número de ticks incorrecto")
+    return seed, masks
+
+
+class ReplayRecorder:
+    """
+    Fuente de entrada que graba lo que devuelve otra fuente.
+
+    Se usa en lugar de la fuente original: cada poll() se delega y la
+    entrada obtenida se anota para el tick actual.
+    """
+
+    def __init__(self, input_source):
+        self.input_source = input_source
+        self.seed = 0
+        self.masks = bytearray()
+
+    def start(self, seed):
+        """Comienza una nueva grabación para la partida con esta semilla."""
+        self.seed = seed
+        self.masks = bytearray()
+
+    def poll(self):
+        """Lee la fuente original y graba el resultado."""
+        state = self.input_source.poll()
+        self.masks.append(encode_input(state))
+        return state
+
+    def rewind(self, ticks):
+        """Descarta la entrada de los últimos ticks (partida rebobinada)."""
+        if ticks > 0:
+            del self.masks[-ticks:]
+
+    def to_bytes(self):
+        """Devuelve la grabación serializada."""
+        return encode_replay(self.seed, self.masks)
+
+    def save(self, path):
+        """Guarda la grabación en un archivo."""
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+
+class ReplayPlayer:
+    """Fuente de entrada que reproduce una repetición grabada."""
+
+    def __init__(self, seed, masks):
+        self.seed = seed
+        self.masks = masks
+        self.tick = 0
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Crea un reproductor a partir de datos serializados."""
+        seed, masks = decode_replay(data)
+        return cls(seed, masks)
+
+    @classmethod
+    def load(cls, path):
+        """Carga una repetición desde archivo."""
+        with open(path, 'rb') as file:
+            return cls.from_bytes(file.read())
+
+    @property
+    def finished(self):
+        """True cuando ya se reprodujeron todos los ticks."""
+        return self.tick >= len(self.masks)
+
+    def poll(self):
+        """Devuelve la entrada grabada del tick actual (sin teclas al terminar)."""
+        tick = self.tick
+        self.tick += 1
+        if tick >= len(self.masks):
+            return _STATES[0]
+        return _STATES[self.masks[tick]]
+
+    def rewind(self, ticks):
+        """Retrocede la reproducción (partida rebobinada)."""
+        self.tick = max(0, self.tick - ticks)
@@ -0,0 +1,232 @@
+"""
+Rebobinado de los últimos segundos de juego para Jumpy Game.
+
+Después de cada tick se guarda el mundo en un buffer circular de tamaño
+fijo. Para que quepan varios segundos sin gastar memoria, cada tick se
+guarda como diferencia con el anterior a partir de las instantáneas de
+WorldSnapshot:
+
+- los enteros se guardan completos solo en los fotogramas clave (cada
+  REWIND_KEYFRAME_INTERVAL ticks) o cuando cambia la cantidad de sprites;
+  en el resto se guardan pares (posición, valor nuevo) de lo que cambió;
+- el estado del generador aleatorio se guarda compacto (enteros de 32
+  bits) y solo cuando cambió.
+
+El buffer descarta los fotogramas más viejos por grupos completos (desde
+un fotograma clave hasta el siguiente), al llenarse o al pasar del límite
+de bytes, así el límite de memoria nunca se supera y siempre se puede
+reconstruir cualquier tick guardado.
+"""
+
+import sys
+from array import array
+from itertools import compress, count
+from operator import ne
+from game_config import FPS, REWIND_SECONDS, REWIND_KEYFRAME_INTERVAL, REWIND_MAX_BYTES
+from snapshot import WorldSnapshot
+
+
+class RewindFrame:
+    """Un tick guardado; los campos en None se toman de los ticks anteriores."""
+
+    __slots__ = ('ints', 'changes', 'floats', 'rng_state')
+
+    def __init__(self, ints, changes, floats, rng_state):
+        """
+        Args:
+            ints (array): Enteros completos de la instantánea, o None
+            changes (array): Pares (posición, valor) respecto del tick anterior
+                si ints es None
+            floats (array): Flotantes de la instantánea
+            rng_state (tuple): (versión, enteros de 32 bits, gauss) o None si
+                el generador no cambió
+        """
+        self.ints = ints
+        self.changes = changes
+        self.floats = floats
+        self.rng_state = rng_state
+
+
+class RewindBuffer:
+    """Buffer circular de los últimos ticks codificados por diferencias."""
+
+    def __init__(self, seconds=REWIND_SECONDS, keyframe_interval=REWIND_KEYFRAME_INTERVAL,
+                 max_bytes=REWIND_MAX_BYTES):
+        """
+        Inicializa el buffer.
+
+        Args:
+            seconds (float): Segundos de juego que se pueden rebobinar
+            keyframe_interval (int): Ticks entre fotogramas clave
+            max_bytes (int): Límite de memoria de los ticks guardados
+        """
+        self.keyframe_interval = keyframe_interval
+        self.max_bytes = max_bytes
+
+        # Un grupo de más para no bajar de los segundos pedidos al descartar
+        groups = -(-int(seconds * FPS) // keyframe_interval) + 1
+        self.capacity = groups * keyframe_interval
+        self.frames = [None] * self.capacity
+        self.sizes = array('l', bytes(array('l').itemsize * self.capacity))
+
+        # Índices absolutos del tick más viejo guardado y del siguiente
+        self.start = 0
+        self.end = 0
+        self.total_bytes = 0
+        self.last = None  # Instantánea del último tick guardado
+        self.last_values = None  # Sus enteros como lista, para comparar rápido
+
+    def __len__(self):
+        """Ticks guardados."""
+        return self.end - self.start
+
+    def clear(self):
+        """Descarta todos los ticks (nueva partida)."""
+        for index in range(self.start, self.end):
+            self.frames[index % self.capacity] = None
+        self.start = 0
+        self.end = 0
+        self.total_bytes = 0
+        self.last = None
+        self.last_values = None
+
+    def record(self, game):
+        """
+        Guarda el estado actual del juego como un tick nuevo.
+
+        Args:
+            game (JumpyGame): Juego a guardar
+        """
+        snapshot = WorldSnapshot.capture(game)
+        if self.end - self.start >= self.capacity:
+            self.drop_oldest_group()
+
+        index = self.end
+        last = self.last
+        keyframe = last is None or index == self.start or index % self.keyframe_interval == 0
+
+        ints = snapshot.ints
+        values = ints.tolist()
+        changes = None
+        if not keyframe and len(values) == len(self.last_values):
+            # Posiciones que cambiaron, comparadas en C
+            changed = list(compress(count(), map(ne, self.last_values, values)))
+            pairs = [0] * (2 * len(changed))
+            pairs[::2] = changed
+            pairs[1::2] = [values[i] for i in changed]
+            changes = array('q', pairs)
+            ints = None
+
+        rng_state = None
+        if keyframe or snapshot.rng_state != last.rng_state:
+            version, internal, gauss = snapshot.rng_state
+            rng_state = (version, array('I', internal), gauss)
+
+        frame = RewindFrame(ints, changes, snapshot.floats, rng_state)
+        size = self.frame_bytes(frame)
+        slot = index % self.capacity
+        self.frames[slot] = frame
+        self.sizes[slot] = size
+        self.total_bytes += size
+        self.end = index + 1
+        self.last = snapshot
+        self.last_values = values
+
+        while self.total_bytes > self.max_bytes and self.start < self.end:
+            self.drop_oldest_group()
+        if self.start == self.end:
+            self.last = None
+
+    def drop_oldest_group(self):
+        """Descarta los ticks más viejos hasta el siguiente fotograma clave."""
+        interval = self.keyframe_interval
+        stop = min((self.start // interval + 1) * interval, self.end)
+        for index in range(self.start, stop):
+            slot = index % self.capacity
+            self.frames[slot] = None
+            self.total_bytes -= self.sizes[slot]
+        self.start = stop
+
+    def step_back(self, game):
+        """
+        Descarta el último tick y devuelve el juego al anterior.
+
+        Args:
+            game (JumpyGame): Juego a restaurar
+
+        Returns:
+            bool: False si no quedaba un tick anterior
+        """
+        if self.end - self.start < 2:
+            return False
+        self.end -= 1
+        slot = self.end % self.capacity
+        self.frames[slot] = None
+        self.total_bytes -= self.sizes[slot]
+
+        snapshot = self.reconstruct(self.end - 1)
+        snapshot.restore(game)
+        self.last = snapshot
+        self.last_values = snapshot.ints.tolist()
+        return True
+
+    def reconstruct(self, index):
+        """
+        Reconstruye la instantánea de un tick guardado.
+
+        Args:
+            index (int): Índice absoluto del tick (entre start y end - 1)
+
+        Returns:
+            WorldSnapshot: Instantánea del tick
+        """
+        frames = self.frames
+        capacity = self.capacity
+        target = frames[index % capacity]
+
+        # Se retrocede hasta tener enteros completos y estado del generador
+        pending = []
+        ints = rng_state = None
+        position = index
+        while ints is None or rng_state is None:
+            frame = frames[position % capacity]
+            if ints is None:
+                if frame.ints is None:
+                    pending.append(frame.changes)
+                else:
+                    ints = array('q', frame.ints)
+            if rng_state is None and frame.rng_state is not None:
+                rng_state = frame.rng_state
+            position -= 1
+
+        for changes in reversed(pending):
+            for i in range(0, len(changes), 2):
+                ints[changes[i]] = changes[i + 1]
+        version, internal, gauss = rng_state
+        return WorldSnapshot(ints, target.floats, (version, tuple(internal), gauss))
+
+    @staticmethod
+    def frame_bytes(frame):
+        """Bytes aproximados que ocupa un tick guardado."""
+        size = sys.getsizeof(frame) + sys.getsizeof(frame.floats)
+        if frame.ints is not None:
+            size += sys.getsizeof(frame.ints)
+        else:
+            size += sys.getsizeof(frame.changes)
+        if frame.rng_state is not None:
+            size += sys.getsizeof(frame.rng_state) + sys.getsizeof(frame.rng_state[1])
+        return size
+
+    def get_stats(self):
+        """
+        Obtiene el uso del buffer.
+
+        Returns:
+            dict: Ticks guardados, segundos que representan y bytes usados
+        """
+        ticks = len(self)
+        return {
+            'ticks': ticks,
+            'seconds': ticks / FPS,
+            'bytes': self.total_bytes
+        }
@@ -0,0 +1,138 @@
+"""
+Simulación headless de Jumpy Game.
+
+Avanza el mundo (jugador, plataformas, enemigos, power-ups y estado)
+tan rápido como permita la CPU, sin ventana, sin audio real y sin el
+límite de FPS. Pensado para pruebas de resistencia, balanceo y
+mediciones de rendimiento.
+
+Uso:
+    python simulation.py --ticks 100000 --seed 42
+    python simulation.py --seed 42 --record partida.jrpl
+    python simulation.py --replay partida.jrpl
+    python simulation.py --ticks 100000 --profile perfil.csv
+    python simulation.py --ticks 100000 --rewind --profile perfil.csv
+"""
+
+import argparse
+import time
+from jumpy_game import JumpyGame
+from input_source import RandomInput
+from replay import ReplayPlayer
+from game_state import seed_argument
+
+
+class SimulationStats:
+    """Resultados de una ejecución headless."""
+
+    def __init__(self, ticks, elapsed, runs, best_score):
+        self.ticks = ticks
+        self.elapsed = elapsed
+        self.runs = runs
+        self.best_score = best_score
+
+    @property
+    def ticks_per_second(self):
+        """Ticks simulados por segundo de reloj."""
+        if self.elapsed <= 0:
+            return float('inf')
+        return self.ticks / self.elapsed
+
+    def __repr__(self):
+        return (f"SimulationStats(ticks={self.ticks}, elapsed={self.elapsed:.3f}s, "
+                f"ticks_per_second={self.ticks_per_second:.0f}, runs={self.runs}, "
+                f"best_score={self.best_score})")
+
+
+class HeadlessSimulation:
+    """Ejecuta JumpyGame sin renderizar ni esperar al reloj."""
+
+    def __init__(self, input_source=None, seed=None, record_path=None, profile=False,
+                 spawn=None, rewind=False):
+        """
+        Inicializa la simulación.
+
+        Args:
+            input_source: Fuente de entrada con método poll().
+                Por defecto se usa RandomInput
+            seed (int, optional): Semilla de la primera partida
+            record_path (str, optional): Archivo donde grabar la repetición
+            profile (bool): Medir el tiempo de cada fase por tick
+            spawn (SpawnSettings, optional): Límites y tasas de generación
+            rewind (bool): Llenar el buffer de rebobinado en cada tick
+        """
+        if input_source is None:
+            input_source = RandomInput(seed)
+        self.game = JumpyGame(headless=True, input_source=input_source,
+                              seed=seed, record_path=record_path, profile=profile,
+                              spawn=spawn, rewind=rewind)
+        self.game.game_state.waiting_for_start = False
+
+    def run(self, ticks, auto_restart=True):
+        """
+        Avanza la simulación un número fijo de ticks.
+
+        Args:
+            ticks (int): Número de ticks a simular
+            auto_restart (bool): Reinicia la partida al llegar a game over;
+                si es False la simulación se detiene
+
+        Returns:
+            SimulationStats: Resultados de la ejecución
+        """
+        game = self.game
+        profiler = game.profiler
+        runs = 1
+        best_score = 0
+        executed = 0
+
+        start = time.perf_counter()
+        while executed < ticks:
+            profiler.begin_frame()
+            alive = game.step()
+            profiler.end_frame()
+            executed += 1
+            if not alive:
+                best_score = max(best_score, game.game_state.score)
+                if not auto_restart:
+                    break
+                game.restart_game()
+                runs += 1
+        elapsed = time.perf_counter() - start
+
+        best_score = max(best_score, game.game_state.score)
+        return SimulationStats(executed, elapsed, runs, best_score)
+
+
+def main():
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description='Simulación headless de Jumpy Game')
+    parser.add_argument('--ticks', type=int, default=10000, help='Ticks a simular')
+    parser.add_argument('--seed', type=seed_argument, default=None, help='Semilla de la partida y de la entrada aleatoria')
+    parser.add_argument('--no-restart', action='store_true', help='Detenerse en el primer game over')
+    parser.add_argument('--record', metavar='ARCHIVO', help='Grabar la primera partida')
+    parser.add_argument('--replay', metavar='ARCHIVO', help='Reproducir una repetición')
+    parser.add_argument('--profile', metavar='ARCHIVO', help='Exportar el tiempo de cada fase por tick a CSV')
+    parser.add_argument('--rewind', action='store_true', help='Grabar el buffer de rebobinado en cada tick')
+    args = parser.parse_args()
+    profile = args.profile is not None
+
+    if args.replay:
+        replay = ReplayPlayer.load(args.replay)
+        simulation = HeadlessSimulation(replay, seed=replay.seed, profile=profile)
+        stats = simulation.run(len(replay.masks), auto_restart=False)
+    else:
+        # Al grabar se detiene en el primer game over: una repetición es una partida
+        auto_restart = not (args.no_restart or args.record)
+        simulation = HeadlessSimulation(seed=args.seed, record_path=args.record, profile=profile,
+                                        rewind=args.rewind)
+        stats = simulation.run(args.ticks, auto_restart=auto_restart)
+        simulation.game.save_replay()
+    simulation.game.close()
+    print(stats)
+    if profile and simulation.game.profiler.dump_csv(args.profile):
+        print(f"Perfil por tick guardado en {args.profile}")
+
+
+if __name__ == "__main__":
+    main()
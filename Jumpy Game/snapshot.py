@@ -0,0 +1,224 @@
+"""
+Instantáneas del estado de la simulación de Jumpy Game.
+
+Una instantánea guarda todo lo que decide los ticks siguientes: jugador,
+plataformas, power-ups, enemigos, GameState (incluido el estado del
+generador aleatorio), cámara y última plataforma; el generador de
+plataformas no guarda nada entre bloques. Los valores se guardan planos
+en dos arreglos (enteros y flotantes) sin crear un objeto por sprite,
+así capturar cuesta unos
+microsegundos y un bot o una prueba puede bifurcar el mundo miles de
+veces por segundo.
+
+Restaurar devuelve los sprites actuales a sus pools y vuelve a pedirlos
+con los valores guardados, en el mismo orden de inserción en sus grupos,
+de modo que la partida sigue exactamente igual que desde la captura.
+
+La entrada (teclado, repetición o entrada aleatoria) no forma parte de
+la instantánea: quien restaura decide qué controles vienen después.
+"""
+
+from array import array
+from game_config import SCREEN_WIDTH, ENEMY_SCALE
+
+# Campos enteros de cada registro, en orden
+PLAYER_FIELDS = 10    # x, y, prev_x, prev_y, vel_y, in_air, can_auto_jump,
+                      # has_double_jump, current_jump_vel, mirando a la derecha
+STATE_FIELDS = 10     # score, lives, game_over, fade_counter, paused,
+                      # waiting_for_start, scroll, seed, high_score, tick
+CAMERA_FIELDS = 3     # y, prev_y, render_y
+PLATFORM_FIELDS = 8   # x, y, ancho, moving, move_counter, direction, speed, prev_x
+POWERUP_FIELDS = 3    # x, y, prev_x
+ENEMY_FIELDS = 5      # x, y, prev_x, frame, direction (el timer va en los flotantes)
+
+# Cabecera: cantidad de plataformas, boosters, vidas extra y enemigos, e
+# índice de la última plataforma en su grupo (-1 si ya no está en él)
+HEADER_FIELDS = 5
+
+
+def platform_record(platform):
+    """Campos enteros de una plataforma, en el orden de PLATFORM_FIELDS."""
+    rect = platform.rect
+    return (rect.x, rect.y, rect.width, platform.moving, platform.move_counter,
+            platform.direction, platform.speed, platform.prev_x)
+
+
+def restore_platform(game, record, rng):
+    """Pide al pool del juego una plataforma con los campos de un registro."""
+    x, y, width, moving, move_counter, direction, speed, prev_x = record
+    platform = game.platform_pool.acquire(x, y, width, bool(moving), game.asset_loader, rng)
+    platform.move_counter = move_counter
+    platform.direction = direction
+    platform.speed = speed
+    platform.prev_x = prev_x
+    return platform
+
+
+class WorldSnapshot:
+    """Estado completo de la simulación en arreglos planos."""
+
+    __slots__ = ('ints', 'floats', 'rng_state')
+
+    def __init__(self, ints, floats, rng_state):
+        """
+        Inicializa la instantánea (usar capture() para crearla).
+
+        Args:
+            ints (array): Enteros de todos los registros
+            floats (array): Alfa de la cámara y timers de los enemigos
+            rng_state (tuple): Estado del generador aleatorio de la partida
+        """
+        self.ints = ints
+        self.floats = floats
+        self.rng_state = rng_state
+
+    @classmethod
+    def capture(cls, game):
+        """
+        Captura el estado de un juego.
+
+        Args:
+            game (JumpyGame): Juego a capturar
+
+        Returns:
+            WorldSnapshot: Instantánea independiente del juego
+        """
+        platforms = game.platform_group.sprites()
+        boosters = game.booster_group.sprites()
+        extra_lives = game.extra_life_group.sprites()
+        enemies = game.enemy_group.sprites()
+        try:
+            last_index = platforms.index(game.last_platform)
+        except ValueError:
+            last_index = -1
+
+        values = [len(platforms), len(boosters), len(extra_lives), len(enemies), last_index]
+
+        player = game.player
+        rect = player.rect
+        values += (rect.x, rect.y, player.prev_x, player.prev_y, player.vel_y, player.in_air,
+                   player.can_auto_jump, player.has_double_jump, player.current_jump_vel,
+                   player.current_direction == 'right')
+
+        state = game.game_state
+        values += (state.score, state.lives, state.game_over, state.fade_counter, state.paused,
+                   state.waiting_for_start, state.scroll, state.seed, state.high_score, state.tick)
+
+        camera = game.camera
+        values += (camera.y, camera.prev_y, camera.render_y)
+
+        for platform in platforms:
+            values += platform_record(platform)
+        for powerup in boosters + extra_lives:
+            values += (powerup.rect.x, powerup.rect.y, powerup.prev_x)
+        floats = array('d', [camera.render_alpha])
+        for enemy in enemies:
+            values += (enemy.rect.x, enemy.rect.y, enemy.prev_x, enemy.current_frame_index,
+                       enemy.movement_direction)
+            floats.append(enemy.animation_timer)
+
+        # La última plataforma fuera del grupo se guarda al final
+        if last_index < 0:
+            values += platform_record(game.last_platform)
+
+        return cls(array('q', values), floats, state.rng.getstate())
+
+    def restore(self, game):
+        """
+        Devuelve un juego al estado de la instantánea.
+
+        Args:
+            game (JumpyGame): Juego a restaurar (el mismo u otro con los
+                mismos assets y parámetros de generación)
+        """
+        values = self.ints.tolist()
+        n_platforms, n_boosters, n_extra_lives, n_enemies, last_index = values[:HEADER_FIELDS]
+        pos = HEADER_FIELDS
+
+        (x, y, prev_x, prev_y, vel_y, in_air, can_auto_jump, has_double_jump,
+         jump_vel, facing_right) = values[pos:pos + PLAYER_FIELDS]
+        pos += PLAYER_FIELDS
+        player = game.player
+        player.rect.topleft = (x, y)
+        player.prev_x = prev_x
+        player.prev_y = prev_y
+        player.vel_y = vel_y
+        player.in_air = bool(in_air)
+        player.can_auto_jump = bool(can_auto_jump)
+        player.has_double_jump = bool(has_double_jump)
+        player.current_jump_vel = jump_vel
+        player.current_direction = 'right' if facing_right else 'left'
+        player.image = player.bee_images[player.current_direction]
+        player.mask = player.bee_masks.get(player.current_direction)
+
+        state = game.game_state
+        (state.score, lives, game_over, state.fade_counter, paused, waiting_for_start,
+         state.scroll, state.seed, state.high_score, state.tick) = values[pos:pos + STATE_FIELDS]
+        pos += STATE_FIELDS
+        state.lives = lives
+        state.game_over = bool(game_over)
+        state.paused = bool(paused)
+        state.waiting_for_start = bool(waiting_for_start)
+
+        camera = game.camera
+        camera.y, camera.prev_y, camera.render_y = values[pos:pos + CAMERA_FIELDS]
+        pos += CAMERA_FIELDS
+        camera.render_alpha = self.floats[0]
+
+        # Los sprites actuales vuelven a sus pools; reset() consume números
+        # aleatorios, por eso el estado del generador se restaura al final
+        rng = state.rng
+        for group in (game.platform_group, game.booster_group, game.extra_life_group,
+                      game.enemy_group):
+            for sprite in group.sprites():
+                sprite.kill()
+        # Una última plataforma fuera de los grupos también vuelve a su pool
+        game.last_platform.kill()
+
+        loader = game.asset_loader
+        platforms = []
+        for _ in range(n_platforms):
+            platform = restore_platform(game, values[pos:pos + PLATFORM_FIELDS], rng)
+            pos += PLATFORM_FIELDS
+            game.platform_group.add(platform)
+            if platform.moving:
+                game.moving_platform_group.add(platform)
+            platforms.append(platform)
+
+        for pool, group, count in ((game.booster_pool, game.booster_group, n_boosters),
+                                   (game.extra_life_pool, game.extra_life_group, n_extra_lives)):
+            for _ in range(count):
+                x, y, prev_x = values[pos:pos + POWERUP_FIELDS]
+                pos += POWERUP_FIELDS
+                powerup = pool.acquire(0, 0, loader)
+                powerup.rect.topleft = (x, y)
+                powerup.prev_x = prev_x
+                group.add(powerup)
+
+        frame_bank = loader.enemy_frames if n_enemies else None
+        for i in range(n_enemies):
+            x, y, prev_x, frame, direction = values[pos:pos + ENEMY_FIELDS]
+            pos += ENEMY_FIELDS
+            enemy = game.enemy_pool.acquire(SCREEN_WIDTH, y, frame_bank, ENEMY_SCALE, rng)
+            enemy.movement_direction = direction
+            enemy.is_flipped = direction == 1
+            enemy.animation_frames, enemy.animation_masks = frame_bank.get_frames(
+                ENEMY_SCALE, enemy.is_flipped)
+            enemy.current_frame_index = frame
+            enemy.animation_timer = self.floats[1 + i]
+            enemy.image = enemy.animation_frames[frame]
+            enemy.mask = enemy.animation_masks[frame]
+            enemy.rect.topleft = (x, y)
+            enemy.prev_x = prev_x
+            game.enemy_group.add(enemy)
+
+        if last_index >= 0:
+            game.last_platform = platforms[last_index]
+        else:
+            game.last_platform = restore_platform(game, values[pos:pos + PLATFORM_FIELDS], rng)
+
+        rng.setstate(self.rng_state)
+
+    def size_bytes(self):
+        """Bytes de los arreglos de la instantánea (sin el generador aleatorio)."""
+        return (self.ints.itemsize * len(self.ints) + self.floats.itemsize * len(self.floats))
@@ -0,0 +1,129 @@
+"""
+Administrador de canales de sonido para Jumpy Game.
+
+Cada categoría de sonido (jugador, power-ups, eventos) tiene sus propios
+canales reservados del mixer, así una ráfaga de saltos no deja sin canal
+a la muerte o a un power-up y nunca suenan más voces que canales
+reservados. Cuando todos los canales de una categoría están ocupados la
+voz más vieja se reemplaza por la nueva.
+
+Además un mismo sonido no se vuelve a disparar antes de SOUND_RETRIGGER_MS:
+en secciones con muchas plataformas los saltos automáticos encadenados
+no apilan copias idénticas del mismo efecto.
+"""
+
+import pygame
+from game_config import SOUND_CATEGORY_CHANNELS, SOUND_CATEGORIES, SOUND_RETRIGGER_MS
+
+# Categoría de los sonidos que no aparecen en SOUND_CATEGORIES
+DEFAULT_SOUND_CATEGORY = 'event'
+
+
+class SoundManager:
+    """Reproduce sonidos en canales reservados por categoría con límite de repetición."""
+
+    def __init__(self, asset_loader, category_channels=SOUND_CATEGORY_CHANNELS,
+                 categories=SOUND_CATEGORIES, retrigger_ms=SOUND_RETRIGGER_MS, clock=None):
+        """
+        Inicializa el administrador y reserva los canales del mixer.
+
+        Args:
+            asset_loader (AssetLoader): Cargador de donde se piden los sonidos
+            category_channels (dict): Categoría -> canales reservados
+            categories (dict): Nombre de sonido -> categoría
+            retrigger_ms (int): Tiempo mínimo entre dos disparos del mismo sonido
+            clock (callable, optional): Función que devuelve el tiempo en ms.
+                Por defecto pygame.time.get_ticks; el juego usa el reloj de
+                la simulación
+        """
+        self.asset_loader = asset_loader
+        self.categories = categories
+        self.retrigger_ms = retrigger_ms
+        self.clock = clock if clock else pygame.time.get_ticks
+
+        # Canales de cada categoría y momento en que empezó su voz actual
+        self.channels = {}
+        self.started = {}
+        self.last_played = {}
+
+        # Contadores de voces por sonido
+        self.played = {}
+        self.dropped = {}
+        self.stolen = 0
+
+        self.enabled = pygame.mixer.get_init() is not None
+        if self.enabled:
+            self.reserve_channels(category_channels)
+
+    def reserve_channels(self, category_channels):
+        """Reserva los primeros canales del mixer y los reparte por categoría."""
+        total = sum(category_channels.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        # Los canales reservados no los usa Sound.play() automático
+        pygame.mixer.set_reserved(total)
+
+        index = 0
+        for category, count in category_channels.items():
+            self.channels[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            for channel in self.channels[category]:
+                self.started[channel] = 0
+            index += count
+
+    def play(self, name):
+        """
+        Reproduce un sonido en un canal de su categoría.
+
+        Args:
+            name (str): Nombre del sonido en el cargador de assets
+
+        Returns:
+            pygame.mixer.Channel: Canal usado, o None si el sonido se descartó
+        """
+        if not self.enabled:
+            return None
+        now = self.clock()
+        last = self.last_played.get(name)
+        # Un reloj que volvió atrás (partida nueva o rebobinado) no bloquea
+        if last is not None and 0 <= now - last < self.retrigger_ms:
+            self.dropped[name] = self.dropped.get(name, 0) + 1
+            return None
+
+        sound = self.asset_loader.get_sound(name)
+        channels = self.channels.get(self.categories.get(name, DEFAULT_SOUND_CATEGORY))
+        if not sound or not channels:
+            return None
+
+        channel = self.find_channel(channels)
+        channel.play(sound)
+        self.started[channel] = now
+        self.last_played[name] = now
+        self.played[name] = self.played.get(name, 0) + 1
+        return channel
+
+    def find_channel(self, channels):
+        """Devuelve un canal libre de la lista o, si no hay, el de la voz más vieja."""
+        for channel in channels:
+            if not channel.get_busy():
+                return channel
+        self.stolen += 1
+        return min(channels, key=self.started.get)
+
+    def get_stats(self):
+        """
+        Obtiene los contadores de voces.
+
+        Returns:
+            dict: Voces reproducidas, descartadas por repetición y reemplazadas
+        """
+        return {
+            'played': sum(self.played.values()),
+            'dropped': sum(self.dropped.values()),
+            'stolen': self.stolen
+        }
+
+    def reset_stats(self):
+        """Pone a cero los contadores de voces."""
+        self.played.clear()
+        self.dropped.clear()
+        self.stolen = 0
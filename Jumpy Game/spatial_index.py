@@ -0,0 +1,128 @@
+"""
+Índice espacial por franjas verticales para Jumpy Game.
+
+SpatialGroup es un pygame.sprite.Group que además reparte sus sprites
+en franjas horizontales de alto fijo según su posición Y de mundo. Las
+consultas de colisión solo recorren las franjas que cubren la banda
+vertical pedida, en lugar de todo el grupo.
+
+El índice se mantiene solo al agregar y quitar sprites (incluido
+kill()), por eso asume que la Y de un sprite no cambia mientras está
+en el grupo. Si cambia, hay que llamar a reindex().
+"""
+
+import pygame
+from game_config import SPATIAL_BUCKET_HEIGHT
+
+
+class SpatialGroup(pygame.sprite.Group):
+    """Grupo de sprites con índice por franjas verticales."""
+
+    def __init__(self, *sprites, bucket_height=SPATIAL_BUCKET_HEIGHT):
+        """
+        Inicializa el grupo.
+
+        Args:
+            *sprites: Sprites iniciales
+            bucket_height (int): Alto en píxeles de cada franja
+        """
+        self.bucket_height = bucket_height
+        self._buckets = {}      # franja -> {sprite: None}, en orden de inserción
+        self._spans = {}        # sprite -> (primera franja, última franja)
+        self._sequence = {}     # sprite -> orden de inserción en el grupo
+        self._next_sequence = 0
+        super().__init__(*sprites)
+
+    def _span(self, rect):
+        """Devuelve las franjas que ocupa un rect."""
+        height = self.bucket_height
+        return rect.top // height, (rect.bottom - 1) // height
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._sequence[sprite] = self._next_sequence
+        self._next_sequence += 1
+        self._index(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._unindex(sprite)
+        del self._sequence[sprite]
+
+    def _index(self, sprite):
+        first, last = self._span(sprite.rect)
+        self._spans[sprite] = (first, last)
+        buckets = self._buckets
+        for key in range(first, last + 1):
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = {}
+            bucket[sprite] = None
+
+    def _unindex(self, sprite):
+        first, last = self._spans.pop(sprite)
+        buckets = self._buckets
+        for key in range(first, last + 1):
+            bucket = buckets[key]
+            del bucket[sprite]
+            if not bucket:
+                del buckets[key]
+
+    def reindex(self, sprite):
+        """Actualiza el índice tras un cambio de posición vertical del sprite."""
+        if self._spans.get(sprite) != self._span(sprite.rect):
+            self._unindex(sprite)
+            self._index(sprite)
+
+    def query(self, top, bottom):
+        """
+        Obtiene los sprites cuyo rect se cruza con una banda vertical.
+
+        Los resultados conservan el orden de inserción en el grupo, igual
+        que al iterar el grupo completo.
+
+        Args:
+            top (int): Y de mundo superior de la banda
+            bottom (int): Y de mundo inferior de la banda (exclusiva)
+
+        Returns:
+            list: Sprites dentro de la banda
+        """
+        height = self.bucket_height
+        buckets = self._buckets
+        first = top // height
+        last = (bottom - 1) // height
+
+        found = {}
+        for key in range(first, last + 1):
+            bucket = buckets.get(key)
+            if bucket:
+                for sprite in bucket:
+                    rect = sprite.rect
+                    if rect.bottom > top and rect.top < bottom:
+                        found[sprite] = None
+
+        if len(found) < 2:
+            return list(found)
+        return sorted(found, key=self._sequence.__getitem__)
+
+    def query_rect(self, rect):
+        """Obtiene los sprites de la banda vertical que cubre un rect."""
+        return self.query(rect.top, rect.bottom)
+
+    def cull_below(self, y):
+        """
+        Elimina (kill) los sprites cuyo borde superior está por debajo de y.
+
+        Args:
+            y (int): Y de mundo límite, normalmente el borde inferior de la cámara
+        """
+        first = y // self.bucket_height
+        keys = [key for key in self._buckets if key >= first]
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if not bucket:
+                continue
+            for sprite in list(bucket):
+                if sprite.rect.top > y:
+                    sprite.kill()
@@ -0,0 +1,55 @@
+"""
+Parámetros de generación de entidades para Jumpy Game.
+
+Agrupa en un objeto los límites y probabilidades con los que JumpyGame
+genera plataformas, power-ups y enemigos. Por defecto toma los valores de
+game_config.py; los escenarios de estrés crean sus propios SpawnSettings
+con miles de entidades sin tocar la configuración del juego.
+"""
+
+from game_config import (PLATFORM_CHUNK_SIZE, PLATFORM_GAP, MAX_ENEMIES, MAX_EXTRA_LIVES,
+                         BOOSTER_SPAWN_CHANCE, EXTRA_LIFE_SPAWN_CHANCE,
+                         MOVING_PLATFORMS_SCORE, BOOSTER_SCORE, ENEMY_SCORE)
+
+
+class SpawnSettings:
+    """Límites, tasas y requisitos de score de la generación de entidades."""
+
+    def __init__(self, platform_chunk=PLATFORM_CHUNK_SIZE, platform_gap=PLATFORM_GAP,
+                 max_enemies=MAX_ENEMIES, enemies_per_tick=1, enemy_band=0,
+                 max_extra_lives=MAX_EXTRA_LIVES,
+                 booster_chance=BOOSTER_SPAWN_CHANCE, extra_life_chance=EXTRA_LIFE_SPAWN_CHANCE,
+                 moving_platforms_score=MOVING_PLATFORMS_SCORE, booster_score=BOOSTER_SCORE,
+                 enemy_score=ENEMY_SCORE):
+        """
+        Inicializa los parámetros.
+
+        Args:
+            platform_chunk (int): Plataformas creadas juntas en cada bloque
+            platform_gap (tuple): Distancia vertical (mínima, máxima) entre plataformas
+            max_enemies (int): Enemigos simultáneos
+            enemies_per_tick (int): Enemigos nuevos como máximo por tick
+            enemy_band (int): Alto de la franja donde aparecen los enemigos
+                (0 = siempre a la misma altura de pantalla)
+            max_extra_lives (int): Vidas extra a menos de una pantalla entre sí
+            booster_chance (float): Probabilidad de booster por plataforma
+            extra_life_chance (float): Probabilidad de vida extra por plataforma
+            moving_platforms_score (int): Score desde el que hay plataformas móviles
+            booster_score (int): Score desde el que aparecen boosters
+            enemy_score (int): Score desde el que aparecen enemigos
+        """
+        self.platform_chunk = platform_chunk
+        self.platform_gap = platform_gap
+        self.max_enemies = max_enemies
+        self.enemies_per_tick = enemies_per_tick
+        self.enemy_band = enemy_band
+        self.max_extra_lives = max_extra_lives
+        self.booster_chance = booster_chance
+        self.extra_life_chance = extra_life_chance
+        self.moving_platforms_score = moving_platforms_score
+        self.booster_score = booster_score
+        self.enemy_score = enemy_score
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={value!r}' for name, value in vars(self).items())
+        return f'SpawnSettings({fields})'
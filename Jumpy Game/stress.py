@@ -0,0 +1,243 @@
+"""
+Escenarios de estrés de Jumpy Game.
+
+Genera mundos con cientos o decenas de miles de plataformas, enemigos y
+power-ups (sin tocar game_config.py) y los hace pasar por el mismo código
+de actualización, colisiones y, opcionalmente, dibujo que usa el juego.
+Informa ticks por segundo, entidades vivas y memoria para encontrar en
+qué escala deja de rendir el motor.
+
+Uso:
+    python stress.py --preset platforms --ticks 2000
+    python stress.py --preset all --sweep 1,10,100 --render
+    python stress.py --platforms 20000 --enemies 500 --trace-memory --json
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from jumpy_game import JumpyGame
+from input_source import RandomInput
+from spawn_settings import SpawnSettings
+from game_state import seed_argument
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Escenarios a escala 1; --scale multiplica límites y tasas.
+# Todos quitan los requisitos de score para que todo aparezca desde el inicio.
+PRESETS = {
+    'platforms': dict(platform_chunk=500, platform_gap=(2, 8)),
+    'enemies': dict(max_enemies=100, enemies_per_tick=2, enemy_band=400),
+    'powerups': dict(platform_chunk=200, platform_gap=(4, 12),
+                     booster_chance=1.0, extra_life_chance=1.0, max_extra_lives=100),
+    'all': dict(platform_chunk=500, platform_gap=(2, 8),
+                max_enemies=100, enemies_per_tick=2, enemy_band=400,
+                booster_chance=0.5, extra_life_chance=0.5, max_extra_lives=100),
+}
+
+# Campos que se multiplican con --scale
+SCALED_FIELDS = ('platform_chunk', 'max_enemies', 'enemies_per_tick', 'max_extra_lives')
+
+
+def build_settings(preset='all', scale=1, **overrides):
+    """
+    Crea los parámetros de generación de un escenario.
+
+    Args:
+        preset (str): Nombre del escenario base en PRESETS
+        scale (float): Factor para límites y tasas de generación
+        **overrides: Valores de SpawnSettings que reemplazan al escenario
+
+    Returns:
+        SpawnSettings: Parámetros listos para JumpyGame
+    """
+    values = dict(moving_platforms_score=0, booster_score=0, enemy_score=0)
+    values.update(PRESETS[preset])
+    for field in SCALED_FIELDS:
+        if field in values:
+            values[field] = max(1, int(values[field] * scale))
+    values.update({key: value for key, value in overrides.items() if value is not None})
+    return SpawnSettings(**values)
+
+
+def max_rss_mb():
+    """Memoria residente máxima del proceso en MB (None si no se puede medir)."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa KB y macOS bytes
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+class StressResult:
+    """Resultados de un escenario de estrés."""
+
+    def __init__(self, ticks, elapsed, restarts, peak_entities, final_entities,
+                 max_rss, traced_peak):
+        self.ticks = ticks
+        self.elapsed = elapsed
+        self.restarts = restarts
+        self.peak_entities = peak_entities
+        self.final_entities = final_entities
+        self.max_rss = max_rss
+        self.traced_peak = traced_peak
+
+    @property
+    def ticks_per_second(self):
+        """Ticks simulados por segundo de reloj."""
+        if self.elapsed <= 0:
+            return float('inf')
+        return self.ticks / self.elapsed
+
+    def to_dict(self):
+        """Resultados como diccionario serializable a JSON."""
+        return {
+            'ticks': self.ticks,
+            'elapsed_s': round(self.elapsed, 4),
+            'ticks_per_second': round(self.ticks_per_second, 1),
+            'ms_per_tick': round(self.elapsed * 1000 / self.ticks, 4) if self.ticks else 0.0,
+            'restarts': self.restarts,
+            'peak_entities': self.peak_entities,
+            'final_entities': self.final_entities,
+            'max_rss_mb': round(self.max_rss, 1) if self.max_rss is not None else None,
+            'traced_peak_mb': round(self.traced_peak, 2) if self.traced_peak is not None else None
+        }
+
+
+class StressTest:
+    """Ejecuta un escenario de estrés sobre un juego headless."""
+
+    def __init__(self, spawn, seed=0, render=False, god_mode=True, trace_memory=False):
+        """
+        Inicializa el escenario.
+
+        Args:
+            spawn (SpawnSettings): Límites y tasas de generación
+            seed (int): Semilla de la partida y de la entrada aleatoria
+            render (bool): Si es True cada tick también se dibuja
+            god_mode (bool): Si es True el jugador no pierde vidas, así la
+                partida no se reinicia y el mundo alcanza su tamaño máximo
+            trace_memory (bool): Medir el pico de memoria de Python con
+                tracemalloc (hace la simulación bastante más lenta)
+        """
+        self.game = JumpyGame(headless=True, input_source=RandomInput(seed), seed=seed,
+                              spawn=spawn)
+        self.game.game_state.waiting_for_start = False
+        self.game.god_mode = god_mode
+        self.render = render
+        self.trace_memory = trace_memory
+
+    def entity_counts(self):
+        """Entidades vivas por tipo."""
+        game = self.game
+        return {
+            'platforms': len(game.platform_group),
+            'enemies': len(game.enemy_group),
+            'boosters': len(game.booster_group),
+            'extra_lives': len(game.extra_life_group)
+        }
+
+    def run(self, ticks):
+        """
+        Ejecuta el escenario.
+
+        Args:
+            ticks (int): Ticks a simular
+
+        Returns:
+            StressResult: Resultados de la ejecución
+        """
+        game = self.game
+        groups = {'platforms': game.platform_group, 'enemies': game.enemy_group,
+                  'boosters': game.booster_group, 'extra_lives': game.extra_life_group}
+        peak = dict.fromkeys(groups, 0)
+        restarts = 0
+
+        if self.trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        for _ in range(ticks):
+            if game.game_state.game_over:
+                game.restart_game()
+                restarts += 1
+            game.update_game()
+            if self.render:
+                game.render_game()
+                game.renderer.present_frame()
+            for name, group in groups.items():
+                count = len(group)
+                if count > peak[name]:
+                    peak[name] = count
+        elapsed = time.perf_counter() - start
+
+        traced_peak = None
+        if self.trace_memory:
+            traced_peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+
+        return StressResult(ticks, elapsed, restarts, peak, self.entity_counts(),
+                            max_rss_mb(), traced_peak)
+
+
+def print_result(label, result):
+    """Muestra una línea de resultados legible."""
+    data = result.to_dict()
+    peak = data['peak_entities']
+    memory = f"{data['max_rss_mb']} MB RSS" if data['max_rss_mb'] is not None else 'RSS n/d'
+    if data['traced_peak_mb'] is not None:
+        memory += f", {data['traced_peak_mb']} MB Python"
+    print(f"{label:>10s}: {data['ticks_per_second']:10.1f} ticks/s "
+          f"({data['ms_per_tick']:.3f} ms/tick) | plataformas {peak['platforms']}, "
+          f"enemigos {peak['enemies']}, boosters {peak['boosters']}, "
+          f"vidas {peak['extra_lives']} | {memory} | reinicios {data['restarts']}")
+
+
+def main():
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description='Escenarios de estrés de Jumpy Game')
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='all', help='Escenario base')
+    parser.add_argument('--scale', type=float, default=1, help='Factor de límites y tasas de generación')
+    parser.add_argument('--sweep', metavar='ESCALAS',
+                        help='Lista de escalas separadas por comas (por ejemplo 1,10,100)')
+    parser.add_argument('--ticks', type=int, default=2000, help='Ticks por escenario')
+    parser.add_argument('--seed', type=seed_argument, default=0, help='Semilla de la partida')
+    parser.add_argument('--platforms', type=int, help='Plataformas creadas por bloque')
+    parser.add_argument('--enemies', type=int, help='Máximo de enemigos')
+    parser.add_argument('--enemies-per-tick', type=int, help='Enemigos nuevos por tick')
+    parser.add_argument('--extra-lives', type=int, help='Máximo de vidas extra por pantalla')
+    parser.add_argument('--booster-chance', type=float, help='Probabilidad de booster por plataforma')
+    parser.add_argument('--extra-life-chance', type=float, help='Probabilidad de vida extra por plataforma')
+    parser.add_argument('--render', action='store_true', help='Dibujar cada tick')
+    parser.add_argument('--mortal', action='store_true', help='El jugador pierde vidas (la partida se reinicia)')
+    parser.add_argument('--trace-memory', action='store_true', help='Medir memoria de Python con tracemalloc')
+    parser.add_argument('--json', action='store_true', help='Imprimir los resultados en JSON')
+    args = parser.parse_args()
+
+    overrides = dict(platform_chunk=args.platforms, max_enemies=args.enemies,
+                     enemies_per_tick=args.enemies_per_tick, max_extra_lives=args.extra_lives,
+                     booster_chance=args.booster_chance,
+                     extra_life_chance=args.extra_life_chance)
+    scales = [float(value) for value in args.sweep.split(',')] if args.sweep else [args.scale]
+
+    results = []
+    for scale in scales:
+        spawn = build_settings(args.preset, scale, **overrides)
+        test = StressTest(spawn, args.seed, args.render, not args.mortal, args.trace_memory)
+        result = test.run(args.ticks)
+        test.game.close()
+        results.append({'preset': args.preset, 'scale': scale, 'render': args.render,
+                        'spawn': vars(spawn), **result.to_dict()})
+        if not args.json:
+            print_result(f'x{scale:g}', result)
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Configuración común de las pruebas de Jumpy Game.
+
+Los módulos del juego se importan por nombre desde su carpeta, igual que
+al ejecutar jumpy_game.py, y pygame usa los drivers ficticios de SDL.
+"""
+
+import os
+import sys
+
+import pytest
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+sys.path.insert(0, GAME_DIR)
+
+# platform.py del juego tapa al módulo estándar, que pytest ya importó
+sys.modules.pop('platform', None)
+
+
+@pytest.fixture
+def new_game():
+    """Fábrica de juegos headless ya iniciados que se cierran al terminar la prueba."""
+    from jumpy_game import JumpyGame
+
+    games = []
+
+    def factory(**kwargs):
+        game = JumpyGame(headless=True, **kwargs)
+        game.game_state.waiting_for_start = False
+        games.append(game)
+        return game
+
+    yield factory
+    for game in games:
+        game.close()
@@ -0,0 +1,29 @@
+"""Utilidades compartidas por las pruebas de Jumpy Game."""
+
+from input_source import RandomInput
+from snapshot import WorldSnapshot
+
+
+def random_inputs(seed, ticks):
+    """Secuencia fija de entradas aleatorias sostenidas."""
+    source = RandomInput(seed)
+    return [source.poll() for _ in range(ticks)]
+
+
+def world(game):
+    """Estado completo de la simulación como valores comparables."""
+    snapshot = WorldSnapshot.capture(game)
+    return snapshot.ints.tolist(), snapshot.floats.tolist(), snapshot.rng_state
+
+
+def run(game, ticks):
+    """
+    Avanza el juego hasta ticks veces o hasta el game over.
+
+    Returns:
+        int: Ticks simulados
+    """
+    for tick in range(ticks):
+        if not game.step():
+            return tick + 1
+    return ticks
@@ -0,0 +1,46 @@
+"""Pruebas del alcance de salto y de la validación de plataformas."""
+
+import random
+
+import pytest
+
+from chunk_generator import PlatformChunkGenerator
+from game_config import PLATFORM_GAP
+from reachability import JumpEnvelope
+
+
+def test_static_layouts_are_all_reachable():
+    numpy = pytest.importorskip('numpy')
+    generator = PlatformChunkGenerator(PLATFORM_GAP, chunk_size=20000)
+    size = generator.chunk_size * 6 * 4
+    data = random.Random(0).getrandbits(size * 8).to_bytes(size, 'little')
+    xs, widths, gaps, _, _, _ = generator.decode_arrays(data)
+
+    valid = JumpEnvelope().validate_bulk(xs, widths, gaps, numpy.zeros(len(xs), dtype=bool))
+    assert int(len(valid) - valid.sum()) == 0
+
+
+def test_bulk_validation_matches_python_path():
+    numpy = pytest.importorskip('numpy')
+    generator = PlatformChunkGenerator((100, 200), chunk_size=2000)
+    size = generator.chunk_size * 6 * 4
+    data = random.Random(1).getrandbits(size * 8).to_bytes(size, 'little')
+    xs, widths, gaps, movable, _, _ = generator.decode_arrays(data)
+
+    envelope = JumpEnvelope()
+    vectorized = envelope.validate_bulk(xs, widths, gaps, movable)
+    python = envelope.validate_bulk(xs.tolist(), widths.tolist(), gaps.tolist(), movable.tolist())
+    assert vectorized.tolist() == python
+
+
+def test_generated_platforms_are_reachable(new_game):
+    game = new_game(seed=6)
+    envelope = game.jump_envelope
+    for _ in range(4):
+        game.generate_chunk()
+
+    platforms = game.platform_group.sprites()
+    for source, target in zip(platforms, platforms[1:]):
+        assert envelope.is_reachable(source.rect.x, source.rect.width, target.rect.x,
+                                     target.rect.width, source.rect.y - target.rect.y,
+                                     source.moving or target.moving)
@@ -0,0 +1,44 @@
+"""Pruebas de la grabación y reproducción de partidas."""
+
+import random
+
+import pytest
+
+from input_source import RandomInput
+from replay import ReplayPlayer, encode_replay, decode_replay, REPLAY_VERSION
+from helpers import world, run
+
+
+def test_encode_decode_round_trip():
+    rng = random.Random(8)
+    # Tramos largos para pasar del máximo de repeticiones por par
+    masks = bytearray()
+    for _ in range(40):
+        masks += bytes((rng.randrange(8),)) * rng.choice((1, 3, 70000))
+    seed, decoded = decode_replay(encode_replay(2 ** 63 - 1, masks))
+    assert seed == 2 ** 63 - 1
+    assert decoded == masks
+
+
+def test_decode_rejects_other_versions():
+    data = bytearray(encode_replay(1, b'\x01\x02'))
+    data[4] = REPLAY_VERSION - 1
+    with pytest.raises(ValueError):
+        decode_replay(bytes(data))
+
+
+def test_recorded_run_plays_back_identically(new_game, tmp_path):
+    path = str(tmp_path / 'partida.jrpl')
+    game = new_game(seed=3, input_source=RandomInput(3), record_path=path)
+    ticks = run(game, 3000)
+    game.save_replay()
+
+    player = ReplayPlayer.load(path)
+    assert player.seed == 3
+    assert len(player.masks) == ticks
+
+    replay = new_game(seed=player.seed, input_source=player)
+    run(replay, ticks)
+    assert player.finished
+    assert replay.game_state.score == game.game_state.score
+    assert world(replay) == world(game)